@@ -0,0 +1,306 @@
+import copy
+import os
+
+import numpy as np
+from scipy import sparse
+
+from job_store import requirement_tokens
+
+ANALYTICS_PATH = "processed_jobs.analytics.npz"
+# Bumped when the saved arrays or the tokenization change, so older files are rebuilt
+ANALYTICS_FORMAT = 3
+# Catalog columns with per-category skill frequency tables
+GROUP_COLUMNS = ('Location', 'Industry', 'Size', 'Role Level')
+
+
+def _top(counts, labels, n=None):
+    """``(label, count)`` pairs by descending count, ties in first-seen (id) order"""
+    ids = np.flatnonzero(counts)
+    order = ids[np.lexsort((ids, -counts[ids]))]
+    if n is not None:
+        order = order[:n]
+    return [(labels[i], int(counts[i])) for i in order]
+
+
+def _ranges(starts, ends):
+    """Concatenated ``arange(start, end)`` for every pair, without a Python loop"""
+    lengths = ends - starts
+    offsets = np.concatenate([[0], np.cumsum(lengths)])
+    return np.repeat(starts - offsets[:-1], lengths) + np.arange(offsets[-1])
+
+
+class MarketAnalytics:
+    """Market aggregates computed once per catalog and updated as postings are added
+
+    Holds the requirement frequencies over the whole catalog, one
+    category x requirement frequency table per GROUP_COLUMNS column, job
+    counts per category and the sorted filter domains. Requirements are the
+    ``Technical Skills`` and ``Tools`` tokens the result charts show.
+    Requirement and category ids are assigned in first-seen order, so counts
+    match ``Counter`` over the same jobs and ties come out in catalog order
+    (``Counter.most_common`` over the whole catalog). Queries covering
+    no filter or a single category filter are table lookups; anything else
+    aggregates the per-posting arrays over the filtered rows.
+    """
+
+    def __init__(self):
+        self.n_jobs = 0
+        # Rows still listed; a catalog delta clears the rows it deletes or replaces
+        self.live = np.zeros(0, dtype=bool)
+        self.requirements = []
+        self.requirement_ids = {}
+        self.skill_counts = np.zeros(0, dtype=np.int64)
+        # Per posting: requirement id and catalog row
+        self.posting_requirements = np.zeros(0, dtype=np.int32)
+        self.posting_rows = np.zeros(0, dtype=np.int32)
+        self.categories = {column: [] for column in GROUP_COLUMNS}
+        self.category_ids = {column: {} for column in GROUP_COLUMNS}
+        self.codes = {column: np.zeros(0, dtype=np.int32) for column in GROUP_COLUMNS}
+        self.group_sizes = {column: np.zeros(0, dtype=np.int64) for column in GROUP_COLUMNS}
+        self.group_counts = {
+            column: sparse.csr_matrix((0, 0), dtype=np.int64) for column in GROUP_COLUMNS
+        }
+
+    @classmethod
+    def from_catalog(cls, jobs_df):
+        analytics = cls()
+        analytics.add_jobs(jobs_df)
+        return analytics
+
+    @staticmethod
+    def _grow(array, size):
+        return np.pad(array, (0, size - len(array))) if size > len(array) else array
+
+    def _encode(self, jobs_df):
+        """Requirement ids, per-row posting counts and category codes of ``jobs_df``
+
+        Unseen requirements and categories are appended to the vocabularies.
+        """
+        requirement_ids = []
+        lengths = []
+        for technical_skills, tools in zip(jobs_df['Technical Skills'], jobs_df['Tools']):
+            tokens = requirement_tokens(technical_skills, tools)
+            for token in tokens:
+                if token not in self.requirement_ids:
+                    self.requirement_ids[token] = len(self.requirements)
+                    self.requirements.append(token)
+                requirement_ids.append(self.requirement_ids[token])
+            lengths.append(len(tokens))
+
+        codes = {}
+        for column in GROUP_COLUMNS:
+            category_ids = self.category_ids[column]
+            codes[column] = np.empty(len(jobs_df), dtype=np.int32)
+            # Same string domain as the sidebar filters
+            for i, value in enumerate(jobs_df[column].astype(str)):
+                if value not in category_ids:
+                    category_ids[value] = len(self.categories[column])
+                    self.categories[column].append(value)
+                codes[column][i] = category_ids[value]
+        return np.asarray(requirement_ids, dtype=np.int32), np.asarray(lengths, dtype=np.int64), codes
+
+    def add_jobs(self, jobs_df):
+        """Fold new postings (appended after the existing rows) into every table"""
+        first_row = self.n_jobs
+        requirement_ids, lengths, all_codes = self._encode(jobs_df)
+        new_rows = np.repeat(np.arange(len(lengths), dtype=np.int32), lengths)
+        n_requirements = len(self.requirements)
+
+        self.skill_counts = self._grow(self.skill_counts, n_requirements)
+        self.skill_counts += np.bincount(requirement_ids, minlength=n_requirements)
+        self.posting_requirements = np.concatenate([self.posting_requirements, requirement_ids])
+        self.posting_rows = np.concatenate([self.posting_rows, new_rows + first_row])
+
+        for column in GROUP_COLUMNS:
+            codes = all_codes[column]
+            self.codes[column] = np.concatenate([self.codes[column], codes])
+            n_categories = len(self.categories[column])
+            self.group_sizes[column] = self._grow(self.group_sizes[column], n_categories)
+            self.group_sizes[column] += np.bincount(codes, minlength=n_categories)
+
+            table = self.group_counts[column]
+            table.resize((n_categories, n_requirements))
+            delta = sparse.csr_matrix(
+                (np.ones(len(requirement_ids), dtype=np.int64), (codes[new_rows], requirement_ids)),
+                shape=(n_categories, n_requirements)
+            )
+            self.group_counts[column] = (table + delta).tocsr()
+        self.n_jobs += len(jobs_df)
+        self.live = np.concatenate([self.live, np.ones(len(jobs_df), dtype=bool)])
+
+    def merged(self, delta_df, live):
+        """New aggregates with ``delta_df``'s jobs appended and ``live`` as the mask of listed rows
+
+        The postings of rows cleared in ``live`` (deleted or replaced) are
+        subtracted from the tables and the delta's added, so only the delta
+        is tokenized; per-posting arrays are only appended to, the removed
+        rows staying behind as tombstones. These aggregates are left untouched.
+        """
+        analytics = copy.copy(self)
+        analytics.requirements = list(self.requirements)
+        analytics.requirement_ids = dict(self.requirement_ids)
+        analytics.categories = {column: list(values) for column, values in self.categories.items()}
+        analytics.category_ids = {column: dict(ids) for column, ids in self.category_ids.items()}
+        analytics.codes = dict(self.codes)
+
+        # Postings are stored row by row, so each removed row's postings are one range;
+        # rows take posting_rows' dtype or searchsorted would cast the whole array
+        removed = np.flatnonzero(self.live & ~live[:self.n_jobs]).astype(self.posting_rows.dtype)
+        removed_postings = _ranges(
+            np.searchsorted(self.posting_rows, removed, side='left'),
+            np.searchsorted(self.posting_rows, removed, side='right')
+        )
+        removed_requirements = self.posting_requirements[removed_postings]
+        n_requirements = len(self.requirements)
+        analytics.skill_counts = self.skill_counts - np.bincount(removed_requirements, minlength=n_requirements)
+        analytics.group_sizes, analytics.group_counts = {}, {}
+        for column in GROUP_COLUMNS:
+            codes = self.codes[column]
+            analytics.group_sizes[column] = self.group_sizes[column] - np.bincount(
+                codes[removed], minlength=len(self.categories[column])
+            )
+            table = self.group_counts[column] - sparse.csr_matrix(
+                (np.ones(len(removed_postings), dtype=np.int64),
+                 (codes[self.posting_rows[removed_postings]], removed_requirements)),
+                shape=self.group_counts[column].shape
+            )
+            table.eliminate_zeros()
+            analytics.group_counts[column] = table.tocsr()
+
+        analytics.add_jobs(delta_df)
+        analytics.live = live
+        return analytics
+
+    def subset(self, rows):
+        """New aggregates over ``rows`` of these jobs, in that order; compacts away removed rows
+
+        The tables already cover only the listed rows and are shared; the
+        per-row and per-posting arrays are gathered.
+        """
+        rows = np.asarray(rows, dtype=self.posting_rows.dtype)
+        analytics = copy.copy(self)
+        starts = np.searchsorted(self.posting_rows, rows, side='left')
+        ends = np.searchsorted(self.posting_rows, rows, side='right')
+        analytics.posting_requirements = self.posting_requirements[_ranges(starts, ends)]
+        analytics.posting_rows = np.repeat(np.arange(len(rows), dtype=np.int32), ends - starts)
+        analytics.codes = {column: codes[rows] for column, codes in self.codes.items()}
+        analytics.n_jobs = len(rows)
+        analytics.live = np.ones(len(rows), dtype=bool)
+        return analytics
+
+    def domain(self, column):
+        """Sorted distinct values of a filter column"""
+        sizes = self.group_sizes[column]
+        return sorted(value for value, size in zip(self.categories[column], sizes) if size > 0)
+
+    def _single_selection(self, selections, rows):
+        """``(column, category ids)`` when a lookup answers the query, else None
+
+        ``rows`` (the filtered catalog rows) tells whether filters outside
+        ``selections``, such as the experience bound, dropped any jobs.
+        """
+        active = {column: selected for column, selected in (selections or {}).items() if selected}
+        if len(active) > 1:
+            return None
+        if not active:
+            column, ids = None, None
+            expected = int(np.count_nonzero(self.live))
+        else:
+            column, selected = next(iter(active.items()))
+            ids = [self.category_ids[column][value] for value in selected if value in self.category_ids[column]]
+            expected = int(self.group_sizes[column][ids].sum())
+        if rows is not None and len(rows) != expected:
+            return None
+        return column, ids
+
+    def _row_mask(self, rows):
+        mask = np.zeros(self.n_jobs, dtype=bool)
+        mask[np.asarray(rows, dtype=np.int64)] = True
+        return mask
+
+    def top_skills(self, n=10, selections=None, rows=None):
+        """Most frequent requirements over the jobs passing the filters, as ``(skill, count)``
+
+        ``selections`` maps GROUP_COLUMNS columns to selected categories and
+        ``rows`` are the filtered catalog rows.
+        """
+        lookup = self._single_selection(selections, rows)
+        if lookup is not None:
+            column, ids = lookup
+            if column is None:
+                counts = self.skill_counts
+            else:
+                counts = np.asarray(self.group_counts[column][ids].sum(axis=0)).ravel()
+        else:
+            in_rows = self._row_mask(rows)[self.posting_rows]
+            counts = np.bincount(self.posting_requirements[in_rows], minlength=len(self.requirements))
+        return _top(counts, self.requirements, n)
+
+    def save(self, path, version):
+        """Write every table to an ``.npz`` file tagged with the catalog ``version``"""
+        arrays = {
+            'version': np.array(version),
+            'format': np.array(ANALYTICS_FORMAT),
+            'n_jobs': np.array(self.n_jobs),
+            'live': self.live,
+            'requirements': np.array(self.requirements, dtype=str),
+            'skill_counts': self.skill_counts,
+            'posting_requirements': self.posting_requirements,
+            'posting_rows': self.posting_rows,
+        }
+        for column in GROUP_COLUMNS:
+            table = self.group_counts[column]
+            arrays[f'{column}/categories'] = np.array(self.categories[column], dtype=str)
+            arrays[f'{column}/codes'] = self.codes[column]
+            arrays[f'{column}/sizes'] = self.group_sizes[column]
+            arrays[f'{column}/data'] = table.data
+            arrays[f'{column}/indices'] = table.indices
+            arrays[f'{column}/indptr'] = table.indptr
+        tmp_path = f"{path}.tmp.npz"
+        np.savez(tmp_path, **arrays)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def load(cls, path, version):
+        """Read tables saved by ``save``; None if missing or saved for another catalog version"""
+        if not os.path.exists(path):
+            return None
+        with np.load(path) as stored:
+            if 'format' not in stored.files or int(stored['format']) != ANALYTICS_FORMAT:
+                return None
+            if str(stored['version']) != version:
+                return None
+            analytics = cls()
+            analytics.n_jobs = int(stored['n_jobs'])
+            analytics.live = stored['live']
+            analytics.requirements = stored['requirements'].tolist()
+            analytics.requirement_ids = {token: i for i, token in enumerate(analytics.requirements)}
+            analytics.skill_counts = stored['skill_counts']
+            analytics.posting_requirements = stored['posting_requirements']
+            analytics.posting_rows = stored['posting_rows']
+            for column in GROUP_COLUMNS:
+                categories = stored[f'{column}/categories'].tolist()
+                analytics.categories[column] = categories
+                analytics.category_ids[column] = {value: i for i, value in enumerate(categories)}
+                analytics.codes[column] = stored[f'{column}/codes']
+                analytics.group_sizes[column] = stored[f'{column}/sizes']
+                analytics.group_counts[column] = sparse.csr_matrix(
+                    (stored[f'{column}/data'], stored[f'{column}/indices'], stored[f'{column}/indptr']),
+                    shape=(len(categories), len(analytics.requirements))
+                )
+        return analytics
+
+
+def load_analytics(jobs_df, version=None, path=ANALYTICS_PATH):
+    """Market analytics for a catalog, reused from ``path`` while the catalog ``version`` matches"""
+    if version is not None:
+        analytics = MarketAnalytics.load(path, version)
+        if analytics is not None and analytics.n_jobs == len(jobs_df):
+            return analytics
+    analytics = MarketAnalytics.from_catalog(jobs_df)
+    if version is not None:
+        try:
+            analytics.save(path, version)
+        except OSError:
+            pass  # read-only deployments just keep the in-memory tables
+    return analytics
@@ -0,0 +1,239 @@
+"""Headless batch matching of many resumes against the job catalog
+
+Usage:
+    python batch_match.py resumes/ --output results.jsonl
+    python batch_match.py manifest.txt --output results.parquet --workers 8 --llm-concurrency 16
+
+The input is a directory of PDFs or a manifest file listing one PDF path per
+line. Results are streamed as they are produced: JSONL is appended to, and a
+``.parquet`` output is a directory receiving one part file per chunk.
+Finished resumes are recorded in a checkpoint file so an interrupted run can
+be resumed by running the same command again. Resumes that fail to parse or
+extract go to a separate errors file (``<output>.errors.jsonl``) instead,
+one record per resume with its ``error``, and are not checkpointed: running
+the command again retries them, replacing their error record or, once they
+succeed, moving them to the output.
+"""
+import argparse
+import hashlib
+import json
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import pandas as pd
+from dotenv import load_dotenv
+
+from catalog import CATALOG_PATH, SOURCE_PATH, load_catalog
+from extraction import extract_skills, read_resume_text
+from matching import SkillIndex
+from ranking import rank_jobs
+
+# Per-process scoring state, set up once by _init_scorer
+_scorer = {}
+
+
+def list_resumes(source):
+    """PDF paths from a directory or a manifest file"""
+    if os.path.isdir(source):
+        return sorted(
+            os.path.join(source, name) for name in os.listdir(source)
+            if name.lower().endswith(".pdf")
+        )
+    base = os.path.dirname(os.path.abspath(source))
+    with open(source) as f:
+        paths = [line.strip() for line in f if line.strip() and not line.startswith("#")]
+    return [path if os.path.isabs(path) else os.path.join(base, path) for path in paths]
+
+
+def load_checkpoint(path):
+    """Set of resume paths already written by a previous run"""
+    if not os.path.exists(path):
+        return set()
+    with open(path) as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def load_errors(path):
+    """``{resume path: error record}`` of the resumes that failed in previous runs"""
+    if not os.path.exists(path):
+        return {}
+    with open(path) as f:
+        records = [json.loads(line) for line in f if line.strip()]
+    return {record["resume"]: record for record in records}
+
+
+def save_errors(path, errors):
+    """Rewrite the errors file (atomically) with one record per failing resume"""
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        for record in errors.values():
+            f.write(json.dumps(record) + "\n")
+    os.replace(tmp_path, path)
+
+
+def parse_resume(path):
+    """Read one PDF in a worker process; returns (path, sha256, text, error)"""
+    try:
+        with open(path, "rb") as f:
+            digest = hashlib.sha256(f.read()).hexdigest()
+        return path, digest, read_resume_text(path), None
+    except Exception as e:
+        return path, None, "", str(e)
+
+
+def extract_resume(text, api_key):
+    """LLM skills of one resume's text; returns (skills, error)"""
+    if not text:
+        return [], None
+    try:
+        return extract_skills(text, "llm", api_key=api_key), None
+    except Exception as e:
+        return [], f"{type(e).__name__}: {e}"
+
+
+def _init_scorer(source_path, catalog_path):
+    jobs_df = load_catalog(source_path, catalog_path)
+    _scorer["jobs"] = jobs_df[["Job Title", "Company Name", "Location"]].reset_index(drop=True)
+    _scorer["index"] = SkillIndex.from_catalog(jobs_df)
+
+
+def score_resume(skills, threshold, mode, n_results, min_score):
+    """Rank the catalog for one resume inside a scoring worker"""
+    index = _scorer["index"]
+    jobs = _scorer["jobs"]
+    resume_matches = index.match_vocabulary(skills, threshold, mode)
+    ranking = rank_jobs(index, range(len(index)), resume_matches, n_results, min_score, prune=True)
+    results = []
+    for row in ranking["rows"]:
+        score, matched, missing = index.match_job(row, resume_matches)
+        results.append({
+            "row": int(row),
+            "job_title": jobs.at[row, "Job Title"],
+            "company": jobs.at[row, "Company Name"],
+            "location": jobs.at[row, "Location"],
+            "score": round(float(score), 2),
+            "matched": matched,
+            "missing": missing,
+        })
+    return results
+
+
+def _score_task(args):
+    return score_resume(*args)
+
+
+class ResultWriter:
+    """Append results to JSONL, or to Parquet part files in a directory"""
+
+    def __init__(self, output):
+        self.output = output
+        self.parquet = output.endswith(".parquet")
+        if self.parquet:
+            os.makedirs(output, exist_ok=True)
+            self.part = len([n for n in os.listdir(output) if n.endswith(".parquet")])
+
+    def write(self, records):
+        if not records:
+            return
+        if self.parquet:
+            frame = pd.DataFrame(records)
+            frame["matches"] = frame["matches"].map(json.dumps)
+            frame.to_parquet(os.path.join(self.output, f"part-{self.part:05d}.parquet"), index=False)
+            self.part += 1
+        else:
+            with open(self.output, "a") as f:
+                for record in records:
+                    f.write(json.dumps(record) + "\n")
+
+
+def run(args):
+    api_key = os.getenv("OPENAI_API_KEY")
+    checkpoint_path = args.checkpoint or f"{args.output}.checkpoint"
+    errors_path = args.errors or f"{args.output}.errors.jsonl"
+    done = load_checkpoint(checkpoint_path)
+    errors = load_errors(errors_path)
+    pending = [path for path in list_resumes(args.input) if path not in done]
+    print(f"{len(pending)} resumes to process ({len(done)} already done)")
+
+    writer = ResultWriter(args.output)
+    timings = {"parse": 0.0, "extract": 0.0, "score": 0.0, "write": 0.0}
+    processed = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(args.workers) as parse_pool, \
+            ProcessPoolExecutor(args.workers, initializer=_init_scorer,
+                                initargs=(args.source, args.catalog)) as score_pool, \
+            ThreadPoolExecutor(args.llm_concurrency) as llm_pool:
+        for offset in range(0, len(pending), args.chunk_size):
+            chunk = pending[offset:offset + args.chunk_size]
+
+            stage = time.perf_counter()
+            parsed = list(parse_pool.map(parse_resume, chunk))
+            timings["parse"] += time.perf_counter() - stage
+
+            stage = time.perf_counter()
+            extracted = list(llm_pool.map(lambda item: extract_resume(item[2], api_key), parsed))
+            timings["extract"] += time.perf_counter() - stage
+
+            stage = time.perf_counter()
+            tasks = [(s, args.threshold, args.mode, args.top_n, args.min_score) for s, _ in extracted]
+            scored = list(score_pool.map(_score_task, tasks))
+            timings["score"] += time.perf_counter() - stage
+
+            stage = time.perf_counter()
+            records = [
+                {"resume": path, "sha256": digest, "error": parse_error or extract_error,
+                 "skills": resume_skills, "matches": matches}
+                for (path, digest, _, parse_error), (resume_skills, extract_error), matches
+                in zip(parsed, extracted, scored)
+            ]
+            finished = [record for record in records if record["error"] is None]
+            writer.write(finished)
+            # Failed resumes stay out of the checkpoint so that the next run retries them
+            with open(checkpoint_path, "a") as f:
+                f.writelines(f"{record['resume']}\n" for record in finished)
+            for record in records:
+                if record["error"] is None:
+                    errors.pop(record["resume"], None)
+                else:
+                    errors[record["resume"]] = record
+            if errors or os.path.exists(errors_path):
+                save_errors(errors_path, errors)
+            timings["write"] += time.perf_counter() - stage
+
+            processed += len(chunk)
+            elapsed = time.perf_counter() - start
+            print(f"  {processed}/{len(pending)} resumes, {processed / elapsed:.2f} resumes/sec")
+
+    elapsed = time.perf_counter() - start
+    print(f"Processed {processed} resumes in {elapsed:.2f}s "
+          f"({processed / elapsed if elapsed else 0:.2f} resumes/sec)")
+    if errors:
+        print(f"{len(errors)} resumes failed, see {errors_path}; run again to retry them")
+    for name, seconds in timings.items():
+        print(f"  {name:<8} {seconds:8.2f}s  {seconds / processed * 1000 if processed else 0:8.1f} ms/resume")
+    return timings
+
+
+def main():
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("input", help="directory of PDFs or manifest file")
+    parser.add_argument("--output", default="results.jsonl", help=".jsonl file or .parquet directory")
+    parser.add_argument("--checkpoint", help="defaults to <output>.checkpoint")
+    parser.add_argument("--errors", help="failed resumes, defaults to <output>.errors.jsonl")
+    parser.add_argument("--source", default=SOURCE_PATH)
+    parser.add_argument("--catalog", default=CATALOG_PATH)
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    parser.add_argument("--llm-concurrency", type=int, default=8)
+    parser.add_argument("--chunk-size", type=int, default=64)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--mode", choices=["compat", "tfidf"], default="compat")
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--min-score", type=float, default=30)
+    run(parser.parse_args())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Recruiter-mode benchmark: candidate pool build, incremental adds and job queries
+
+Usage:
+    python benchmarks/bench_candidates.py [--sizes 1000 10000 100000] [--jobs 50] [--top-n 20]
+
+Synthetic resumes are drawn from the real catalog's skill frequencies and
+queries use real catalog jobs (Technical Skills and Tools). A query is timed
+cold (first use of each requirement after the pool grew) and warm.
+"""
+import argparse
+import os
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from candidates import CandidatePool  # noqa: E402
+from catalog import load_catalog  # noqa: E402
+from matching import SKILL_FIELDS  # noqa: E402
+from synthetic import CatalogModel  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--jobs", type=int, default=50, help="catalog jobs queried per pool size")
+    parser.add_argument("--top-n", type=int, default=20)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--mode", default="compat", choices=["compat", "tfidf"])
+    args = parser.parse_args()
+
+    jobs_df = load_catalog()
+    model = CatalogModel(jobs_df)
+    rows = np.random.default_rng(0).choice(len(jobs_df), size=min(args.jobs, len(jobs_df)), replace=False)
+    queries = [
+        {field: list(jobs_df[column].iloc[row]) for field, column in SKILL_FIELDS.items()} for row in rows
+    ]
+    print(f"{'pool':>8} {'build s':>8} {'add ms':>7} {'cold ms':>8} {'warm ms':>8} {'p99 ms':>7}")
+
+    for size in args.sizes:
+        resumes = model.resumes(size + 1, seed=size)
+        with tempfile.TemporaryDirectory() as tmp:
+            pool = CandidatePool(os.path.join(tmp, "candidates.sqlite"))
+            start = time.perf_counter()
+            pool.add_many([(f"synthetic-{i}", f"Candidate {i}", skills) for i, skills in enumerate(resumes[:-1])])
+            build = time.perf_counter() - start
+
+            start = time.perf_counter()
+            pool.add(f"synthetic-{size}", f"Candidate {size}", resumes[-1])
+            add = time.perf_counter() - start
+
+            cold = []
+            for query in queries:
+                start = time.perf_counter()
+                pool.rank(query, args.threshold, args.mode, top_n=args.top_n)
+                cold.append(time.perf_counter() - start)
+            warm = []
+            for query in queries:
+                start = time.perf_counter()
+                pool.rank(query, args.threshold, args.mode, top_n=args.top_n)
+                warm.append(time.perf_counter() - start)
+
+        print(
+            f"{size:>8} {build:>8.2f} {add * 1000:>7.1f} {np.mean(cold) * 1000:>8.1f} "
+            f"{np.mean(warm) * 1000:>8.1f} {np.percentile(warm, 99) * 1000:>7.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Precision/recall and latency of the local skill extractor against LLM output
+
+Usage:
+    python benchmarks/bench_extractor.py [--sample 100] [--llm] [--concurrency 8]
+
+The extractor vocabulary is built from a training split of the catalog and
+evaluated on the job descriptions of a held-out split. By default the
+reference skills are the held-out jobs' own ``Technical Skills`` and
+``Tools`` columns. With ``--llm`` the
+reference is a live completion for each description instead (set
+OPENAI_BASE_URL to use llm_stub.py), and LLM latency is reported next to the
+local extractor's.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import load_catalog  # noqa: E402
+from llm_client import AsyncLLMClient  # noqa: E402
+from local_extractor import SkillExtractor  # noqa: E402
+from matching import normalize_skills  # noqa: E402
+
+
+async def llm_references(texts, concurrency):
+    from extraction import REQUIREMENTS_PROMPT, parse_requirements_response
+
+    async def one(client, text):
+        start = time.perf_counter()
+        content = await client.complete(REQUIREMENTS_PROMPT.format(text=text), max_tokens=300)
+        return parse_requirements_response(content), time.perf_counter() - start
+
+    async with AsyncLLMClient(max_concurrency=concurrency, requests_per_second=concurrency * 2) as client:
+        return await asyncio.gather(*(one(client, text) for text in texts))
+
+
+def score(predicted, reference):
+    """Micro-averaged precision, recall and F1 over normalized skill sets"""
+    true_pos = n_pred = n_ref = 0
+    for pred, ref in zip(predicted, reference):
+        pred, ref = set(normalize_skills(pred)), set(normalize_skills(ref))
+        true_pos += len(pred & ref)
+        n_pred += len(pred)
+        n_ref += len(ref)
+    precision = true_pos / n_pred if n_pred else 0.0
+    recall = true_pos / n_ref if n_ref else 0.0
+    f1 = 2 * precision * recall / (precision + recall) if precision + recall else 0.0
+    return precision, recall, f1
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sample", type=int, default=100, help="held-out jobs to evaluate")
+    parser.add_argument("--llm", action="store_true", help="use live LLM output as the reference")
+    parser.add_argument("--concurrency", type=int, default=8)
+    args = parser.parse_args()
+
+    jobs_df = load_catalog().sample(frac=1.0, random_state=0).reset_index(drop=True)
+    test_df = jobs_df.iloc[:args.sample]
+    train_df = jobs_df.iloc[args.sample:]
+
+    start = time.perf_counter()
+    extractor = SkillExtractor.from_catalog(train_df)
+    build_time = time.perf_counter() - start
+    print(f"automaton: {len(extractor.patterns)} skills, {len(extractor.goto)} states, built in {build_time * 1000:.0f} ms")
+
+    texts = test_df["Job Description"].tolist()
+    local_latencies = []
+    predicted = []
+    for text in texts:
+        start = time.perf_counter()
+        predicted.append(extractor.extract(text))
+        local_latencies.append(time.perf_counter() - start)
+
+    if args.llm:
+        results = asyncio.run(llm_references(texts, args.concurrency))
+        reference = [skills for skills, _ in results]
+        llm_latencies = [elapsed for _, elapsed in results]
+        source = "live LLM"
+    else:
+        reference = [skills + tools for skills, tools in zip(test_df["skills_list"], test_df["tools_list"])]
+        llm_latencies = None
+        source = "catalog Technical Skills + Tools"
+
+    precision, recall, f1 = score(predicted, reference)
+    print(f"reference: {source}, {len(texts)} held-out job descriptions")
+    print(f"precision {precision:.3f}  recall {recall:.3f}  f1 {f1:.3f}")
+    print(f"local latency  p50 {statistics.median(local_latencies) * 1000:8.2f} ms  "
+          f"max {max(local_latencies) * 1000:8.2f} ms")
+    if llm_latencies:
+        print(f"LLM latency    p50 {statistics.median(llm_latencies) * 1000:8.2f} ms  "
+              f"max {max(llm_latencies) * 1000:8.2f} ms")
+        print(f"speedup (p50): {statistics.median(llm_latencies) / statistics.median(local_latencies):.0f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""Compare the vectorized fuzzy matcher against the classic calculate_match loop
+
+Usage:
+    python benchmarks/bench_fuzzy.py [--resumes 20] [--skills 15] [--thresholds 0.5 0.8 1.0]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from jam import calculate_match  # noqa: E402
+from matching import SkillIndex  # noqa: E402
+
+
+def sample_resumes(index, n_resumes, n_skills, seed=0):
+    """Draw resume skill lists from the catalog vocabulary plus a few near-misses"""
+    rng = random.Random(seed)
+    extras = ['Python', 'database', 'ML', 'Tableau', 'Excel', 'Powerbi', 'Scikit learn']
+    resumes = []
+    for _ in range(n_resumes):
+        skills = rng.sample(index.vocabulary, min(n_skills, len(index.vocabulary)))
+        skills += rng.sample(extras, 3)
+        resumes.append(skills)
+    return resumes
+
+
+def run_reference(jobs_df, resume, threshold):
+    results = []
+    for tech_skills in jobs_df['Technical Skills']:
+        results.append(calculate_match({'Technical Skills': tech_skills}, resume, threshold))
+    return results
+
+
+def run_engine(index, resume, threshold, mode):
+    # A fresh matcher per run so the memo does not hide the matching cost
+    index._matchers.pop(mode, None)
+    resume_matches = index.match_vocabulary(resume, threshold, mode)
+    scores = index.score_all(resume_matches)
+    return [
+        index.match_job(row, resume_matches) if scores[row] > 0 else (0, [], index.job_skills(row))
+        for row in range(len(index))
+    ]
+
+
+def compare(reference, results):
+    """Return (rows with identical output, mean Jaccard of matched sets)"""
+    identical = 0
+    jaccard = 0.0
+    for (ref_score, ref_matched, _), (score, matched, _) in zip(reference, results):
+        identical += abs(ref_score - score) < 1e-9 and ref_matched == matched
+        union = set(ref_matched) | set(matched)
+        jaccard += len(set(ref_matched) & set(matched)) / len(union) if union else 1.0
+    return identical, jaccard / len(reference)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--catalog', default='processed_jobs.xlsx')
+    parser.add_argument('--resumes', type=int, default=20)
+    parser.add_argument('--skills', type=int, default=15)
+    parser.add_argument('--thresholds', type=float, nargs='+', default=[0.5, 0.8, 1.0])
+    args = parser.parse_args()
+
+    jobs_df = pd.read_excel(args.catalog)
+    index = SkillIndex.from_frame(jobs_df)
+    resumes = sample_resumes(index, args.resumes, args.skills)
+    print(f"{len(index)} jobs, {len(index.vocabulary)} unique skills, {len(resumes)} resumes")
+
+    header = f"{'threshold':>9} {'engine':>10} {'seconds':>9} {'speedup':>8} {'identical':>10} {'jaccard':>8}"
+    print(header)
+    print('-' * len(header))
+    for threshold in args.thresholds:
+        start = time.perf_counter()
+        references = [run_reference(jobs_df, resume, threshold) for resume in resumes]
+        ref_time = time.perf_counter() - start
+        print(f"{threshold:>9.2f} {'classic':>10} {ref_time:>9.3f} {1.0:>8.1f} {'-':>10} {'-':>8}")
+
+        for mode in ('compat', 'tfidf'):
+            start = time.perf_counter()
+            outputs = [run_engine(index, resume, threshold, mode) for resume in resumes]
+            elapsed = time.perf_counter() - start
+
+            identical = 0
+            jaccard = 0.0
+            for reference, results in zip(references, outputs):
+                same, overlap = compare(reference, results)
+                identical += same
+                jaccard += overlap
+            total_rows = len(index) * len(resumes)
+            print(f"{threshold:>9.2f} {mode:>10} {elapsed:>9.3f} {ref_time / elapsed:>8.1f} "
+                  f"{identical / total_rows:>9.1%} {jaccard / len(resumes):>8.3f}")
+
+
+if __name__ == '__main__':
+    main()
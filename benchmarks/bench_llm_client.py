@@ -0,0 +1,68 @@
+"""Measure AsyncLLMClient latency and throughput against the local LLM stub
+
+Usage:
+    python benchmarks/bench_llm_client.py [--requests 200] [--latency 0.2] [--concurrency 1 4 16 64]
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import time
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_client import AsyncLLMClient  # noqa: E402
+from llm_stub import create_app  # noqa: E402
+
+PROMPT = "Extract the skills.\n\nResume text:\nPython, SQL and Tableau for reporting; some Spark on AWS. #{}"
+
+
+async def timed(client, prompt):
+    start = time.perf_counter()
+    await client.complete(prompt)
+    return time.perf_counter() - start
+
+
+async def run(args):
+    app = create_app(args.latency, args.fail_every)
+    runner = web.AppRunner(app)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    base_url = f"http://127.0.0.1:{port}/v1"
+
+    print(f"stub latency {args.latency * 1000:.0f} ms, {args.requests} requests, fail every {args.fail_every or '-'}")
+    print(f"{'concurrency':>11} {'seconds':>8} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'retries':>8}")
+    try:
+        for concurrency in args.concurrency:
+            async with AsyncLLMClient("stub", base_url, max_concurrency=concurrency,
+                                      requests_per_second=args.rate, backoff=0.05) as client:
+                start = time.perf_counter()
+                latencies = await asyncio.gather(
+                    *(timed(client, PROMPT.format(i)) for i in range(args.requests))
+                )
+                elapsed = time.perf_counter() - start
+            latencies.sort()
+            p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+            print(f"{concurrency:>11} {elapsed:>8.2f} {args.requests / elapsed:>8.1f} "
+                  f"{statistics.median(latencies) * 1000:>8.0f} {p99 * 1000:>8.0f} {client.usage['retries']:>8}")
+    finally:
+        await runner.cleanup()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.2)
+    parser.add_argument("--fail-every", type=int, default=0)
+    parser.add_argument("--rate", type=float, default=1000.0, help="token bucket requests/sec")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 64])
+    asyncio.run(run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
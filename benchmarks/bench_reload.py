@@ -0,0 +1,106 @@
+"""Hot-reload benchmark: applying a catalog delta versus rebuilding every structure
+
+Usage:
+    python benchmarks/bench_reload.py [--sizes 10000 100000 1000000] [--deltas 10 100 1000 10000]
+
+Synthetic catalogs are drawn from the real catalog's skill frequencies. Each
+delta mixes updates of existing postings (new skill and tool lists), appends
+and deletes; the snapshot it produces is checked against a full build of the
+same listed jobs, before and after compacting away its tombstones, before
+the two are compared.
+"""
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import JOB_ID_COLUMN, assign_job_ids  # noqa: E402
+from hot_reload import CatalogSnapshot  # noqa: E402
+from synthetic import CatalogModel  # noqa: E402
+
+
+def delta_records(model, jobs_df, n_records, seed=0):
+    """Half updates, a third appends and the rest deletes of distinct postings"""
+    rng = np.random.default_rng(seed)
+    n_updates, n_appends = n_records // 2, n_records // 3
+    n_deletes = n_records - n_updates - n_appends
+    rows = rng.choice(len(jobs_df), size=n_updates + n_deletes, replace=False)
+    fresh = model.catalog(n_updates + n_appends, seed=seed + 1)
+    job_ids = jobs_df[JOB_ID_COLUMN].to_numpy()
+
+    records = []
+    for i, row in enumerate(rows[:n_updates]):
+        records.append({
+            "op": "update",
+            JOB_ID_COLUMN: job_ids[row],
+            "Technical Skills": fresh["Technical Skills"].iloc[i],
+            "Tools": fresh["Tools"].iloc[i],
+        })
+    columns = ["Job Title", "Company Name", "Technical Skills", "Tools", "Experience Required",
+               "Role Level", "Location", "Size", "Industry"]
+    for i in range(n_updates, n_updates + n_appends):
+        records.append({
+            "op": "append",
+            JOB_ID_COLUMN: f"new-{i}",
+            **{column: fresh[column].iloc[i] for column in columns if column in fresh},
+        })
+    for row in rows[n_updates:]:
+        records.append({"op": "delete", JOB_ID_COLUMN: job_ids[row]})
+    return records
+
+
+def check_equal(applied, built, resume_skills):
+    """Assert that an applied snapshot answers like a fresh build of its listed jobs"""
+    rows = np.flatnonzero(applied.live)
+    job_ids = built.jobs_df[JOB_ID_COLUMN].tolist()
+    assert applied.jobs_df[JOB_ID_COLUMN].iloc[rows].tolist() == job_ids
+    assert np.array_equal(applied.job_ids.rows(job_ids, applied.live), rows)
+    # The applied vocabulary keeps skills no longer required, so each index matches its own
+    scores = [
+        snapshot.skill_index.score_all(snapshot.skill_index.match_vocabulary(resume_skills))
+        for snapshot in (applied, built)
+    ]
+    assert np.allclose(scores[0][rows], scores[1])
+    assert np.array_equal(applied.job_filter.rows(max_exp=5), rows[built.job_filter.rows(max_exp=5)])
+    assert applied.analytics.top_skills(20) == built.analytics.top_skills(20)
+    for row in range(0, len(built), max(1, len(built) // 100)):
+        assert applied.job_store.requirement_names(applied.job_store.requirement_ids(rows[row])) == \
+            built.job_store.requirement_names(built.job_store.requirement_ids(row))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 1_000_000])
+    parser.add_argument("--deltas", type=int, nargs="+", default=[10, 100, 1_000, 10_000])
+    parser.add_argument("--no-check", action="store_true", help="skip the equivalence check")
+    args = parser.parse_args()
+
+    model = CatalogModel()
+    resume_skills = model.resumes(1)[0]
+    print(f"{'jobs':>9} {'delta':>6} {'build s':>8} {'apply ms':>9} {'speedup':>8} {'MiB':>7}")
+    for size in args.sizes:
+        base = CatalogSnapshot.build(assign_job_ids(model.catalog(size, seed=size)))
+        for n_records in args.deltas:
+            records = delta_records(model, base.jobs_df, min(n_records, size), seed=n_records)
+            start = time.perf_counter()
+            applied = base.apply(records)
+            apply_seconds = time.perf_counter() - start
+
+            start = time.perf_counter()
+            built = CatalogSnapshot.build(applied.jobs_df[applied.live].reset_index(drop=True))
+            build_seconds = time.perf_counter() - start
+            if not args.no_check:
+                check_equal(applied, built, resume_skills)
+                check_equal(applied.compacted(), built, resume_skills)
+            print(
+                f"{size:>9} {n_records:>6} {build_seconds:>8.2f} {apply_seconds * 1000:>9.1f} "
+                f"{build_seconds / apply_seconds:>7.1f}x {applied.stats['bytes'] / 2 ** 20:>7.1f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
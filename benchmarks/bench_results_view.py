@@ -0,0 +1,150 @@
+"""Payload size and render time of the results view: expander per job versus paged table
+
+Usage:
+    python benchmarks/bench_results_view.py [--results 10 50 100 500] [--repeat 5]
+
+The top jobs for a synthetic resume are rendered through Streamlit's AppTest
+harness twice: as the previous view (one expander per job with every record
+materialized) and as the current one (one summary table for the first page
+plus the details of a single selected job). Payload is the serialized size of
+the elements the script sends to the browser.
+"""
+import argparse
+import os
+import statistics
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from streamlit.testing.v1 import AppTest  # noqa: E402
+
+from catalog import assign_job_ids, load_catalog  # noqa: E402
+from hot_reload import CatalogSnapshot  # noqa: E402
+from matching import FIELD_WEIGHTS  # noqa: E402
+from ranking import rank_jobs  # noqa: E402
+from synthetic import CatalogModel  # noqa: E402
+
+
+def expander_view(snapshot, rows, resume_matches, field_weights):
+    """The results section as it was rendered before the paged table"""
+    import pandas as pd
+    import streamlit as st
+
+    skill_index, job_store = snapshot.skill_index, snapshot.job_store
+    matches = [
+        job_store.record(
+            row,
+            *skill_index.match_job(row, resume_matches, field_weights),
+            breakdown=skill_index.match_breakdown(row, resume_matches)
+        )
+        for row in rows
+    ]
+    st.header(f"Found {len(matches)} Matching Jobs")
+    for match in matches:
+        with st.expander(f"🎯 {match.score:.1f}% Match - {match.title} at {match.company}"):
+            st.markdown("""---""")
+            st.markdown("### Job Overview")
+            cols = st.columns([2, 1])
+            with cols[0]:
+                st.markdown("**Job Description**")
+                st.toggle("Show description", key=f"description_{match.row}")
+            with cols[1]:
+                st.markdown("**Company Details**")
+                st.write(f"📍 Location: {match.location}")
+                st.write(f"💼 Role Level: {match.role_level}")
+                st.write(f"⏳ Experience: {match.experience}")
+                if pd.notna(match.salary):
+                    st.write(f"💰 Salary: {match.salary}")
+                st.write(f"🏢 Company Size: {match.size}")
+                st.write(f"🏭 Industry: {match.industry}")
+            st.markdown("""---""")
+            st.markdown("### Skills Analysis")
+            st.write(" · ".join(
+                f"{field}: {field_score:.1f}% (weight {field_weights[field]:g})"
+                for field, (field_score, _, _) in match.breakdown.items()
+            ))
+            skill_cols = st.columns(2)
+            with skill_cols[0]:
+                st.markdown("**✅ Matched Requirements**")
+                for skill in match.matched:
+                    st.markdown(f"- {skill}")
+            with skill_cols[1]:
+                if match.missing:
+                    st.markdown("**🎯 Skills to Develop**")
+                    for skill in match.missing:
+                        st.markdown(f"- {skill}")
+            st.markdown("""---""")
+            progress_cols = st.columns([3, 1])
+            with progress_cols[0]:
+                st.progress(match.score / 100)
+            with progress_cols[1]:
+                st.write(f"**{match.score:.1f}%** match")
+
+
+def table_view(snapshot, rows, resume_matches, field_weights):
+    """The current results section: first page as a table and one selected job's details"""
+    import streamlit as st
+
+    from jam import RESULTS_PAGE_SIZE, display_match_details, display_match_results
+
+    skill_index, job_store = snapshot.skill_index, snapshot.job_store
+    st.header(f"Found {len(rows)} Matching Jobs")
+    page_rows = rows[:RESULTS_PAGE_SIZE]
+    scores = skill_index.score_rows(page_rows, resume_matches, field_weights)
+    display_match_results(job_store, page_rows, scores)
+    row = int(page_rows[0])
+    match = job_store.record(
+        row,
+        *skill_index.match_job(row, resume_matches, field_weights),
+        breakdown=skill_index.match_breakdown(row, resume_matches)
+    )
+    display_match_details(match, job_store, field_weights)
+
+
+def payload_bytes(node):
+    """Serialized size of every element and block under an AppTest tree node"""
+    proto = getattr(node, "proto", None)
+    size = proto.ByteSize() if proto is not None else 0
+    return size + sum(payload_bytes(child) for child in getattr(node, "children", {}).values())
+
+
+def measure(view, args, repeat):
+    at = AppTest.from_function(view, args=args, default_timeout=300)
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        at.run()
+        times.append(time.perf_counter() - start)
+    if at.exception:
+        raise RuntimeError(at.exception[0].message)
+    return payload_bytes(at._tree), statistics.median(times)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--results", type=int, nargs="+", default=[10, 50, 100, 500])
+    parser.add_argument("--jobs", type=int, default=0, help="synthetic catalog size (default: the real catalog)")
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    jobs_df = load_catalog()
+    model = CatalogModel(jobs_df)
+    if args.jobs:
+        jobs_df = assign_job_ids(model.catalog(args.jobs))
+    snapshot = CatalogSnapshot.build(jobs_df)
+    resume_matches = snapshot.skill_index.match_vocabulary(model.resumes(1, n_skills=25)[0], 0.8)
+    weights = dict(FIELD_WEIGHTS)
+
+    print(f"{'results':>7} {'view':>9} {'payload KiB':>12} {'render ms':>10}")
+    for n_results in args.results:
+        ranking = rank_jobs(snapshot.skill_index, range(len(snapshot)), resume_matches, n_results,
+                            weights=weights)
+        view_args = (snapshot, ranking['rows'], resume_matches, weights)
+        for name, view in (("expanders", expander_view), ("table", table_view)):
+            payload, seconds = measure(view, view_args, args.repeat)
+            print(f"{len(ranking['rows']):>7} {name:>9} {payload / 1024:>12.1f} {seconds * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+"""Load test of the /match service: latency percentiles and throughput under concurrency
+
+Usage:
+    python benchmarks/bench_service.py [--concurrency 1 8 32 64] [--requests 500] [--windows 0 0.005]
+    python benchmarks/bench_service.py --url http://127.0.0.1:8000 [--concurrency ...]
+
+Without ``--url`` the script starts llm_stub.py and one service.py instance
+per batching window, with the service's OPENAI_BASE_URL pointing at the
+stub, the LLM cache bypassed and the client's rate limit lifted, so every
+request that asks for LLM extraction pays the stub's latency. Requests carry synthetic resumes drawn
+from the real catalog's skill frequencies: a share of them (``--llm-share``)
+send resume text for LLM extraction and the rest send skill lists.
+"""
+import argparse
+import asyncio
+import os
+import socket
+import subprocess
+import sys
+import time
+
+import aiohttp
+import numpy as np
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from synthetic import CatalogModel  # noqa: E402
+
+
+def free_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+async def wait_ready(url, timeout=300):
+    """Poll /health until the service has its catalog loaded"""
+    deadline = time.monotonic() + timeout
+    async with aiohttp.ClientSession() as session:
+        while time.monotonic() < deadline:
+            try:
+                async with session.get(f"{url}/health") as response:
+                    if response.status == 200 and (await response.json())["status"] == "ok":
+                        return
+            except aiohttp.ClientError:
+                pass
+            await asyncio.sleep(0.25)
+    raise RuntimeError(f"service at {url} did not start")
+
+
+def payloads(n_requests, llm_share, top_n, seed=0):
+    """Request bodies: resume text for LLM extraction or a ready skills list"""
+    rng = np.random.default_rng(seed)
+    resumes = CatalogModel().resumes(n_requests, seed=seed)
+    bodies = []
+    for skills in resumes:
+        if rng.random() < llm_share:
+            bodies.append({"text": "Experienced analyst. Skills: " + ", ".join(skills), "extraction": "llm",
+                           "top_n": top_n})
+        else:
+            bodies.append({"skills": skills, "top_n": top_n})
+    return bodies
+
+
+async def load_test(url, bodies, concurrency):
+    """Send ``bodies`` with ``concurrency`` requests in flight; returns latencies, errors and seconds"""
+    queue = list(reversed(bodies))
+    latencies, errors = [], 0
+
+    async def worker(session):
+        nonlocal errors
+        while queue:
+            body = queue.pop()
+            start = time.perf_counter()
+            async with session.post(f"{url}/match", json=body) as response:
+                await response.read()
+                if response.status != 200:
+                    errors += 1
+            latencies.append(time.perf_counter() - start)
+
+    connector = aiohttp.TCPConnector(limit=concurrency)
+    async with aiohttp.ClientSession(connector=connector) as session:
+        start = time.perf_counter()
+        await asyncio.gather(*(worker(session) for _ in range(concurrency)))
+        return latencies, errors, time.perf_counter() - start
+
+
+async def batching_stats(url):
+    async with aiohttp.ClientSession() as session:
+        async with session.get(f"{url}/health") as response:
+            return (await response.json())["batching"]
+
+
+async def run_against(url, label, args, bodies):
+    await wait_ready(url)
+    # Warm the matchers and the extraction path before timing
+    await load_test(url, bodies[:args.concurrency[-1]], args.concurrency[-1])
+    for concurrency in args.concurrency:
+        before = await batching_stats(url)
+        latencies, errors, seconds = await load_test(url, bodies, concurrency)
+        after = await batching_stats(url)
+        batches = after["batches"] - before["batches"]
+        mean_batch = (after["requests"] - before["requests"]) / batches if batches else 0
+        print(
+            f"{label:>8} {concurrency:>5} {len(latencies) / seconds:>8.1f} "
+            f"{np.percentile(latencies, 50) * 1000:>8.1f} {np.percentile(latencies, 99) * 1000:>8.1f} "
+            f"{mean_batch:>6.1f} {errors:>6}"
+        )
+
+
+def start(command, env):
+    return subprocess.Popen(command, cwd=ROOT, env=env, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--url", help="test a running service instead of starting one")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 64])
+    parser.add_argument("--requests", type=int, default=500, help="requests per concurrency level")
+    parser.add_argument("--windows", type=float, nargs="+", default=[0, 0.005],
+                        help="batching windows (seconds) to compare when starting the service")
+    parser.add_argument("--llm-share", type=float, default=0.2, help="share of requests using LLM extraction")
+    parser.add_argument("--llm-latency", type=float, default=0.05, help="stub seconds per completion")
+    parser.add_argument("--top-n", type=int, default=10)
+    args = parser.parse_args()
+
+    bodies = payloads(args.requests, args.llm_share, args.top_n)
+    print(f"{'window':>8} {'conc':>5} {'req/s':>8} {'p50 ms':>8} {'p99 ms':>8} {'batch':>6} {'errors':>6}")
+    if args.url:
+        asyncio.run(run_against(args.url.rstrip("/"), "running", args, bodies))
+        return
+
+    stub_port = free_port()
+    env = {
+        **os.environ,
+        "OPENAI_BASE_URL": f"http://127.0.0.1:{stub_port}/v1",
+        "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", "stub"),
+        "LLM_CACHE_BYPASS": "1",
+        "CATALOG_WATCH_INTERVAL": "0",
+        # The stub has no rate limit; let the client pacing follow the offered load
+        "SERVICE_LLM_CONCURRENCY": str(max(args.concurrency)),
+        "SERVICE_LLM_RPS": "1000",
+    }
+    stub = start([sys.executable, "llm_stub.py", "--port", str(stub_port), "--latency", str(args.llm_latency)],
+                 env)
+    try:
+        for window in args.windows:
+            port = free_port()
+            service = start([sys.executable, "service.py", "--port", str(port), "--batch-window", str(window)], env)
+            try:
+                asyncio.run(run_against(f"http://127.0.0.1:{port}", f"{window * 1000:g}ms", args, bodies))
+            finally:
+                service.terminate()
+                service.wait()
+    finally:
+        stub.terminate()
+        stub.wait()
+
+
+if __name__ == "__main__":
+    main()
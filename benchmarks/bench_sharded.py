@@ -0,0 +1,76 @@
+"""Scaling benchmark for the sharded multi-process scoring backend
+
+Usage:
+    python benchmarks/bench_sharded.py [--sizes 100000 1000000] [--workers 1 2 4 8] [--queries 5]
+
+Synthetic catalogs are drawn from the real catalog's skill frequencies and
+requirement counts. Every configuration is checked against the serial
+SkillIndex path before it is timed.
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import load_catalog  # noqa: E402
+from matching import SkillIndex  # noqa: E402
+from ranking import rank_jobs  # noqa: E402
+from sharded import ShardedScorer  # noqa: E402
+from synthetic import synthetic_index  # noqa: E402
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[100_000, 1_000_000])
+    parser.add_argument("--workers", type=int, nargs="+", default=[1, 2, 4, 8])
+    parser.add_argument("--queries", type=int, default=5)
+    parser.add_argument("--top-n", type=int, default=100)
+    parser.add_argument("--min-score", type=float, default=30)
+    args = parser.parse_args()
+
+    base = SkillIndex.from_skill_lists(load_catalog()["skills_list"])
+    rng = random.Random(0)
+    resumes = [rng.sample(base.vocabulary, 15) + ["python", "sql"] for _ in range(args.queries)]
+    print(f"{os.cpu_count()} CPUs, {args.queries} resumes per configuration")
+    print(f"{'jobs':>10} {'backend':>10} {'score ms':>9} {'rank ms':>9} {'speedup':>8}")
+
+    for size in args.sizes:
+        index = synthetic_index(base, size)
+        queries = [index.match_vocabulary(resume) for resume in resumes]
+
+        start = time.perf_counter()
+        serial = [rank_jobs(index, np.arange(size), q, args.top_n, args.min_score) for q in queries]
+        serial_time = (time.perf_counter() - start) / len(queries)
+        print(f"{size:>10} {'serial':>10} {'-':>9} {serial_time * 1000:>9.1f} {1.0:>8.2f}")
+
+        for workers in args.workers:
+            scorer = ShardedScorer(index, workers)
+            try:
+                # Check equivalence first; this also warms up the worker pool
+                for q, expected in zip(queries, serial):
+                    assert np.array_equal(scorer.score_all(q), index.score_all(q))
+                    rows, scores, n_qualifying = scorer.rank(q, args.top_n, args.min_score)
+                    assert np.array_equal(rows, expected["rows"]) and n_qualifying == expected["n_qualifying"]
+
+                start = time.perf_counter()
+                for q in queries:
+                    scorer.score_all(q)
+                score_time = (time.perf_counter() - start) / len(queries)
+
+                start = time.perf_counter()
+                for q in queries:
+                    scorer.rank(q, args.top_n, args.min_score)
+                rank_time = (time.perf_counter() - start) / len(queries)
+            finally:
+                scorer.close()
+            print(f"{size:>10} {f'{workers} proc':>10} {score_time * 1000:>9.1f} {rank_time * 1000:>9.1f} "
+                  f"{serial_time / rank_time:>8.2f}")
+
+
+if __name__ == "__main__":
+    main()
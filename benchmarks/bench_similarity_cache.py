@@ -0,0 +1,123 @@
+"""Multi-user rerun latency with and without the shared skill similarity cache
+
+Usage:
+    python benchmarks/bench_similarity_cache.py [--users 200] [--sessions 1 8] [--warm-skills 200]
+
+Each simulated rerun does the matching work that Streamlit's per-session
+caches do not cover: the resume x vocabulary similarities of a resume the
+app has not seen for the current catalog version (``similarity_stage``) and
+a custom job match (``calculate_match``). Users are synthetic resumes drawn
+from the catalog's skill frequencies, so their skills overlap like real
+ones, and ``--sessions`` threads run them concurrently. The cache starts
+empty (cold), warm-started from the top catalog skills (warm) or as the warm
+pass left it, as after a catalog reload (reload). Every configuration is
+checked to return the same similarities as the uncached matcher.
+"""
+import argparse
+import os
+import statistics
+import sys
+import threading
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import load_catalog  # noqa: E402
+from hot_reload import CatalogSnapshot  # noqa: E402
+from jam import calculate_match  # noqa: E402
+from matching import SIMILARITY_FLOOR, FuzzyMatcher  # noqa: E402
+from similarity_cache import SimilarityCache  # noqa: E402
+from synthetic import CatalogModel  # noqa: E402
+
+
+def rerun(matcher, resume, job_skills):
+    skills, matrix = matcher.similarity_matrix(resume, SIMILARITY_FLOOR)
+    calculate_match({"Technical Skills": job_skills}, resume, 0.8)
+    return matrix
+
+
+def run_sessions(matcher, users, jobs, n_sessions):
+    """Run every user's rerun on ``n_sessions`` threads; returns latencies, matrices and seconds"""
+    latencies = [None] * len(users)
+    matrices = [None] * len(users)
+    next_user = iter(range(len(users)))
+    lock = threading.Lock()
+
+    def session():
+        while True:
+            with lock:
+                user = next(next_user, None)
+            if user is None:
+                return
+            start = time.perf_counter()
+            matrices[user] = rerun(matcher, users[user], jobs[user])
+            latencies[user] = time.perf_counter() - start
+
+    threads = [threading.Thread(target=session) for _ in range(n_sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, matrices, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=200)
+    parser.add_argument("--skills", type=int, default=15, help="skills per resume")
+    parser.add_argument("--sessions", type=int, nargs="+", default=[1, 8])
+    parser.add_argument("--warm-skills", type=int, default=200)
+    args = parser.parse_args()
+
+    jobs_df = load_catalog()
+    snapshot = CatalogSnapshot.build(jobs_df)
+    matcher = snapshot.skill_index.matcher()
+    users = CatalogModel(jobs_df).resumes(args.users, n_skills=args.skills, seed=1)
+    rng = np.random.default_rng(0)
+    jobs = jobs_df["Technical Skills"].to_numpy()[rng.integers(len(jobs_df), size=args.users)].tolist()
+    top_skills = [skill for skill, _ in snapshot.analytics.top_skills(args.warm_skills)]
+
+    warm_caches = {}
+    reference = [rerun(matcher, resume, job) for resume, job in zip(users, jobs)]
+
+    print(f"{len(jobs_df)} jobs, {len(snapshot.skill_index.vocabulary)} skills, {args.users} users")
+    print(f"{'cache':>6} {'sessions':>8} {'mean ms':>8} {'p95 ms':>8} {'users/s':>8} "
+          f"{'hits':>6} {'pairs':>7} {'MiB':>6} {'prep s':>7}")
+    # "reload" reruns every user on the cache the warm pass left behind, as
+    # after a catalog version change
+    for name in ("off", "cold", "warm", "reload"):
+        for n_sessions in args.sessions:
+            start = time.perf_counter()
+            if name == "off":
+                cache = None
+            elif name == "reload":
+                cache = warm_caches[n_sessions]
+            else:
+                cache = SimilarityCache()
+                if name == "warm":
+                    FuzzyMatcher.similarities = cache
+                    matcher.similarity_matrix(top_skills, SIMILARITY_FLOOR)
+            prep_seconds = time.perf_counter() - start
+            if cache is not None:
+                cache.hits = cache.misses = 0
+
+            FuzzyMatcher.similarities = cache
+            latencies, matrices, seconds = run_sessions(matcher, users, jobs, n_sessions)
+            FuzzyMatcher.similarities = None
+            if name == "warm":
+                warm_caches[n_sessions] = cache
+            assert all((matrix != ref).nnz == 0 for matrix, ref in zip(matrices, reference))
+            stats = cache.stats() if cache is not None else {"hit_ratio": 0.0, "entries": 0, "bytes": 0}
+            print(
+                f"{name:>6} {n_sessions:>8} {statistics.mean(latencies) * 1000:>8.1f} "
+                f"{np.percentile(latencies, 95) * 1000:>8.1f} {len(users) / seconds:>8.1f} "
+                f"{stats['hit_ratio']:>6.1%} {stats['entries']:>7} {stats['bytes'] / 2 ** 20:>6.1f} "
+                f"{prep_seconds:>7.2f}"
+            )
+
+
+if __name__ == "__main__":
+    main()
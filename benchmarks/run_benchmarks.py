@@ -0,0 +1,246 @@
+"""Stage-by-stage benchmark of the matching hot path on synthetic catalogs
+
+Usage:
+    python benchmarks/run_benchmarks.py [--sizes 1000 10000 100000 1000000] [--resumes 5]
+
+For each catalog size the load, index, filter, score, rank and chart stages
+are timed separately (median over the synthetic resumes) and their peak
+traced memory is recorded in a separate pass, so tracemalloc overhead does
+not distort the timings. Each run is appended to benchmarks/history.json
+together with the git commit, and compared with the previous run for the
+same size so regressions stand out. The cold import time of the app
+script (from ``python -X importtime``) is recorded too, broken down by its
+direct imports, so startup regressions show up in the same history.
+"""
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+import numpy as np
+import pandas as pd
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.dirname(BENCH_DIR))
+
+from catalog import load_catalog  # noqa: E402
+from filters import JobFilter  # noqa: E402
+from job_store import JobStore  # noqa: E402
+from jam import create_location_chart, create_match_distribution_chart, create_top_skills_chart  # noqa: E402
+from matching import SkillIndex  # noqa: E402
+from ranking import match_counts, rank_jobs  # noqa: E402
+from synthetic import CatalogModel  # noqa: E402
+
+HISTORY_PATH = os.path.join(BENCH_DIR, "history.json")
+REPO_DIR = os.path.dirname(BENCH_DIR)
+
+
+def measure(func, *args, reset=None, **kwargs):
+    """Return (result, seconds, peak traced bytes) of ``func``
+
+    The peak is taken from a first traced call and the time from a second,
+    untraced one; ``reset`` clears any caches before each call.
+    """
+    if reset is not None:
+        reset()
+    tracemalloc.start()
+    try:
+        func(*args, **kwargs)
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    if reset is not None:
+        reset()
+    start = time.perf_counter()
+    result = func(*args, **kwargs)
+    return result, time.perf_counter() - start, peak
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True,
+            cwd=BENCH_DIR
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def import_times(module="jam", top=10):
+    """Cold import time of ``module`` in a fresh interpreter
+
+    Returns ``{"total_seconds", "imports": {name: cumulative seconds}}`` for the
+    ``top`` slowest direct imports, parsed from ``-X importtime`` output.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        capture_output=True, text=True, cwd=REPO_DIR, check=True
+    )
+    total, direct = None, {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        depth = (len(name) - len(name.lstrip())) // 2
+        if depth == 0 and name.strip() == module:
+            total = int(cumulative) / 1e6
+        elif depth == 1:
+            direct[name.strip()] = int(cumulative) / 1e6
+    slowest = sorted(direct.items(), key=lambda item: -item[1])[:top]
+    return {"total_seconds": total, "imports": dict(slowest)}
+
+
+def print_import_times(times, previous):
+    def change(now, before):
+        return f"{now / before - 1:+.0%}" if before else ""
+
+    before = previous or {}
+    print(f"\nCold import of jam: {times['total_seconds'] * 1000:.1f} ms "
+          f"{change(times['total_seconds'], before.get('total_seconds'))}")
+    for name, seconds in times["imports"].items():
+        print(f"  {name:<28} {seconds * 1000:>9.1f} ms "
+              f"{change(seconds, before.get('imports', {}).get(name)):>8}")
+
+
+def build_charts(job_store, match_scores, matches, rows):
+    return (
+        create_match_distribution_chart(match_scores),
+        create_location_chart([match.location for match in matches]),
+        create_top_skills_chart(job_store.top_requirements(rows, 10)),
+    )
+
+
+def bench_size(model, n_rows, resumes, args):
+    """Time every stage for one catalog size; returns {stage: {seconds, peak_bytes}}"""
+    stages = {}
+
+    def record(name, seconds, peak):
+        entry = stages.setdefault(name, {"seconds": [], "peak_bytes": []})
+        entry["seconds"].append(seconds)
+        entry["peak_bytes"].append(peak)
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        catalog_path = os.path.join(tmp_dir, "catalog.parquet")
+        model.catalog(n_rows).to_parquet(catalog_path, index=False)
+        missing_source = os.path.join(tmp_dir, "missing.xlsx")
+        jobs_df, seconds, peak = measure(load_catalog, missing_source, catalog_path)
+        record("load", seconds, peak)
+
+    index, seconds, peak = measure(SkillIndex.from_catalog, jobs_df)
+    record("index", seconds, peak)
+    job_store, seconds, peak = measure(JobStore, jobs_df)
+    record("store_build", seconds, peak)
+    job_filter, seconds, peak = measure(JobFilter, jobs_df)
+    record("filter_build", seconds, peak)
+
+    locations = job_filter.options("Location")[:5]
+    for resume in resumes:
+        rows, seconds, peak = measure(
+            job_filter.rows, locations=locations, max_exp=args.max_exp, reset=job_filter._cached_mask.cache_clear
+        )
+        record("filter", seconds, peak)
+
+        resume_matches, seconds, peak = measure(
+            index.match_vocabulary, resume, args.threshold, reset=index._matchers.clear
+        )
+        record("match_vocabulary", seconds, peak)
+
+        scores, seconds, peak = measure(index.score_all, resume_matches)
+        record("score", seconds, peak)
+
+        ranking, seconds, peak = measure(
+            rank_jobs, index, rows, resume_matches, args.top_n, args.min_score, scores=scores
+        )
+        record("rank", seconds, peak)
+        match_counts(ranking["all_scores"], args.min_score)
+
+        def materialize():
+            return [job_store.record(row, *index.match_job(row, resume_matches)) for row in ranking["rows"]]
+
+        matches, seconds, peak = measure(materialize)
+        record("materialize", seconds, peak)
+        _, seconds, peak = measure(
+            build_charts, job_store, pd.DataFrame({"Match Score": ranking["all_scores"]}), matches, ranking["rows"]
+        )
+        record("charts", seconds, peak)
+
+    return {
+        name: {"seconds": statistics.median(entry["seconds"]), "peak_bytes": max(entry["peak_bytes"])}
+        for name, entry in stages.items()
+    }
+
+
+def load_history(path):
+    if not os.path.exists(path):
+        return []
+    with open(path) as f:
+        return json.load(f)
+
+
+def previous_result(history, n_rows):
+    for run in reversed(history):
+        if str(n_rows) in run["results"]:
+            return run["results"][str(n_rows)]
+    return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000, 1_000_000])
+    parser.add_argument("--resumes", type=int, default=5)
+    parser.add_argument("--threshold", type=float, default=0.8)
+    parser.add_argument("--min-score", type=float, default=30)
+    parser.add_argument("--top-n", type=int, default=10)
+    parser.add_argument("--max-exp", type=float, default=5)
+    parser.add_argument("--history", default=HISTORY_PATH)
+    parser.add_argument("--no-save", action="store_true", help="do not append to the history file")
+    parser.add_argument("--skip-importtime", action="store_true", help="do not measure the app import time")
+    args = parser.parse_args()
+
+    model = CatalogModel()
+    resumes = model.resumes(args.resumes)
+    history = load_history(args.history)
+    run = {
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "commit": git_commit(),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "pandas": pd.__version__,
+        "results": {},
+    }
+
+    if not args.skip_importtime:
+        run["import_time"] = import_times()
+        previous = next((r["import_time"] for r in reversed(history) if "import_time" in r), None)
+        print_import_times(run["import_time"], previous)
+
+    for n_rows in args.sizes:
+        results = bench_size(model, n_rows, resumes, args)
+        run["results"][str(n_rows)] = results
+        previous = previous_result(history, n_rows)
+
+        print(f"\n{n_rows:,} jobs")
+        print(f"  {'stage':<18} {'ms':>10} {'peak MB':>9} {'vs prev':>8}")
+        for name, entry in results.items():
+            change = ""
+            if previous and name in previous and previous[name]["seconds"] > 0:
+                change = f"{entry['seconds'] / previous[name]['seconds'] - 1:+.0%}"
+            print(f"  {name:<18} {entry['seconds'] * 1000:>10.2f} "
+                  f"{entry['peak_bytes'] / 1e6:>9.1f} {change:>8}")
+
+    if not args.no_save:
+        history.append(run)
+        with open(args.history, "w") as f:
+            json.dump(history, f, indent=2)
+        print(f"\nAppended results to {args.history}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Synthetic job catalogs and resumes drawn from processed_jobs.xlsx distributions"""
+import os
+import sys
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import load_catalog, parse_experience  # noqa: E402
+from matching import SkillIndex  # noqa: E402
+
+CATEGORICAL_COLUMNS = ["Location", "Role Level", "Size", "Industry", "Experience Required", "Salary Estimate"]
+
+
+class CatalogModel:
+    """Empirical distributions of the real catalog used to sample synthetic postings
+
+    Skill and tool lists keep the real list-length distribution and draw
+    items by their real frequency; categorical columns are sampled from their
+    real marginals.
+    """
+
+    def __init__(self, jobs_df=None):
+        jobs_df = load_catalog() if jobs_df is None else jobs_df
+        self.lists = {}
+        for column in ("skills_list", "tools_list"):
+            counts = pd.Series([skill for skills in jobs_df[column] for skill in skills]).value_counts()
+            self.lists[column] = (
+                counts.index.to_numpy(),
+                (counts / counts.sum()).to_numpy(),
+                np.array([len(skills) for skills in jobs_df[column]]),
+            )
+        self.marginals = {
+            column: jobs_df[column].fillna("Not Specified").astype(str).value_counts(normalize=True)
+            for column in CATEGORICAL_COLUMNS
+        }
+        self.titles = jobs_df["Job Title"].to_numpy()
+        self.companies = jobs_df["Company Name"].to_numpy()
+
+    def _sample_lists(self, column, n_rows, rng):
+        vocabulary, weights, lengths = self.lists[column]
+        sizes = rng.choice(lengths, size=n_rows)
+        flat = rng.choice(len(vocabulary), size=int(sizes.sum()), p=weights)
+        splits = np.split(vocabulary[flat], np.cumsum(sizes)[:-1])
+        return [list(items) for items in splits]
+
+    def catalog(self, n_rows, seed=0):
+        """Synthetic catalog DataFrame in the prepared (load_catalog) format"""
+        rng = np.random.default_rng(seed)
+        df = pd.DataFrame({
+            "Job Title": rng.choice(self.titles, size=n_rows),
+            "Company Name": rng.choice(self.companies, size=n_rows),
+        })
+        for column, marginal in self.marginals.items():
+            df[column] = rng.choice(marginal.index.to_numpy(), size=n_rows, p=marginal.to_numpy())
+        df["skills_list"] = self._sample_lists("skills_list", n_rows, rng)
+        df["tools_list"] = self._sample_lists("tools_list", n_rows, rng)
+        df["Technical Skills"] = [", ".join(skills) for skills in df["skills_list"]]
+        df["Tools"] = [", ".join(tools) for tools in df["tools_list"]]
+        df["Job Description"] = "Synthetic posting"
+        df["exp_years"] = df["Experience Required"].map(parse_experience).astype(float)
+        return df
+
+    def resumes(self, n_resumes, n_skills=15, seed=0):
+        """Synthetic resume skill lists, mixing frequent and long-tail skills"""
+        rng = np.random.default_rng(seed + 1)
+        vocabulary, weights, _ = self.lists["skills_list"]
+        resumes = []
+        for _ in range(n_resumes):
+            picks = rng.choice(len(vocabulary), size=min(n_skills, len(vocabulary)), replace=False, p=weights)
+            resumes.append([str(skill).title() for skill in vocabulary[picks]])
+        return resumes
+
+
+def synthetic_index(base_index, n_jobs, seed=0):
+    """SkillIndex of ``n_jobs`` postings sampled from a base index's distributions
+
+    Much faster than building a full synthetic DataFrame when only the
+    postings are needed.
+    """
+    rng = np.random.default_rng(seed)
+    frequencies = np.diff(base_index.postings.indptr).astype(float)
+    frequencies /= frequencies.sum()
+    lengths = rng.choice(base_index.n_reqs[base_index.n_reqs > 0], size=n_jobs)
+    indptr = np.concatenate([[0], np.cumsum(lengths)])
+    indices = rng.choice(len(base_index.vocabulary), size=int(indptr[-1]), p=frequencies)
+    return SkillIndex(base_index.vocabulary, indptr, indices)
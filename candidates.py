@@ -0,0 +1,279 @@
+"""Persistent candidate pool for recruiter mode: rank stored resumes for a job
+
+Usage:
+    python candidates.py import results.jsonl [--pool .cache/candidates.sqlite]
+    python candidates.py stats
+
+``import`` loads the ``sha256``/``skills`` records written by batch_match.py,
+so a folder of resumes is extracted once in bulk and then served from the pool.
+"""
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from array import array
+from contextlib import contextmanager
+
+import numpy as np
+
+from matching import FIELD_WEIGHTS, FuzzyMatcher, combine_field_scores, normalize_skills
+
+DEFAULT_POOL_PATH = os.path.join(".cache", "candidates.sqlite")
+
+
+def content_hash(data):
+    """Key of a resume in the pool: sha256 of the uploaded file, as batch_match records it"""
+    return hashlib.sha256(data).hexdigest()
+
+
+class RequirementMatcher(FuzzyMatcher):
+    """FuzzyMatcher over candidate skills, queried with job requirements
+
+    ``calculate_match`` computes ``SequenceMatcher(None, resume_skill,
+    job_skill)``; the vocabulary holds the resume skills here, so ``compat``
+    mode puts the vocabulary entry first to get the very same ratio. Exact
+    and variation matches are symmetric and TF-IDF cosine needs no change.
+    """
+
+    def _similarities(self, j_skill, threshold):
+        if self.mode == 'tfidf':
+            return super()._similarities(j_skill, threshold)
+        candidates = self._ratio_candidates(j_skill, threshold).tolist()
+        ratios = self.pair_ratios([(self.vocabulary[skill_id], j_skill) for skill_id in candidates])
+        ids, values = [], []
+        for skill_id, ratio in zip(candidates, ratios):
+            if ratio >= threshold:
+                ids.append(skill_id)
+                values.append(ratio)
+        return ids, values
+
+
+class CandidatePool:
+    """Stored resume skill sets with an inverted skill -> candidates index
+
+    Candidates are keyed by the content hash of their resume and persisted in
+    a SQLite file; the index is rebuilt from it on start and then updated in
+    place, so adding a resume only appends its id to the postings of its
+    skills. A query matches each distinct job requirement against the
+    candidate skill vocabulary (memoized per requirement and threshold) and
+    counts matches over the postings it reaches, so its cost follows the
+    job's requirement postings rather than the pool size. Scores follow
+    ``calculate_match`` per field and are combined like ``SkillIndex``
+    scores (see ``combine_field_scores``).
+    """
+
+    def __init__(self, path=DEFAULT_POOL_PATH):
+        self.path = path
+        self.keys = []
+        self.names = []
+        self.skills = []
+        self.candidate_ids = {}
+        # Candidate skill vocabulary, per-candidate skill ids and skill -> candidate postings
+        self.vocabulary = []
+        self.skill_ids = {}
+        self.candidate_skill_ids = []
+        self.postings = []
+        self._matchers = {}
+        self._lock = threading.RLock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS candidates (
+                    key TEXT PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    skills TEXT NOT NULL,
+                    added_at REAL NOT NULL
+                )
+            """)
+            rows = conn.execute("SELECT key, name, skills FROM candidates ORDER BY rowid").fetchall()
+        for key, name, skills in rows:
+            self._index(key, name, json.loads(skills))
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def __len__(self):
+        return len(self.keys)
+
+    def __contains__(self, key):
+        return key in self.candidate_ids
+
+    def _index(self, key, name, skills):
+        candidate_id = len(self.keys)
+        self.keys.append(key)
+        self.names.append(name)
+        self.skills.append(skills)
+        self.candidate_ids[key] = candidate_id
+        ids = []
+        for skill in skills:
+            skill_id = self.skill_ids.get(skill)
+            if skill_id is None:
+                skill_id = self.skill_ids[skill] = len(self.vocabulary)
+                self.vocabulary.append(skill)
+                self.postings.append(array('i'))
+                # Matchers are rebuilt on the next query that needs them
+                self._matchers.clear()
+            ids.append(skill_id)
+        for skill_id in dict.fromkeys(ids):
+            self.postings[skill_id].append(candidate_id)
+        self.candidate_skill_ids.append(ids)
+
+    def add(self, key, name, skills):
+        """Store one candidate's extracted skills; False when the resume is already pooled"""
+        return self.add_many([(key, name, skills)]) == 1
+
+    def add_many(self, records):
+        """Store ``(key, name, skills)`` records in one transaction; returns the number added"""
+        with self._lock:
+            new = {}
+            for key, name, skills in records:
+                if key not in self.candidate_ids and key not in new:
+                    new[key] = (name, normalize_skills(skills))
+            if not new:
+                return 0
+            now = time.time()
+            with self._connect() as conn:
+                conn.executemany(
+                    "INSERT OR IGNORE INTO candidates VALUES (?, ?, ?, ?)",
+                    [(key, name, json.dumps(skills), now) for key, (name, skills) in new.items()]
+                )
+            for key, (name, skills) in new.items():
+                self._index(key, name, skills)
+            return len(new)
+
+    def matcher(self, mode='compat'):
+        """Return the (lazily built) requirement matcher over the current vocabulary"""
+        if mode not in self._matchers:
+            self._matchers[mode] = RequirementMatcher(self.vocabulary, mode)
+        return self._matchers[mode]
+
+    def _candidates_with(self, skill_ids):
+        """Sorted ids of the candidates listing any of ``skill_ids``"""
+        if not skill_ids:
+            return np.empty(0, dtype=np.int32)
+        return np.unique(np.concatenate([
+            np.frombuffer(self.postings[skill_id], dtype=np.int32) for skill_id in skill_ids
+        ]))
+
+    def rank(self, requirements, threshold=0.8, mode='compat', weights=None, top_n=10):
+        """Top candidates for a job's ``{field: requirements}`` as result dicts
+
+        Each result has the candidate ``key``, ``name``, weighted ``score``,
+        ``matched``/``missing`` requirements in ``calculate_match`` order and
+        a per-field ``breakdown`` of ``(score, matched, missing)``. Candidates
+        matching no requirement are left out.
+        """
+        weights = weights or FIELD_WEIGHTS
+        fields = {field: normalize_skills(reqs) for field, reqs in requirements.items()}
+        fields = {field: reqs for field, reqs in fields.items() if reqs}
+        if not fields:
+            return []
+
+        with self._lock:
+            matcher = self.matcher(mode)
+            # Requirement -> matched candidate skill ids, then -> candidates
+            matched_skills = {
+                j_skill: matcher.match(j_skill, threshold)
+                for reqs in fields.values() for j_skill in reqs
+            }
+            reached = {j_skill: self._candidates_with(ids) for j_skill, ids in matched_skills.items()}
+
+            per_field = []
+            for reqs in fields.values():
+                hits = [reached[j_skill] for j_skill in dict.fromkeys(reqs)]
+                per_field.append(np.concatenate(hits) if hits else np.empty(0, dtype=np.int32))
+            touched = np.unique(np.concatenate(per_field))
+            if len(touched) == 0:
+                return []
+
+            matched_counts = np.array([
+                np.bincount(np.searchsorted(touched, hits), minlength=len(touched)) for hits in per_field
+            ])
+            n_reqs = np.array([[len(reqs)] for reqs in fields.values()]).repeat(len(touched), axis=1)
+            field_weights = [weights.get(field, FIELD_WEIGHTS.get(field, 1.0)) for field in fields]
+            scores = combine_field_scores(matched_counts, n_reqs, field_weights)
+
+            order = np.lexsort((touched, -scores))[:top_n]
+            return [
+                self._result(int(touched[i]), float(scores[i]), fields, matched_skills)
+                for i in order
+            ]
+
+    def _result(self, candidate_id, score, fields, matched_skills):
+        skill_ids = self.candidate_skill_ids[candidate_id]
+
+        def match_lists(job_reqs):
+            matched_reqs = [
+                j_skill for skill_id in skill_ids for j_skill in job_reqs
+                if skill_id in matched_skills[j_skill]
+            ]
+            # Remove duplicates while preserving order
+            matched_reqs = list(dict.fromkeys(matched_reqs))
+            return matched_reqs, [req for req in job_reqs if req not in matched_reqs]
+
+        breakdown = {}
+        for field, reqs in fields.items():
+            matched_reqs, missing_reqs = match_lists(reqs)
+            breakdown[field] = (len(matched_reqs) / len(reqs) * 100, matched_reqs, missing_reqs)
+        matched_reqs, missing_reqs = match_lists([req for reqs in fields.values() for req in reqs])
+        return {
+            "key": self.keys[candidate_id],
+            "name": self.names[candidate_id],
+            "score": score,
+            "matched": matched_reqs,
+            "missing": missing_reqs,
+            "breakdown": breakdown,
+        }
+
+    def stats(self):
+        """Pool size, vocabulary size and number of postings"""
+        with self._lock:
+            return {
+                "candidates": len(self.keys),
+                "skills": len(self.vocabulary),
+                "postings": sum(len(postings) for postings in self.postings),
+            }
+
+
+def import_results(pool, path):
+    """Add the resumes of a batch_match.py JSONL output; returns the number added"""
+    records = []
+    with open(path) as f:
+        for line in f:
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            if record.get("sha256") and record.get("skills"):
+                records.append((record["sha256"], os.path.basename(record["resume"]), record["skills"]))
+    return pool.add_many(records)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--pool", default=DEFAULT_POOL_PATH, help="candidate pool SQLite file")
+    commands = parser.add_subparsers(dest="command", required=True)
+    import_parser = commands.add_parser("import", help="add the resumes of a batch_match.py JSONL output")
+    import_parser.add_argument("results")
+    commands.add_parser("stats", help="print the pool size")
+    args = parser.parse_args()
+
+    pool = CandidatePool(args.pool)
+    if args.command == "import":
+        print(f"added {import_results(pool, args.results)} candidates")
+    for name, value in pool.stats().items():
+        print(f"{name:<11} {value}")
+
+
+if __name__ == "__main__":
+    main()
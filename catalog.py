@@ -0,0 +1,144 @@
+"""Job catalog ingest: convert processed_jobs.xlsx into a columnar Parquet file
+
+Usage:
+    python catalog.py [--source processed_jobs.xlsx] [--output processed_jobs.parquet]
+"""
+import argparse
+import hashlib
+import os
+
+import numpy as np
+import pandas as pd
+
+from matching import split_skills
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:  # pragma: no cover - pyarrow is optional
+    pa = None
+    pq = None
+
+SOURCE_PATH = "processed_jobs.xlsx"
+CATALOG_PATH = "processed_jobs.parquet"
+METADATA_KEY = b"ai_job_matcher.source"
+# Stable posting key used by catalog deltas; workbook rows without one get their row number
+JOB_ID_COLUMN = "Job ID"
+
+
+def parse_experience(value):
+    """Parse the leading number of an experience requirement, NaN if there is none"""
+    try:
+        return float(str(value).split()[0])
+    except (ValueError, IndexError):
+        return np.nan
+
+
+def assign_job_ids(df):
+    """Add a JOB_ID_COLUMN of row numbers to a catalog without one; ids are strings"""
+    if JOB_ID_COLUMN in df:
+        df[JOB_ID_COLUMN] = df[JOB_ID_COLUMN].astype(str)
+    else:
+        df.insert(0, JOB_ID_COLUMN, [str(row) for row in range(len(df))])
+    return df
+
+
+def prepare_catalog(df):
+    """Clean raw job postings and add the derived matching columns"""
+    df = assign_job_ids(df.copy())
+    # Clean the filter columns; a posting without a value gets its own category
+    for column in ('Role Level', 'Location', 'Size', 'Industry'):
+        df[column] = df[column].fillna('Not Specified').astype(str)
+    df['skills_list'] = [split_skills(text) for text in df['Technical Skills']]
+    df['tools_list'] = [split_skills(text) for text in df['Tools']]
+    df['exp_years'] = df['Experience Required'].map(parse_experience).astype(float)
+    return df
+
+
+def file_digest(path):
+    """SHA-256 of a file's contents"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _source_info(source_path):
+    return {"mtime": str(os.path.getmtime(source_path)), "sha256": file_digest(source_path)}
+
+
+def convert_workbook(source_path=SOURCE_PATH, output_path=CATALOG_PATH):
+    """Convert the workbook into Parquet, recording the source mtime and hash"""
+    if pa is None:
+        raise ImportError("pyarrow is required to write the columnar catalog")
+    df = prepare_catalog(pd.read_excel(source_path))
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    info = _source_info(source_path)
+    metadata = dict(table.schema.metadata or {})
+    metadata[METADATA_KEY] = f"{info['mtime']}|{info['sha256']}".encode()
+    table = table.replace_schema_metadata(metadata)
+
+    # Write to a temporary file first so readers never see a partial catalog
+    tmp_path = f"{output_path}.tmp"
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, output_path)
+    return df
+
+
+def is_stale(source_path=SOURCE_PATH, output_path=CATALOG_PATH):
+    """Whether the Parquet catalog is missing or out of date with the workbook
+
+    A matching mtime is trusted as is; when only the mtime differs the
+    workbook is hashed, so touching the file does not force a rebuild.
+    """
+    if pq is None or not os.path.exists(output_path):
+        return True
+    if not os.path.exists(source_path):
+        return False
+    stored = (pq.read_schema(output_path).metadata or {}).get(METADATA_KEY, b"").decode()
+    stored_mtime, _, stored_hash = stored.partition("|")
+    if stored_mtime == str(os.path.getmtime(source_path)):
+        return False
+    return stored_hash != file_digest(source_path)
+
+
+def catalog_version(output_path=CATALOG_PATH):
+    """Source mtime/hash recorded in the Parquet catalog, or None when there is none"""
+    if pq is None or not os.path.exists(output_path):
+        return None
+    return (pq.read_schema(output_path).metadata or {}).get(METADATA_KEY, b"").decode() or None
+
+
+def load_catalog(source_path=SOURCE_PATH, output_path=CATALOG_PATH, memory_map=True):
+    """Load the job catalog from Parquet, rebuilding it from the workbook if stale"""
+    if is_stale(source_path, output_path):
+        if pa is None:
+            return prepare_catalog(pd.read_excel(source_path))
+        try:
+            return convert_workbook(source_path, output_path)
+        except OSError:
+            # Read-only deployments still work straight from the workbook
+            return prepare_catalog(pd.read_excel(source_path))
+
+    table = pq.read_table(output_path, memory_map=memory_map)
+    df = table.to_pandas()
+    # Parquet hands back list columns as arrays; the rest of the app expects lists
+    for column in ('skills_list', 'tools_list'):
+        df[column] = [list(skills) for skills in df[column]]
+    # Catalogs converted before job ids existed
+    return assign_job_ids(df)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--source", default=SOURCE_PATH)
+    parser.add_argument("--output", default=CATALOG_PATH)
+    args = parser.parse_args()
+
+    df = convert_workbook(args.source, args.output)
+    print(f"Wrote {len(df)} postings to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
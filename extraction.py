@@ -0,0 +1,192 @@
+import asyncio
+from functools import lru_cache
+
+from llm_cache import LLMCache
+from llm_client import AsyncLLMClient
+from pdf_ingest import ingest_pdf
+from tracing import span, traced, tracer
+
+REQUIREMENTS_PROMPT = """
+                Extract all technical requirements from this job description.
+                Include:
+                - Required technical skills
+                - Tools and technologies
+                - Programming languages
+                - Frameworks and platforms
+                
+                Format the output as a comma-separated list like this:
+                Skills: skill1, skill2, skill3
+
+                Job Description:
+                {text}
+                """
+
+RESUME_SKILLS_PROMPT = """
+        Find the SKILLS or TECHNICAL SKILLS section in this resume and extract all technical items.
+        
+        Focus on extracting:
+        - Programming languages (e.g., Python, Java)
+        - Database technologies (e.g., SQL, MongoDB)
+        - Tools and software (e.g., Tableau, Excel)
+        - Frameworks and libraries
+        - Technical platforms
+        - Analysis tools
+        
+        Format the output as:
+        SKILLS: skill1, skill2, skill3
+
+        Important:
+        - Only extract skills that are explicitly mentioned
+        - Include ALL technical items listed in the skills section
+        - Separate skills with commas
+        - Keep the exact names as written
+        - Don't add skills not present in the resume
+        
+        Resume text:
+        {text}
+        """
+
+# Skill extraction modes: LLM only, offline only, or offline with LLM fallback
+EXTRACTION_MODES = {
+    "llm": "LLM (GPT-3.5)",
+    "local": "Local (catalog vocabulary)",
+    "local+llm": "Local, LLM fallback",
+}
+MIN_LOCAL_SKILLS = 3
+
+
+@lru_cache(maxsize=None)
+def get_llm_cache():
+    """Open the persistent LLM completion cache once per process"""
+    return LLMCache.from_env()
+
+
+async def _complete(api_key, prompt, model, max_tokens, temperature):
+    async with AsyncLLMClient(api_key, max_concurrency=1) as client:
+        content = await client.complete(prompt, model=model, max_tokens=max_tokens, temperature=temperature)
+    tracer.add_tokens(model, client.usage["prompt_tokens"], client.usage["completion_tokens"],
+                      requests=client.usage["requests"])
+    return content
+
+
+def chat_completion(prompt_template, text, max_tokens, api_key=None, model="gpt-3.5-turbo", temperature=0.0):
+    """Run a chat completion, served from the persistent cache when possible
+
+    Blocking counterpart of ``async_chat_completion``: the request goes
+    through a client built for ``api_key`` (default ``OPENAI_API_KEY``), so
+    no key is ever set on the shared ``openai`` module. Raises ``LLMError``
+    on failure.
+    """
+    cache = get_llm_cache()
+    key = cache.key(text, prompt_template, model, temperature, max_tokens=max_tokens)
+    content = cache.get(key)
+    tracer.cache_lookup("llm_cache", hit=content is not None)
+    if content is None:
+        with span("openai_request", model=model):
+            content = asyncio.run(
+                _complete(api_key, prompt_template.format(text=text), model, max_tokens, temperature)
+            )
+        cache.put(key, content)
+    return content
+
+
+async def async_chat_completion(client, prompt_template, text, max_tokens, model="gpt-3.5-turbo", temperature=0.0):
+    """Async counterpart of chat_completion using an AsyncLLMClient"""
+    cache = get_llm_cache()
+    key = cache.key(text, prompt_template, model, temperature, max_tokens=max_tokens)
+    content = cache.get(key)
+    tracer.cache_lookup("llm_cache", hit=content is not None)
+    if content is None:
+        with span("openai_request", model=model):
+            content = await client.complete(
+                prompt_template.format(text=text),
+                model=model,
+                max_tokens=max_tokens,
+                temperature=temperature
+            )
+        cache.put(key, content)
+    return content
+
+
+def parse_requirements_response(content):
+    """Parse the skills list out of a requirements completion"""
+    for line in content.split('\n'):
+        if line.lower().startswith('skills:'):
+            skills_text = line[7:].strip()
+            skills_list = [skill.strip() for skill in skills_text.split(',')]
+            return [s for s in skills_list if s]
+    return []
+
+
+def parse_skills_response(content):
+    """Parse the skills list out of a resume skills completion
+
+    Falls back to any comma-separated list when there is no ``SKILLS:`` line.
+    """
+    for line in content.split('\n'):
+        if line.lower().startswith('skills:'):
+            skills = [skill.strip() for skill in line[7:].strip().split(',')]
+            # Remove empty strings and duplicates while preserving order
+            return list(dict.fromkeys([s for s in skills if s and len(s) > 1]))
+    skills = [chunk.strip() for chunk in content.split(',')]
+    return list(dict.fromkeys([s for s in skills if s and len(s) > 1]))
+
+
+def extract_skills_locally(text, mode, extractor):
+    """Run the offline extractor for the local modes
+
+    Returns the extracted skills, or None when the LLM should be called:
+    always in "llm" mode, and in "local+llm" mode when the local pass finds
+    fewer than MIN_LOCAL_SKILLS skills.
+    """
+    if mode == "llm":
+        return None
+    skills = extractor.extract(text) if extractor is not None else []
+    if mode == "local" or len(skills) >= MIN_LOCAL_SKILLS:
+        return skills
+    return None
+
+
+@traced()
+def read_resume_text(pdf_file):
+    """Read the text of a resume PDF, keeping only the SKILLS section when found"""
+    pdf = ingest_pdf(pdf_file)
+    for page, seconds in enumerate(pdf["page_timings"], 1):
+        tracer.record("pdf_page", seconds, page=page, page_count=pdf["page_count"])
+    return pdf["skills_section"] or pdf["text"]
+
+
+def extract_skills(text, mode="llm", extractor=None, api_key=None):
+    """Resume skills of ``text``; LLM and API errors are raised to the caller"""
+    local_skills = extract_skills_locally(text, mode, extractor)
+    if local_skills is not None:
+        return local_skills
+    return parse_skills_response(chat_completion(RESUME_SKILLS_PROMPT, text, max_tokens=500, api_key=api_key))
+
+
+async def extract_skills_async(text, client, mode="llm", extractor=None):
+    """Async counterpart of extract_skills using an AsyncLLMClient"""
+    local_skills = extract_skills_locally(text, mode, extractor)
+    if local_skills is not None:
+        return local_skills
+    return parse_skills_response(await async_chat_completion(client, RESUME_SKILLS_PROMPT, text, max_tokens=500))
+
+
+def extract_requirements(text, mode="llm", extractor=None, api_key=None):
+    """Technical requirements of a job description; LLM and API errors are raised"""
+    local_skills = extract_skills_locally(text, mode, extractor)
+    if local_skills is not None:
+        return local_skills
+    return parse_requirements_response(
+        chat_completion(REQUIREMENTS_PROMPT, text, max_tokens=300, api_key=api_key)
+    )
+
+
+async def extract_requirements_async(text, client, mode="llm", extractor=None):
+    """Async counterpart of extract_requirements using an AsyncLLMClient"""
+    local_skills = extract_skills_locally(text, mode, extractor)
+    if local_skills is not None:
+        return local_skills
+    return parse_requirements_response(
+        await async_chat_completion(client, REQUIREMENTS_PROMPT, text, max_tokens=300)
+    )
@@ -0,0 +1,72 @@
+import hashlib
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+
+def input_digest(*inputs):
+    """Stable SHA-256 digest of chart inputs (strings, numbers, sequences, arrays)"""
+    digest = hashlib.sha256()
+
+    def update(value):
+        if isinstance(value, np.ndarray):
+            digest.update(f"ndarray{value.dtype}{value.shape}".encode())
+            digest.update(np.ascontiguousarray(value).tobytes())
+        elif isinstance(value, (list, tuple)):
+            digest.update(f"seq{len(value)}[".encode())
+            for item in value:
+                update(item)
+            digest.update(b"]")
+        else:
+            digest.update(f"{type(value).__name__}:{value!r};".encode())
+
+    for value in inputs:
+        update(value)
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """Bounded, thread-safe LRU of rendered figures keyed by a digest of their inputs
+
+    Values are whatever the builder returns: Plotly figures, or PNG bytes for
+    the word cloud so no Matplotlib figure stays alive between reruns.
+    """
+
+    def __init__(self, max_entries=64):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get_or_create(self, name, inputs, build):
+        """Return the cached figure for ``(name, inputs)``, building it on a miss"""
+        key = (name, input_digest(inputs))
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            self.misses += 1
+
+        figure = build()
+        with self._lock:
+            self._entries[key] = figure
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return figure
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+    def stats(self):
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+        }
@@ -0,0 +1,104 @@
+import copy
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+# Sidebar filter name -> catalog column
+FILTER_COLUMNS = {
+    'locations': 'Location',
+    'levels': 'Role Level',
+    'sizes': 'Size',
+    'industries': 'Industry',
+}
+
+
+class JobFilter:
+    """Vectorized sidebar filters over precomputed categorical codes
+
+    Each categorical column is encoded once; a selection becomes a boolean
+    lookup table over the category codes and the per-column masks are ANDed
+    together with the ``exp_years`` bound. Masks are memoized by the selection
+    tuples, since users tend to toggle the same multiselects back and forth.
+    """
+
+    def __init__(self, jobs_df, cache_size=128):
+        self.n_jobs = len(jobs_df)
+        self.cache_size = cache_size
+        self.categories = {column: [] for column in FILTER_COLUMNS.values()}
+        self.codes = self._encode(jobs_df)
+        self.exp_years = jobs_df['exp_years'].to_numpy(dtype=float)
+        # Rows still listed; a catalog delta clears the rows it deletes or replaces
+        self.live = np.ones(self.n_jobs, dtype=bool)
+        self._cached_mask = lru_cache(maxsize=cache_size)(self._compute_mask)
+
+    def _encode(self, jobs_df):
+        """Category codes of ``jobs_df``, appending unseen categories in first-seen order"""
+        codes = {}
+        for column, categories in self.categories.items():
+            local_codes, uniques = pd.factorize(jobs_df[column].astype(str))
+            category_ids = {value: i for i, value in enumerate(categories)}
+            mapping = np.empty(len(uniques) + 1, dtype=np.int32)
+            mapping[-1] = -1  # missing values never pass a selection
+            for i, value in enumerate(uniques):
+                if value not in category_ids:
+                    category_ids[value] = len(categories)
+                    categories.append(value)
+                mapping[i] = category_ids[value]
+            codes[column] = mapping[local_codes]
+        return codes
+
+    def merged(self, delta_df, live):
+        """New filter with ``delta_df``'s jobs appended; rows cleared in ``live`` never pass"""
+        job_filter = copy.copy(self)
+        job_filter.n_jobs = self.n_jobs + len(delta_df)
+        job_filter.categories = {column: list(values) for column, values in self.categories.items()}
+        delta_codes = job_filter._encode(delta_df)
+        job_filter.codes = {
+            column: np.concatenate([codes, delta_codes[column]]) for column, codes in self.codes.items()
+        }
+        job_filter.exp_years = np.concatenate([self.exp_years, delta_df['exp_years'].to_numpy(dtype=float)])
+        job_filter.live = live
+        job_filter._cached_mask = lru_cache(maxsize=self.cache_size)(job_filter._compute_mask)
+        return job_filter
+
+    def subset(self, rows):
+        """New filter over ``rows`` of this one, in that order; compacts away removed rows"""
+        job_filter = copy.copy(self)
+        job_filter.n_jobs = len(rows)
+        job_filter.codes = {column: codes[rows] for column, codes in self.codes.items()}
+        job_filter.exp_years = self.exp_years[rows]
+        job_filter.live = np.ones(len(rows), dtype=bool)
+        job_filter._cached_mask = lru_cache(maxsize=self.cache_size)(job_filter._compute_mask)
+        return job_filter
+
+    def options(self, column):
+        """Sorted distinct values of a filter column"""
+        return sorted(self.categories[column])
+
+    def _column_mask(self, column, selected):
+        allowed = np.isin(self.categories[column], selected)
+        return allowed[self.codes[column]]
+
+    def _compute_mask(self, locations, levels, sizes, industries, max_exp):
+        selections = dict(zip(FILTER_COLUMNS.values(), (locations, levels, sizes, industries)))
+        mask = self.live.copy()
+        for column, selected in selections.items():
+            if selected:
+                mask &= self._column_mask(column, list(selected))
+        if max_exp is not None:
+            # Jobs without a parseable experience requirement are never excluded
+            mask &= ~(self.exp_years > max_exp)
+        mask.setflags(write=False)
+        return mask
+
+    def mask(self, locations=(), levels=(), sizes=(), industries=(), max_exp=None):
+        """Boolean mask of jobs passing every active filter"""
+        return self._cached_mask(
+            tuple(sorted(locations)), tuple(sorted(levels)),
+            tuple(sorted(sizes)), tuple(sorted(industries)), max_exp
+        )
+
+    def rows(self, **selections):
+        """Catalog row positions passing every active filter"""
+        return np.flatnonzero(self.mask(**selections))
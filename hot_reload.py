@@ -0,0 +1,482 @@
+"""Hot reload of the job catalog: delta ingestion and atomic snapshot swaps
+
+Usage:
+    python hot_reload.py [processed_jobs.delta.jsonl]
+
+Catalog changes are appended to a JSONL delta file (``CATALOG_DELTA_PATH``,
+default ``processed_jobs.delta.jsonl``), one change per line keyed by job ID:
+
+    {"op": "append", "Job ID": "j-1001", "Job Title": "Data Analyst", "Technical Skills": "SQL, Python"}
+    {"op": "update", "Job ID": "42", "Tools": "Tableau, Excel"}
+    {"op": "delete", "Job ID": "17"}
+
+An update only lists the columns it changes; an append (or an update of an
+unknown ID) adds the posting. The file is replayed over the base catalog on
+start, and a background watcher applies new lines as they are written and
+rebuilds everything when the workbook itself changes. The command line
+applies a delta file to the catalog once and prints the reload report.
+"""
+import argparse
+import json
+import os
+import resource
+import threading
+import time
+import weakref
+from collections import deque
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from analytics import MarketAnalytics
+from catalog import JOB_ID_COLUMN, prepare_catalog
+from filters import JobFilter
+from job_store import JobStore
+from local_extractor import SkillExtractor
+from matching import SkillIndex
+from sharded import MATCH_BACKEND, MATCH_WORKERS
+from tracing import span
+
+DELTA_PATH = os.getenv("CATALOG_DELTA_PATH", "processed_jobs.delta.jsonl")
+# Seconds between checks of the delta file and workbook; 0 turns the watcher off
+WATCH_INTERVAL = float(os.getenv("CATALOG_WATCH_INTERVAL", 2))
+DELTA_OPS = ("append", "update", "delete")
+# Share of tombstoned rows at which a delta also compacts the snapshot
+COMPACT_RATIO = float(os.getenv("CATALOG_COMPACT_RATIO", 0.25))
+# Catalog columns computed by prepare_catalog rather than read from postings
+DERIVED_COLUMNS = ("skills_list", "tools_list", "exp_years")
+
+
+def read_deltas(path, offset=0):
+    """Delta records written to ``path`` after byte ``offset``
+
+    Returns ``(records, new_offset, skipped)``. A last line without a newline
+    is still being written and is left for the next read; lines that are not
+    valid delta records are skipped and counted.
+    """
+    with open(path, "rb") as f:
+        f.seek(offset)
+        data = f.read()
+    end = data.rfind(b"\n") + 1
+    records, skipped = [], 0
+    for line in data[:end].splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except ValueError:
+            skipped += 1
+            continue
+        if not isinstance(record, dict) or record.get("op") not in DELTA_OPS or record.get(JOB_ID_COLUMN) is None:
+            skipped += 1
+            continue
+        records.append(record)
+    return records, offset + end, skipped
+
+
+def consolidate(records):
+    """Net change per job ID as ``{job_id: (op, fields)}``, applied in file order
+
+    An update following an append of the same ID folds into that append, and
+    a delete drops whatever came before it.
+    """
+    changes = {}
+    for record in records:
+        job_id = str(record[JOB_ID_COLUMN])
+        op = record["op"]
+        fields = {key: value for key, value in record.items() if key not in ("op", JOB_ID_COLUMN)}
+        previous = changes.get(job_id)
+        if op == "update" and previous is not None and previous[0] != "delete":
+            changes[job_id] = (previous[0], {**previous[1], **fields})
+        else:
+            changes[job_id] = (op, fields)
+    return changes
+
+
+def _nbytes(value, depth=2):
+    """Bytes held by the NumPy/SciPy arrays of an object, looking ``depth`` containers deep"""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (str, int, float)):
+        # The bulk of the vocabulary dicts, checked before the slower issparse
+        return 0
+    if sparse.issparse(value):
+        return value.data.nbytes + value.indices.nbytes + value.indptr.nbytes
+    if depth == 0:
+        return 0
+    if isinstance(value, dict):
+        return sum(_nbytes(item, depth - 1) for item in value.values())
+    if hasattr(value, "__dict__"):
+        return sum(_nbytes(item, depth - 1) for item in vars(value).values())
+    return 0
+
+
+def _rss_bytes():
+    """Resident set size of the process (peak RSS where /proc is unavailable)"""
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+class JobIdIndex:
+    """Job ID -> catalog row lookup extended per delta without rehashing the catalog
+
+    IDs are held in chunks, a ``pd.Index`` per appended block with the rows
+    it covers. A new chunk absorbs the previous one while that one is no
+    larger, so there are O(log n) chunks and the base catalog's index (and
+    its hash table) is shared by every version until the appended rows
+    outgrow it. Only listed rows are carried into an absorbing chunk, which
+    keeps every chunk free of duplicate IDs.
+    """
+
+    def __init__(self, chunks):
+        self.chunks = tuple(chunks)
+
+    @classmethod
+    def from_ids(cls, job_ids):
+        return cls([(pd.Index(job_ids), np.arange(len(job_ids)))])
+
+    def appended(self, job_ids, first_row, live):
+        """New index with ``job_ids`` at rows ``first_row`` onwards; ``live`` marks the listed rows"""
+        chunks = list(self.chunks)
+        ids, rows = pd.Index(job_ids), np.arange(first_row, first_row + len(job_ids))
+        while chunks and len(chunks[-1][0]) <= len(ids):
+            last_ids, last_rows = chunks.pop()
+            listed = live[last_rows]
+            ids, rows = last_ids[listed].append(ids), np.concatenate([last_rows[listed], rows])
+        chunks.append((ids, rows))
+        return JobIdIndex(chunks)
+
+    def rows(self, job_ids, live):
+        """Listed row of each of ``job_ids``, -1 for IDs that are unknown or deleted
+
+        A job has at most one listed row, so the chunks can be read in any order.
+        """
+        found = np.full(len(job_ids), -1, dtype=np.int64)
+        for ids, rows in self.chunks:
+            positions = ids.get_indexer(job_ids)
+            hits = np.flatnonzero(positions >= 0)
+            hit_rows = rows[positions[hits]]
+            listed = live[hit_rows]
+            found[hits[listed]] = hit_rows[listed]
+        return found
+
+
+class CatalogSnapshot:
+    """One immutable version of the job catalog and every structure derived from it
+
+    ``apply`` never modifies a snapshot: it returns the next version, built
+    by tokenizing only the changed postings and appending them to the arrays
+    of the rest (see the ``merged`` methods of SkillIndex, JobStore,
+    JobFilter and MarketAnalytics). A deleted posting, or the old version of
+    an updated one, stays in place as a tombstone: ``live`` is cleared for
+    its row, so the filter never returns it, and the new version of an
+    updated posting goes last with the appended ones. Once tombstones reach
+    COMPACT_RATIO of the rows the snapshot is compacted (``compacted``).
+    Sessions holding an older snapshot keep reading a consistent catalog.
+    The semantic index and the sharded scorer are built per snapshot on
+    first use.
+    """
+
+    def __init__(self, jobs_df, skill_index, job_store, job_filter, analytics, skill_extractor,
+                 version=0, stats=None, live=None, job_ids=None):
+        self.jobs_df = jobs_df
+        self.skill_index = skill_index
+        self.job_store = job_store
+        self.job_filter = job_filter
+        self.analytics = analytics
+        self.skill_extractor = skill_extractor
+        self.version = version
+        self.stats = stats or {}
+        self.live = np.ones(len(jobs_df), dtype=bool) if live is None else live
+        self.live.setflags(write=False)
+        self.job_ids = JobIdIndex.from_ids(jobs_df[JOB_ID_COLUMN]) if job_ids is None else job_ids
+        self._semantic_index = None
+        self._scorer = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def build(cls, jobs_df, analytics=None, version=0):
+        """Build every structure from a prepared catalog; ``stats['timings']`` has the seconds of each"""
+        timings = {}
+        start = time.perf_counter()
+        built = {}
+        steps = {
+            "skill_index": lambda: SkillIndex.from_catalog(jobs_df),
+            "job_store": lambda: JobStore(jobs_df),
+            "job_filter": lambda: JobFilter(jobs_df),
+            "analytics": lambda: analytics if analytics is not None else MarketAnalytics.from_catalog(jobs_df),
+            "skill_extractor": lambda: SkillExtractor.from_catalog(jobs_df),
+        }
+        for name, step in steps.items():
+            step_start = time.perf_counter()
+            built[name] = step()
+            timings[name] = time.perf_counter() - step_start
+        stats = {"kind": "full", "rows": len(jobs_df), "timings": timings}
+        snapshot = cls(jobs_df, version=version, stats=stats, **built)
+        stats["seconds"] = time.perf_counter() - start
+        stats["bytes"] = snapshot.nbytes()
+        return snapshot
+
+    def __len__(self):
+        return len(self.job_store)
+
+    def job_id(self, row):
+        """Job ID of catalog ``row``"""
+        return self.jobs_df[JOB_ID_COLUMN].iat[row]
+
+    def apply(self, records):
+        """The next snapshot, with delta ``records`` applied; ``stats`` reports what changed"""
+        start = time.perf_counter()
+        changes = consolidate(records)
+        n_old = len(self.jobs_df)
+        raw_columns = [column for column in self.jobs_df.columns if column not in DERIVED_COLUMNS]
+        rows = self.job_ids.rows(list(changes), self.live)
+        # Current values of updated postings, fetched in one gather
+        updated_rows = [row for (op, _), row in zip(changes.values(), rows) if op == "update" and row >= 0]
+        current = iter(self.jobs_df.iloc[updated_rows][raw_columns].to_dict("records"))
+
+        removed, delta_rows = [], []
+        counts = {"appended": 0, "updated": 0, "deleted": 0, "ignored": 0}
+        for (job_id, (op, fields)), row in zip(changes.items(), rows):
+            if op == "delete":
+                if row >= 0:
+                    removed.append(row)
+                counts["deleted" if row >= 0 else "ignored"] += 1
+                continue
+            posting = {}
+            if row >= 0:
+                if op == "update":
+                    posting = next(current)
+                removed.append(row)
+                counts["updated"] += 1
+            else:
+                counts["appended"] += 1
+            delta_rows.append({**posting, **fields, JOB_ID_COLUMN: job_id})
+
+        if delta_rows:
+            delta_df = prepare_catalog(pd.DataFrame(delta_rows, columns=raw_columns))
+            delta_df = delta_df.reindex(columns=self.jobs_df.columns)
+            jobs_df = pd.concat([self.jobs_df, delta_df], ignore_index=True)
+            skill_index = self.skill_index.merged(delta_df)
+        else:
+            # Concatenating an empty delta would turn every column into object dtype
+            delta_df, jobs_df, skill_index = self.jobs_df.iloc[:0], self.jobs_df, self.skill_index
+        live = np.concatenate([self.live, np.ones(len(delta_df), dtype=bool)])
+        live[removed] = False
+        job_ids = self.job_ids.appended(delta_df[JOB_ID_COLUMN], n_old, live) if delta_rows else self.job_ids
+        skill_extractor = self.skill_extractor
+        if len(skill_index.vocabulary) > len(self.skill_index.vocabulary):
+            skill_extractor = SkillExtractor.from_vocabulary(skill_index.vocabulary)
+
+        snapshot = CatalogSnapshot(
+            jobs_df,
+            skill_index,
+            self.job_store.merged(delta_df, live),
+            self.job_filter.merged(delta_df, live),
+            self.analytics.merged(delta_df, live),
+            skill_extractor,
+            version=self.version + 1,
+            live=live,
+            job_ids=job_ids,
+        )
+        tombstones = len(live) - len(snapshot)
+        compact = tombstones > 0 and tombstones >= COMPACT_RATIO * len(live)
+        if compact:
+            snapshot = snapshot.compacted()
+            tombstones = 0
+        snapshot.stats = {
+            "kind": "delta", "records": len(records), "rows": len(snapshot), **counts,
+            "tombstones": tombstones, "compacted": compact,
+        }
+        snapshot.stats["seconds"] = time.perf_counter() - start
+        snapshot.stats["bytes"] = snapshot.nbytes()
+        return snapshot
+
+    def compacted(self):
+        """This version with the tombstoned rows dropped from the catalog and every structure"""
+        rows = np.flatnonzero(self.live)
+        return CatalogSnapshot(
+            self.jobs_df.iloc[rows].reset_index(drop=True),
+            self.skill_index.subset(rows),
+            self.job_store.subset(rows),
+            self.job_filter.subset(rows),
+            self.analytics.subset(rows),
+            self.skill_extractor,
+            version=self.version,
+            stats=self.stats,
+        )
+
+    def semantic_index(self):
+        """Embedding index over this version's skill vocabulary, built on first use"""
+        with self._lock:
+            if self._semantic_index is None:
+                from semantic import SemanticIndex
+
+                self._semantic_index = SemanticIndex(self.skill_index)
+            return self._semantic_index
+
+    def scorer(self):
+        """The skill index itself, or a sharded process pool when MATCH_BACKEND=sharded"""
+        if MATCH_BACKEND != "sharded":
+            return self.skill_index
+        with self._lock:
+            if self._scorer is None:
+                from sharded import ShardedScorer
+
+                self._scorer = ShardedScorer(self.skill_index, MATCH_WORKERS)
+                # Stop the worker pool once no session holds this version any more
+                weakref.finalize(self, self._scorer.close)
+            return self._scorer
+
+    def nbytes(self):
+        """Approximate bytes held by this version's arrays and DataFrame columns"""
+        structures = (self.skill_index, self.job_store, self.job_filter, self.analytics)
+        return int(self.jobs_df.memory_usage(index=False).sum()) + sum(_nbytes(s) for s in structures)
+
+
+class CatalogState:
+    """The live catalog snapshot, swapped atomically as the catalog changes
+
+    ``current`` is replaced in a single assignment once a new version is
+    fully built, so readers never see a half-applied delta. A Streamlit rerun
+    calls ``pin()`` first and reads ``pinned()`` from then on, so all of its
+    stages use one version even if a reload lands mid-run. ``history`` keeps
+    the report (seconds, row counts, bytes, process RSS) of recent reloads.
+    """
+
+    def __init__(self, load_base, delta_path=DELTA_PATH, watch_paths=(), history=20):
+        self.load_base = load_base
+        self.delta_path = delta_path
+        self.watch_paths = tuple(watch_paths)
+        self.history = deque(maxlen=history)
+        self.last_error = None
+        self._offset = 0
+        self._delta_inode = None
+        self._signatures = self._watch_signatures()
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._watcher = None
+        self.current = self._load()
+
+    def _watch_signatures(self):
+        return tuple(
+            os.path.getmtime(path) if os.path.exists(path) else None for path in self.watch_paths
+        )
+
+    def _record(self, snapshot):
+        snapshot.stats.update(version=snapshot.version, rss=_rss_bytes(), timestamp=time.time())
+        self.history.append(snapshot.stats)
+
+    def _load(self):
+        """Build the base catalog and replay the whole delta file over it"""
+        with span("catalog_build"):
+            jobs_df, analytics = self.load_base()
+            version = self.current.version + 1 if hasattr(self, "current") else 0
+            snapshot = CatalogSnapshot.build(jobs_df, analytics, version)
+        self._record(snapshot)
+        self._offset = 0
+        self._delta_inode = None
+        return self._apply_new_deltas(snapshot)
+
+    def _apply_new_deltas(self, snapshot):
+        if not os.path.exists(self.delta_path):
+            return snapshot
+        self._delta_inode = os.stat(self.delta_path).st_ino
+        records, self._offset, skipped = read_deltas(self.delta_path, self._offset)
+        if not records:
+            return snapshot
+        with span("catalog_delta", records=len(records)):
+            snapshot = snapshot.apply(records)
+        snapshot.stats["skipped"] = skipped
+        self._record(snapshot)
+        return snapshot
+
+    def pin(self):
+        """Pin the current snapshot for the calling thread and return it"""
+        self._local.snapshot = self.current
+        return self._local.snapshot
+
+    def pinned(self):
+        """The snapshot pinned by this thread, or the current one"""
+        snapshot = getattr(self._local, "snapshot", None)
+        return self.current if snapshot is None else snapshot
+
+    def reload(self):
+        """Rebuild from the base catalog and the delta file, then swap"""
+        with self._lock:
+            self._signatures = self._watch_signatures()
+            self.current = self._load()
+            return self.current
+
+    def check(self):
+        """Apply new delta lines, or reload fully when the workbook or delta file was replaced"""
+        with self._lock:
+            if self._watch_signatures() != self._signatures:
+                self._signatures = self._watch_signatures()
+                self.current = self._load()
+                return True
+            if not os.path.exists(self.delta_path):
+                return False
+            stat = os.stat(self.delta_path)
+            if (self._delta_inode is not None and stat.st_ino != self._delta_inode) or stat.st_size < self._offset:
+                self.current = self._load()
+                return True
+            if stat.st_size == self._offset:
+                return False
+            snapshot = self._apply_new_deltas(self.current)
+            changed = snapshot is not self.current
+            self.current = snapshot
+            return changed
+
+    def watch(self, interval=WATCH_INTERVAL):
+        """Start the background watcher thread (once); returns it, or None when ``interval`` is 0"""
+        if interval <= 0:
+            return None
+        if self._watcher is None:
+            self._watcher = threading.Thread(target=self._watch, args=(interval,), name="catalog-watcher",
+                                             daemon=True)
+            self._watcher.start()
+        return self._watcher
+
+    def _watch(self, interval):
+        while True:
+            time.sleep(interval)
+            try:
+                self.check()
+                self.last_error = None
+            except Exception as e:
+                # Keep serving the last good snapshot; the next change retries
+                self.last_error = f"{type(e).__name__}: {e}"
+
+
+def main():
+    from analytics import load_analytics
+    from catalog import CATALOG_PATH, SOURCE_PATH, catalog_version, load_catalog
+
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("deltas", nargs="?", default=DELTA_PATH)
+    args = parser.parse_args()
+
+    def load_base():
+        jobs_df = load_catalog(SOURCE_PATH, CATALOG_PATH)
+        return jobs_df, load_analytics(jobs_df, catalog_version(CATALOG_PATH))
+
+    state = CatalogState(load_base, args.deltas)
+    for stats in state.history:
+        keys = ("appended", "updated", "deleted", "ignored", "skipped", "tombstones")
+        counts = ", ".join(f"{stats[key]} {key}" for key in keys if stats.get(key))
+        if stats.get("compacted"):
+            counts += " (compacted)"
+        print(
+            f"v{stats['version']} {stats['kind']:<5} {stats['seconds'] * 1000:9.1f} ms "
+            f"{stats['rows']:>8} rows  {stats['bytes'] / 2 ** 20:7.1f} MiB arrays  "
+            f"{stats['rss'] / 2 ** 20:7.1f} MiB RSS  {counts}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -1,59 +1,53 @@
 import streamlit as st
 import pandas as pd
-import pdfplumber
-import openai
-from difflib import SequenceMatcher
-import plotly.express as px
-import plotly.graph_objects as go
 from collections import Counter
 import os
-from wordcloud import WordCloud
-import matplotlib.pyplot as plt
+import io
+import asyncio
 from dotenv import load_dotenv
+import warmup
+from candidates import content_hash
+from catalog import CATALOG_PATH, SOURCE_PATH
+from extraction import (
+    EXTRACTION_MODES, extract_requirements, extract_requirements_async, extract_skills, extract_skills_async,
+    read_resume_text
+)
+from figure_cache import FigureCache
+from matching import (
+    FIELD_WEIGHTS, SIMILARITY_FLOOR, SKILL_FIELDS, SKILL_VARIATIONS, FuzzyMatcher, matches_from_similarity
+)
+from ranking import match_counts, rank_jobs
+from tracing import profile_call, span, traced, traced_cache, tracer
 
 # Load environment variables from .env file
 load_dotenv()
 
-def extract_requirements_from_text(text):
+# Ranked jobs per page of the results table
+RESULTS_PAGE_SIZE = 25
+
+@traced()
+def extract_requirements_from_text(text, mode="llm"):
     """Extract requirements from custom job description"""
     try:
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[{
-                "role": "user", 
-                "content": f"""
-                Extract all technical requirements from this job description.
-                Include:
-                - Required technical skills
-                - Tools and technologies
-                - Programming languages
-                - Frameworks and platforms
-                
-                Format the output as a comma-separated list like this:
-                Skills: skill1, skill2, skill3
-
-                Job Description:
-                {text}
-                """
-            }],
-            max_tokens=300,
-            temperature=0.0
-        )
-        
-        content = response['choices'][0]['message']['content']
-        for line in content.split('\n'):
-            if line.lower().startswith('skills:'):
-                skills_text = line[7:].strip()
-                skills_list = [skill.strip() for skill in skills_text.split(',')]
-                return [s for s in skills_list if s]
+        return extract_requirements(text, mode, load_skill_extractor(), os.getenv("OPENAI_API_KEY"))
+    except Exception as e:
+        st.error(f"Error extracting requirements: {str(e)}")
         return []
-        
+
+@traced()
+async def extract_requirements_from_text_async(text, client, mode="llm"):
+    """Extract requirements from custom job description without blocking"""
+    try:
+        return await extract_requirements_async(text, client, mode, load_skill_extractor())
     except Exception as e:
         st.error(f"Error extracting requirements: {str(e)}")
         return []
 
+@traced()
 def display_gauge_chart(score):
     """Create a gauge chart for the match score"""
+    import plotly.graph_objects as go
+
     fig = go.Figure(go.Indicator(
         mode = "gauge+number",
         value = score,
@@ -76,104 +70,137 @@ def display_gauge_chart(score):
     return fig
 
 # Load processed jobs data
-@st.cache_data
-def load_job_data():
-    """Load preprocessed job data"""
+@traced_cache("load_catalog_state", st.cache_resource)
+def load_catalog_state():
+    """Live job catalog shared by every session, hot-reloaded by a background watcher"""
+    if not os.path.exists(SOURCE_PATH) and not os.path.exists(CATALOG_PATH):
+        return None
+    # Served from the columnar catalog, rebuilt only when the workbook changes;
+    # already in memory when the server was started through warmup.py
+    return warmup.catalog_state()
+
+@traced_cache("load_similarity_cache", st.cache_resource)
+def load_similarity_cache():
+    """Skill pair similarities shared by every session, matcher and catalog version"""
+    if load_catalog_state() is None:
+        return None
+    # Installs itself into FuzzyMatcher; warm-started from the top catalog skills
+    return warmup.similarity_cache()
+
+def pin_catalog():
+    """Pin the current catalog snapshot so that the whole rerun reads one version"""
     try:
-        # Use relative path instead of absolute path
-        file_path = "processed_jobs.xlsx"  # Ensure this file is in the same directory as your script
-        if not os.path.exists(file_path):
-            st.error(f"File not found at {file_path}")
-            return None
-        df = pd.read_excel(file_path)
-        # Clean Role Level column
-        df['Role Level'] = df['Role Level'].fillna('Not Specified').astype(str)
-        return df
+        state = load_catalog_state()
     except Exception as e:
         st.error(f"Error loading job data: {str(e)}")
         return None
+    return state.pin() if state is not None else None
+
+def catalog_snapshot():
+    """The catalog snapshot pinned for this rerun, or None without a catalog"""
+    try:
+        state = load_catalog_state()
+    except Exception:
+        return None
+    return state.pinned() if state is not None else None
 
-def extract_skills_from_resume(pdf_file, api_key):
+def load_job_data():
+    """Load preprocessed job data"""
+    snapshot = catalog_snapshot()
+    if snapshot is None:
+        st.error(f"File not found at {SOURCE_PATH}")
+        return None
+    return snapshot.jobs_df
+
+def load_skill_index():
+    """Skill index of the pinned catalog version"""
+    snapshot = catalog_snapshot()
+    return snapshot.skill_index if snapshot is not None else None
+
+def load_semantic_index():
+    """Embedding index over the pinned version's skills, built on first use"""
+    snapshot = catalog_snapshot()
+    return snapshot.semantic_index() if snapshot is not None else None
+
+def load_scorer():
+    """Scoring backend chosen by MATCH_BACKEND: the skill index itself or a sharded pool"""
+    snapshot = catalog_snapshot()
+    return snapshot.scorer() if snapshot is not None else None
+
+def load_job_store():
+    """Compact job records of the pinned catalog version"""
+    snapshot = catalog_snapshot()
+    return snapshot.job_store if snapshot is not None else None
+
+def load_job_filter():
+    """Encoded sidebar filter columns of the pinned catalog version"""
+    snapshot = catalog_snapshot()
+    return snapshot.job_filter if snapshot is not None else None
+
+def load_market_analytics():
+    """Catalog-wide skill and category aggregates of the pinned catalog version"""
+    snapshot = catalog_snapshot()
+    return snapshot.analytics if snapshot is not None else None
+
+@traced_cache("load_candidate_pool", st.cache_resource)
+def load_candidate_pool():
+    """Recruiter-mode candidate pool, shared by every session"""
+    return warmup.candidate_pool()
+
+def load_skill_extractor():
+    """Offline skill extractor over the pinned version's vocabulary"""
+    snapshot = catalog_snapshot()
+    return snapshot.skill_extractor if snapshot is not None else None
+
+@traced()
+def extract_skills_from_resume(pdf_file, api_key, mode="llm"):
     """Extract skills from resume using GPT-3.5"""
     try:
         # Read PDF content
-        with pdfplumber.open(pdf_file) as pdf:
-            text = ""
-            for page in pdf.pages:
-                text += page.extract_text()
-
-        # Configure OpenAI
-        openai.api_key = api_key
-        
-        # Create prompt for skills extraction
-        prompt = f"""
-        Find the SKILLS or TECHNICAL SKILLS section in this resume and extract all technical items.
-        
-        Focus on extracting:
-        - Programming languages (e.g., Python, Java)
-        - Database technologies (e.g., SQL, MongoDB)
-        - Tools and software (e.g., Tableau, Excel)
-        - Frameworks and libraries
-        - Technical platforms
-        - Analysis tools
-        
-        Format the output as:
-        SKILLS: skill1, skill2, skill3
-
-        Important:
-        - Only extract skills that are explicitly mentioned
-        - Include ALL technical items listed in the skills section
-        - Separate skills with commas
-        - Keep the exact names as written
-        - Don't add skills not present in the resume
-        
-        Resume text:
-        {text}
-        """
-
-        # Get response from OpenAI
-        response = openai.ChatCompletion.create(
-            model="gpt-3.5-turbo",
-            messages=[{
-                "role": "user", 
-                "content": prompt
-            }],
-            max_tokens=500,
-            temperature=0.0
-        )
+        text = read_resume_text(pdf_file)
+    except Exception as e:
+        st.error(f"Error extracting skills from resume: {str(e)}")
+        return []
+    return extract_skills_from_text(text, api_key, mode)
 
-        # Parse skills from response
-        content = response['choices'][0]['message']['content']
-        skills = []
-        
-        for line in content.split('\n'):
-            if line.lower().startswith('skills:'):
-                # Clean and format skills
-                skills_text = line[7:].strip()
-                skills = [skill.strip() for skill in skills_text.split(',')]
-                # Remove empty strings and duplicates while preserving order
-                skills = list(dict.fromkeys([s for s in skills if s and len(s) > 1]))
-                
-                
-                return skills
-
-        if not skills:  # If no skills were found with the SKILLS: prefix
-            # Try to find any comma-separated list in the response
-            text_chunks = content.split(',')
-            if text_chunks:
-                skills = [chunk.strip() for chunk in text_chunks]
-                skills = list(dict.fromkeys([s for s in skills if s and len(s) > 1]))
-                
-                # Debug output
-                st.write("Debug - Extracted Skills (alternative method):", skills)
-                return skills
-        
+@traced()
+def extract_skills_from_text(text, api_key, mode="llm"):
+    """Extract skills from resume text using GPT-3.5"""
+    try:
+        return extract_skills(text, mode, load_skill_extractor(), api_key)
+    except Exception as e:
+        st.error(f"Error extracting skills from resume: {str(e)}")
         return []
 
+@traced()
+async def extract_skills_from_resume_async(pdf_file, client, mode="llm"):
+    """Extract skills from resume without blocking, reading the PDF in a thread"""
+    try:
+        text = await asyncio.to_thread(read_resume_text, pdf_file)
+        return await extract_skills_async(text, client, mode, load_skill_extractor())
     except Exception as e:
         st.error(f"Error extracting skills from resume: {str(e)}")
         return []
 
+async def extract_custom_match_inputs(job_description, resume_file, mode="llm"):
+    """Run the job description and resume extractions concurrently"""
+    from llm_client import AsyncLLMClient
+
+    async with AsyncLLMClient(os.getenv("OPENAI_API_KEY")) as client:
+        results = await asyncio.gather(
+            extract_requirements_from_text_async(job_description, client, mode),
+            extract_skills_from_resume_async(resume_file, client, mode)
+        )
+    if client.usage["requests"]:
+        tracer.add_tokens(
+            "gpt-3.5-turbo",
+            client.usage["prompt_tokens"],
+            client.usage["completion_tokens"],
+            requests=client.usage["requests"]
+        )
+    return results
+
+@traced()
 def calculate_match(job_requirements: dict, resume_skills: list, threshold: float = 0.8) -> tuple:
     """Calculate match score and identify matching and missing requirements"""
     if not job_requirements or not resume_skills:
@@ -188,33 +215,25 @@ def calculate_match(job_requirements: dict, resume_skills: list, threshold: floa
     
     resume_reqs = [skill.strip().lower() for skill in resume_skills if skill.strip()]
     
-    # Define common variations and related terms
-    skill_variations = {
-        'sql': ['sql', 'database', 'relational database', 'dbms'],
-        'python': ['python', 'python programming'],
-        'data visualization': ['data visualization', 'visualization', 'tableau'],
-        'data analysis': ['data analysis', 'analysis', 'analytics', 'project analytics'],
-        'machine learning': ['machine learning', 'ml', 'deep learning', 'ai'],
-    }
-    
     # Find matches using improved similarity checking
     matched_reqs = []
     for r_skill in resume_reqs:
+        # Ratios come from the process-wide similarity cache when it is installed
+        similarities = FuzzyMatcher.pair_ratios([(r_skill, j_skill) for j_skill in job_reqs])
         # Check for direct matches or variations
-        for j_skill in job_reqs:
+        for j_skill, similarity in zip(job_reqs, similarities):
             # Direct match check
             if r_skill == j_skill:
                 matched_reqs.append(r_skill)
                 continue
                 
             # Check variations
-            for base_skill, variations in skill_variations.items():
+            for base_skill, variations in SKILL_VARIATIONS.items():
                 if r_skill in variations and j_skill in variations:
                     matched_reqs.append(j_skill)
                     break
             
             # If no direct or variation match, check similarity
-            similarity = SequenceMatcher(None, r_skill, j_skill).ratio()
             if similarity >= threshold:
                 matched_reqs.append(j_skill)
     
@@ -233,6 +252,8 @@ def create_wordcloud(requirements):
     """Create a word cloud from technical requirements"""
     if not requirements:
         return None
+    import matplotlib.pyplot as plt
+    from wordcloud import WordCloud
         
     wordcloud = WordCloud(
         width=800,
@@ -247,8 +268,40 @@ def create_wordcloud(requirements):
     ax.axis('off')
     return fig
 
+@traced()
+def create_wordcloud_png(requirements):
+    """Render the word cloud to PNG bytes and close its Matplotlib figure"""
+    fig = create_wordcloud(requirements)
+    if fig is None:
+        return None
+    import matplotlib.pyplot as plt
+
+    buffer = io.BytesIO()
+    try:
+        fig.savefig(buffer, format='png', bbox_inches='tight')
+    finally:
+        plt.close(fig)
+    return buffer.getvalue()
+
+@st.cache_resource
+def get_figure_cache():
+    """Process-wide cache of rendered charts, shared by all sessions"""
+    return FigureCache(max_entries=int(os.getenv("FIGURE_CACHE_MAX_ENTRIES", 64)))
+
+def cached_figure(name, inputs, build):
+    """Return a chart from the figure cache, building it only when its inputs change"""
+    def traced_build():
+        tracer.cache_miss("figure_cache")
+        return build()
+
+    tracer.cache_lookup("figure_cache")
+    return get_figure_cache().get_or_create(name, inputs, traced_build)
+
+@traced()
 def create_match_distribution_chart(match_scores):
     """Create a distribution chart of match scores"""
+    import plotly.express as px
+
     fig = px.histogram(
         match_scores,
         x="Match Score",
@@ -263,20 +316,15 @@ def create_match_distribution_chart(match_scores):
     )
     return fig
 
-def create_top_skills_chart(matches):
-    """Create a chart of most common required skills"""
-    all_skills = []
-    for match in matches:
-        if "All Requirements" in match:
-            skills = [s.strip() for s in str(match["All Requirements"]).split(",")]
-            all_skills.extend(skills)
-    
-    skill_counts = Counter(all_skills).most_common(10)
-    
+@traced()
+def create_top_skills_chart(skill_counts, title="Top 10 Most Required Technical Skills"):
+    """Create a chart of most common required skills from (skill, count) pairs"""
+    import plotly.express as px
+
     fig = px.bar(
         x=[skill[0] for skill in skill_counts],
         y=[skill[1] for skill in skill_counts],
-        title="Top 10 Most Required Technical Skills",
+        title=title,
         labels={"x": "Skill", "y": "Frequency"},
         color_discrete_sequence=['#3366CC']
     )
@@ -286,9 +334,12 @@ def create_top_skills_chart(matches):
     )
     return fig
 
-def create_location_chart(matches):
+@traced()
+def create_location_chart(locations):
     """Create a chart of job locations"""
-    location_counts = Counter([match["Location"] for match in matches]).most_common()
+    import plotly.express as px
+
+    location_counts = Counter(locations).most_common()
     
     fig = px.pie(
         values=[count for _, count in location_counts],
@@ -298,11 +349,126 @@ def create_location_chart(matches):
     )
     return fig
 
-def display_match_results(matches):
-    """Display the match results in a table format"""
-    # Convert matches to a DataFrame for better visualization
-    matches_df = pd.DataFrame(matches)
-    st.dataframe(matches_df)
+# Pipeline stages for the resume tab. Each stage is memoized on its own inputs,
+# so a widget change only reruns the stages downstream of it.
+class NoSkillsExtracted(Exception):
+    """Raised by the skills stage so that empty results are not memoized"""
+
+@traced_cache("resume_text_stage", st.cache_data(max_entries=32, show_spinner=False))
+def resume_text_stage(pdf_bytes):
+    """Stage 1: resume text, keyed by the uploaded file's content"""
+    return read_resume_text(pdf_bytes)
+
+@traced_cache("resume_skills_stage", st.cache_data(max_entries=32, show_spinner=False))
+def resume_skills_stage(resume_text, mode):
+    """Stage 2: skills extracted from the resume text"""
+    skills = extract_skills_from_text(resume_text, os.getenv("OPENAI_API_KEY"), mode)
+    if not skills:
+        raise NoSkillsExtracted()
+    return skills
+
+@traced_cache("similarity_stage", st.cache_data(max_entries=32, show_spinner=False))
+def similarity_stage(resume_skills, mode, version):
+    """Stage 3: resume x vocabulary similarities down to the slider minimum, per catalog version"""
+    if mode == "semantic":
+        return load_semantic_index().similarity_matrix(resume_skills, SIMILARITY_FLOOR)
+    return load_skill_index().matcher(mode).similarity_matrix(resume_skills, SIMILARITY_FLOOR)
+
+@traced_cache("score_stage", st.cache_data(max_entries=64, show_spinner=False))
+def score_stage(resume_skills, mode, threshold, weights, version):
+    """Stage 4: thresholded skill matches and weighted scores for the whole catalog"""
+    skills, matrix = similarity_stage(resume_skills, mode, version)
+    resume_matches = matches_from_similarity(skills, matrix, threshold)
+    return resume_matches, load_scorer().score_all(resume_matches, weights)
+
+@traced()
+def add_candidates(pool, resume_files, mode):
+    """Extract and pool uploaded resumes, skipping those already in the pool"""
+    records = []
+    for resume_file in resume_files:
+        pdf_bytes = resume_file.getvalue()
+        key = content_hash(pdf_bytes)
+        if key in pool:
+            continue
+        try:
+            skills = resume_skills_stage(resume_text_stage(pdf_bytes), mode)
+        except NoSkillsExtracted:
+            st.warning(f"No skills found in {resume_file.name}")
+            continue
+        except Exception as e:
+            st.error(f"Error extracting skills from {resume_file.name}: {str(e)}")
+            continue
+        records.append((key, resume_file.name, skills))
+    return pool.add_many(records)
+
+def display_match_results(job_store, rows, scores, key="results"):
+    """Display ranked jobs as one selectable summary table; returns the selected catalog row
+
+    Only ``rows``/``scores`` (one page of the ranking) are decoded, and the
+    table goes out as a single element instead of an expander per job.
+    """
+    with span("results_table", rows=len(rows)):
+        selection = st.dataframe(
+            job_store.summary(rows, scores),
+            hide_index=True,
+            on_select="rerun",
+            selection_mode="single-row",
+            key=key,
+            column_config={
+                "Match": st.column_config.ProgressColumn("Match", format="%.1f%%", min_value=0, max_value=100)
+            }
+        )
+    selected = selection.selection.rows
+    return int(rows[selected[0]]) if selected else None
+
+def display_match_details(match, job_store, field_weights):
+    """Overview and skill analysis of one selected match"""
+    st.subheader(f"🎯 {match.score:.1f}% Match - {match.title} at {match.company}")
+    # Job Overview
+    st.markdown("### Job Overview")
+    cols = st.columns([2, 1])
+
+    with cols[0]:
+        st.markdown("**Job Description**")
+        # Descriptions are fetched by row only when asked for
+        if st.toggle("Show description", key=f"description_{match.row}"):
+            st.write(job_store.description(match.row))
+
+    with cols[1]:
+        st.markdown("**Company Details**")
+        st.write(f"📍 Location: {match.location}")
+        st.write(f"💼 Role Level: {match.role_level}")
+        st.write(f"⏳ Experience: {match.experience}")
+        if pd.notna(match.salary):
+            st.write(f"💰 Salary: {match.salary}")
+        st.write(f"🏢 Company Size: {match.size}")
+        st.write(f"🏭 Industry: {match.industry}")
+
+    # Skills Analysis
+    st.markdown("""---""")
+    st.markdown("### Skills Analysis")
+    st.write(" · ".join(
+        f"{field}: {field_score:.1f}% (weight {field_weights[field]:g})"
+        for field, (field_score, _, _) in match.breakdown.items()
+    ))
+    skill_cols = st.columns(2)
+
+    with skill_cols[0]:
+        st.markdown("**✅ Matched Requirements**")
+        st.markdown("\n".join(f"- {skill}" for skill in match.matched))
+
+    with skill_cols[1]:
+        if match.missing:
+            st.markdown("**🎯 Skills to Develop**")
+            st.markdown("\n".join(f"- {skill}" for skill in match.missing))
+
+    # Add visual match indicator
+    st.markdown("""---""")
+    progress_cols = st.columns([3, 1])
+    with progress_cols[0]:
+        st.progress(match.score/100)
+    with progress_cols[1]:
+        st.write(f"**{match.score:.1f}%** match")
 
 def main():
     st.set_page_config(
@@ -310,6 +476,10 @@ def main():
         page_icon="🎯",
         layout="wide"
     )
+    # Every stage of this rerun reads the same catalog version, even if a
+    # reload is swapped in meanwhile
+    pin_catalog()
+    load_similarity_cache()
     
     # Custom CSS for header
     st.markdown("""
@@ -342,17 +512,20 @@ def main():
     st.write("Upload your resume to find matching jobs!")
     
     # Create tabs
-    tab1, tab2 = st.tabs(["📋 Resume Job Matcher", "🎯 Custom Job Matcher"])
+    tab1, tab2, tab3 = st.tabs(["📋 Resume Job Matcher", "🎯 Custom Job Matcher", "👥 Recruiter Mode"])
     
     with tab1:
         st.title("AI Resume Matcher")
         st.write("Upload your resume to find matching jobs!")
         
         # Load job data
-        jobs_df = load_job_data()
-        if jobs_df is None:
+        job_store = load_job_store()
+        if job_store is None:
             return
 
+        job_filter = load_job_filter()
+        analytics = load_market_analytics()
+
         # Create single metrics placeholder at the top
         metrics_container = st.empty()
 
@@ -360,7 +533,7 @@ def main():
         with metrics_container.container():
             col1, col2, col3 = st.columns(3)
             with col1:
-                st.metric("Total Jobs Available", len(jobs_df))
+                st.metric("Total Jobs Available", len(job_store))
             with col2:
                 st.metric("Strong Matches (≥50%)", 0)
             with col3:
@@ -376,12 +549,43 @@ def main():
         st.sidebar.subheader("Matching Criteria")
         similarity_threshold = st.sidebar.slider(
             "Skill Matching Threshold", 
-            min_value=0.5, 
+            min_value=SIMILARITY_FLOOR, 
             max_value=1.0, 
             value=0.8,
             help="Minimum similarity score for skills matching"
         )
         
+        extraction_mode = st.sidebar.selectbox(
+            "Skill Extraction",
+            options=list(EXTRACTION_MODES),
+            format_func=EXTRACTION_MODES.get,
+            index=0,
+            help="Local extraction matches the catalog's skill vocabulary without an LLM call"
+        )
+
+        matching_mode = st.sidebar.selectbox(
+            "Fuzzy Matching Engine",
+            options=["compat", "tfidf", "semantic"],
+            index=0,
+            help="compat: same results as the classic similarity check; "
+                 "tfidf: faster character n-gram similarity; "
+                 "semantic: nearest skills in an offline embedding index"
+        )
+
+        # Per-field weights of the combined match score
+        field_weights = {
+            field: st.sidebar.slider(
+                f"{field} Weight",
+                min_value=0.0,
+                max_value=1.0,
+                value=default,
+                step=0.05,
+                help=f"Weight of {field} requirements in the match score; "
+                     "a job that lists no requirements in a field is scored on the others"
+            )
+            for field, default in FIELD_WEIGHTS.items()
+        }
+        
         min_match_score = st.sidebar.slider(
             "Minimum Match Score (%)", 
             min_value=0, 
@@ -392,7 +596,7 @@ def main():
 
         # Location filter
         st.sidebar.subheader("Location Filter")
-        all_locations = sorted(jobs_df['Location'].unique())
+        all_locations = analytics.domain('Location')
         selected_locations = st.sidebar.multiselect(
             "Select Locations",
             all_locations,
@@ -401,7 +605,7 @@ def main():
 
         # Role level filter
         st.sidebar.subheader("Role Level")
-        all_levels = sorted(jobs_df['Role Level'].unique())
+        all_levels = analytics.domain('Role Level')
         selected_levels = st.sidebar.multiselect(
             "Select Role Levels",
             all_levels,
@@ -419,7 +623,7 @@ def main():
 
         # Company size filter
         st.sidebar.subheader("Company Size")
-        all_sizes = sorted(jobs_df['Size'].unique())
+        all_sizes = analytics.domain('Size')
         selected_sizes = st.sidebar.multiselect(
             "Select Company Sizes",
             all_sizes,
@@ -428,7 +632,7 @@ def main():
 
         # Industry filter
         st.sidebar.subheader("Industry")
-        all_industries = sorted(jobs_df['Industry'].unique())
+        all_industries = analytics.domain('Industry')
         selected_industries = st.sidebar.multiselect(
             "Select Industries",
             all_industries,
@@ -439,17 +643,21 @@ def main():
         st.sidebar.subheader("Results Limit")
         n_results = st.sidebar.selectbox(
             "Show Top N Results",
-            options=[10, 20, 30, 50, 100],
+            options=[10, 20, 30, 50, 100, 250, 500],
             index=0,
             help="Limit the number of job matches shown"
         )
 
         if resume_file:
             with st.spinner("Analyzing your resume..."):
-                resume_requirements = extract_skills_from_resume(
-                    resume_file,
-                    os.getenv("OPENAI_API_KEY")
-                )
+                try:
+                    resume_text = resume_text_stage(resume_file.getvalue())
+                    resume_requirements = resume_skills_stage(resume_text, extraction_mode)
+                except NoSkillsExtracted:
+                    resume_requirements = []
+                except Exception as e:
+                    st.error(f"Error extracting skills from resume: {str(e)}")
+                    resume_requirements = []
                 
                 if resume_requirements:
                     # Display technical profile
@@ -461,77 +669,63 @@ def main():
                         st.write(", ".join(resume_requirements))
                     
                     with profile_col2:
-                        wordcloud_fig = create_wordcloud(resume_requirements)
-                        if wordcloud_fig:
-                            st.pyplot(wordcloud_fig)
-
-                    # Calculate matches
-                    matches = []
-                    match_scores = []
-                    
-                    for _, job in jobs_df.iterrows():
-                        # Apply filters
-                        if (selected_locations and job['Location'] not in selected_locations or
-                            selected_levels and job['Role Level'] not in selected_levels or
-                            selected_sizes and job['Size'] not in selected_sizes or
-                            selected_industries and job['Industry'] not in selected_industries):
-                            continue
-
-                        # Check experience requirement
-                        try:
-                            exp_required = float(str(job['Experience Required']).split()[0])
-                            if exp_required > max_exp:
-                                continue
-                        except:
-                            pass
-
-                        score, matched_reqs, missing_reqs = calculate_match(
-                            {
-                                'Technical Skills': job['Technical Skills'],
-                                'Tools': job['Tools']
-                            },
+                        wordcloud_png = cached_figure(
+                            "wordcloud",
                             resume_requirements,
-                            similarity_threshold
+                            lambda: create_wordcloud_png(resume_requirements)
                         )
-                        
-                        match_scores.append({"Match Score": score})
-                        
-                        if score >= min_match_score:
-                            matches.append({
-                                "Job Title": job["Job Title"],
-                                "Company": job["Company Name"],
-                                "Location": job["Location"],
-                                "Match Score": score,
-                                "Matched Requirements": matched_reqs,
-                                "Missing Requirements": missing_reqs,
-                                "All Requirements": f"{job['Technical Skills']}, {job['Tools']}",
-                                "Experience": job["Experience Required"],
-                                "Role Level": job["Role Level"],
-                                "Salary Estimate": job["Salary Estimate"],
-                                "Industry": job["Industry"],
-                                "Size": job["Size"],
-                                "Description": job.get("Job Description", "No description available")
-                            })
-                    
+                        if wordcloud_png:
+                            st.image(wordcloud_png)
+
+                    # Match resume skills against the catalog vocabulary once;
+                    # a threshold change only re-thresholds the cached similarities
+                    skill_index = load_skill_index()
+                    resume_matches, job_scores = score_stage(
+                        resume_requirements,
+                        matching_mode,
+                        similarity_threshold,
+                        field_weights,
+                        catalog_snapshot().version
+                    )
+
+                    # Apply filters as one vectorized mask
+                    with span("filter_jobs"):
+                        filtered_rows = job_filter.rows(
+                            locations=selected_locations,
+                            levels=selected_levels,
+                            sizes=selected_sizes,
+                            industries=selected_industries,
+                            max_exp=max_exp
+                        )
+
+                    # Score filtered jobs as an array and keep only the top N
+                    with span("rank_jobs"):
+                        ranking = rank_jobs(
+                            skill_index,
+                            filtered_rows,
+                            resume_matches,
+                            n_results,
+                            min_match_score,
+                            scores=job_scores
+                        )
+                    match_scores = pd.DataFrame({"Match Score": ranking['all_scores']})
+
                     # Update metrics ONLY ONCE after calculations
-                    matches_above_50 = len([m for m in matches if m["Match Score"] >= 50])
-                    matches_below_50 = len([m for m in matches if m["Match Score"] < 50])
+                    matches_above_50, matches_below_50 = match_counts(
+                        ranking['all_scores'], min_match_score
+                    )
                     
                     # Update the metrics using the same container
                     with metrics_container.container():
                         col1, col2, col3 = st.columns(3)
                         with col1:
-                            st.metric("Total Jobs Available", len(jobs_df))
+                            st.metric("Total Jobs Available", len(job_store))
                         with col2:
                             st.metric("Strong Matches (≥50%)", matches_above_50)
                         with col3:
                             st.metric("Potential Matches (<50%)", matches_below_50)
 
-                    if matches:
-                        # Sort and limit matches
-                        matches.sort(key=lambda x: x["Match Score"], reverse=True)
-                        matches = matches[:n_results]
-                        
+                    if len(ranking['rows']):
                         # Add spacing before results
                         st.markdown("---")
                         
@@ -540,63 +734,69 @@ def main():
                         viz_col1, viz_col2 = st.columns(2)
                         
                         with viz_col1:
-                            st.plotly_chart(create_match_distribution_chart(pd.DataFrame(match_scores)))
-                            st.plotly_chart(create_location_chart(matches))
+                            st.plotly_chart(cached_figure(
+                                "match_distribution",
+                                ranking['all_scores'],
+                                lambda: create_match_distribution_chart(match_scores)
+                            ))
+                            locations = job_store.column("location", ranking['rows'])
+                            st.plotly_chart(cached_figure(
+                                "locations",
+                                locations,
+                                lambda: create_location_chart(locations)
+                            ))
                         
                         with viz_col2:
-                            st.plotly_chart(create_top_skills_chart(matches))
+                            top_skills = job_store.top_requirements(ranking['rows'], 10)
+                            st.plotly_chart(cached_figure(
+                                "top_skills",
+                                top_skills,
+                                lambda: create_top_skills_chart(top_skills)
+                            ))
+                            market_skills = analytics.top_skills(
+                                10,
+                                selections={
+                                    'Location': selected_locations,
+                                    'Role Level': selected_levels,
+                                    'Size': selected_sizes,
+                                    'Industry': selected_industries,
+                                },
+                                rows=filtered_rows
+                            )
+                            st.plotly_chart(cached_figure(
+                                "market_skills",
+                                market_skills,
+                                lambda: create_top_skills_chart(
+                                    market_skills, "Top 10 Skills Across Filtered Jobs"
+                                )
+                            ))
                         
                         # Display matching jobs
                         st.markdown("---")
-                        st.header(f"Found {len(matches)} Matching Jobs")
-                        
-                        for match in matches:
-                            with st.expander(
-                                f"🎯 {match['Match Score']:.1f}% Match - {match['Job Title']} at {match['Company']}"
-                            ):
-                                # Job Overview
-                                st.markdown("""---""")
-                                st.markdown("### Job Overview")
-                                cols = st.columns([2, 1])
-                                
-                                with cols[0]:
-                                    st.markdown("**Job Description**")
-                                    description = match.get('Description', 'No description available')
-                                    st.write(description if description else "No description available")
-                                
-                                with cols[1]:
-                                    st.markdown("**Company Details**")
-                                    st.write(f"📍 Location: {match['Location']}")
-                                    st.write(f"💼 Role Level: {match['Role Level']}")
-                                    st.write(f"⏳ Experience: {match['Experience']}")
-                                    if pd.notna(match['Salary Estimate']):
-                                        st.write(f"💰 Salary: {match['Salary Estimate']}")
-                                    st.write(f"🏢 Company Size: {match['Size']}")
-                                    st.write(f"🏭 Industry: {match['Industry']}")
-                                
-                                # Skills Analysis
-                                st.markdown("""---""")
-                                st.markdown("### Skills Analysis")
-                                skill_cols = st.columns(2)
-                                
-                                with skill_cols[0]:
-                                    st.markdown("**✅ Matched Requirements**")
-                                    for skill in match['Matched Requirements']:
-                                        st.markdown(f"- {skill}")
-                                
-                                with skill_cols[1]:
-                                    if match['Missing Requirements']:
-                                        st.markdown("**🎯 Skills to Develop**")
-                                        for skill in match['Missing Requirements']:
-                                            st.markdown(f"- {skill}")
-                                
-                                # Add visual match indicator
-                                st.markdown("""---""")
-                                progress_cols = st.columns([3, 1])
-                                with progress_cols[0]:
-                                    st.progress(match['Match Score']/100)
-                                with progress_cols[1]:
-                                    st.write(f"**{match['Match Score']:.1f}%** match")
+                        st.header(f"Found {len(ranking['rows'])} Matching Jobs")
+
+                        # Pages are slices of the ranked rows; only the selected
+                        # job's matched/missing breakdown is materialized
+                        n_pages = -(-len(ranking['rows']) // RESULTS_PAGE_SIZE)
+                        page = st.number_input(
+                            f"Page (of {n_pages})", min_value=1, max_value=n_pages, value=1
+                        ) if n_pages > 1 else 1
+                        page_slice = slice((page - 1) * RESULTS_PAGE_SIZE, page * RESULTS_PAGE_SIZE)
+                        st.caption("Select a row to see the job's details and skill analysis.")
+                        selected_row = display_match_results(
+                            job_store,
+                            ranking['rows'][page_slice],
+                            ranking['scores'][page_slice],
+                            key=f"results_page_{page}"
+                        )
+                        if selected_row is not None:
+                            with span("match_details"):
+                                match = job_store.record(
+                                    selected_row,
+                                    *skill_index.match_job(selected_row, resume_matches, field_weights),
+                                    breakdown=skill_index.match_breakdown(selected_row, resume_matches)
+                                )
+                                display_match_details(match, job_store, field_weights)
 
                     else:
                         st.warning(
@@ -617,13 +817,9 @@ def main():
         
         if job_description and custom_resume_file:
             with st.spinner("Analyzing match..."):
-                # Extract requirements from job description
-                job_reqs = extract_requirements_from_text(job_description)
-                
-                # Extract skills from resume
-                resume_skills = extract_skills_from_resume(
-                    custom_resume_file,
-                    os.getenv("OPENAI_API_KEY")
+                # Extract job requirements and resume skills concurrently
+                job_reqs, resume_skills = asyncio.run(
+                    extract_custom_match_inputs(job_description, custom_resume_file, extraction_mode)
                 )
                 
                 if resume_skills and job_reqs:
@@ -639,7 +835,9 @@ def main():
                     
                     with col1:
                         st.subheader("Match Analysis")
-                        gauge_chart = display_gauge_chart(match_score)
+                        gauge_chart = cached_figure(
+                            "gauge", match_score, lambda: display_gauge_chart(match_score)
+                        )
                         st.plotly_chart(gauge_chart)
                         
                     with col2:
@@ -650,5 +848,148 @@ def main():
                             st.write("🎯 Skills to Develop:")
                             st.write(", ".join(missing_reqs))
 
+    with tab3:
+        st.title("Recruiter Mode")
+        st.write("👥 Rank the stored candidate pool against a catalog job or a pasted job description.")
+
+        pool = load_candidate_pool()
+        pool_files = st.file_uploader(
+            "Add Resumes to the Pool (PDF)", type="pdf", accept_multiple_files=True, key="candidate_pool"
+        )
+        if pool_files:
+            with st.spinner("Adding resumes..."):
+                added = add_candidates(pool, pool_files, extraction_mode)
+            if added:
+                st.success(f"Added {added} resumes to the pool")
+        st.caption(f"{len(pool)} candidates in the pool")
+
+        job_source = st.radio("Job", ["Select from catalog", "Paste description"], horizontal=True)
+        if job_source == "Select from catalog":
+            jobs_df = load_job_data()
+
+            def job_label(row):
+                job = job_store.metadata(row)
+                return f"{job['title']} — {job['company']} ({job['location']})"
+
+            job_row = st.selectbox("Job Posting", job_store.rows().tolist(), format_func=job_label)
+            job_requirements = {
+                field: list(jobs_df[column].iloc[job_row]) for field, column in SKILL_FIELDS.items()
+            }
+        else:
+            recruiter_description = st.text_area(
+                "Paste Job Description",
+                height=200,
+                placeholder="Paste the complete job description here...",
+                key="recruiter_description"
+            )
+            job_requirements = {}
+            if recruiter_description:
+                job_requirements = {
+                    'Technical Skills': extract_requirements_from_text(recruiter_description, extraction_mode)
+                }
+
+        if len(pool) and any(job_requirements.values()):
+            # The pool has no embedding index; semantic matching falls back to compat
+            recruiter_mode = matching_mode if matching_mode != "semantic" else "compat"
+            with span("rank_candidates", candidates=len(pool)):
+                candidates = pool.rank(
+                    job_requirements, similarity_threshold, recruiter_mode, field_weights, n_results
+                )
+            if candidates:
+                st.header(f"Top {len(candidates)} Candidates")
+                st.dataframe(pd.DataFrame([
+                    {
+                        "Candidate": candidate["name"],
+                        "Score": round(candidate["score"], 1),
+                        "Matched": ", ".join(candidate["matched"]),
+                        "Missing": ", ".join(candidate["missing"]),
+                    }
+                    for candidate in candidates
+                ]), hide_index=True)
+            else:
+                st.warning("No candidate in the pool matches this job's requirements.")
+
+def show_performance_panel():
+    """Opt-in sidebar panel with the spans of this rerun and process-wide totals"""
+    if not st.sidebar.checkbox("Show performance panel", value=False):
+        return
+    with st.sidebar.expander("Performance", expanded=True):
+        events = tracer.run_events()
+        if events:
+            st.markdown("**This rerun**")
+            st.dataframe(pd.DataFrame(
+                [{"Span": e["name"], "ms": round(e["seconds"] * 1000, 2)} for e in events]
+            ), hide_index=True)
+
+        snapshot = tracer.snapshot()
+        st.markdown("**Since server start**")
+        st.dataframe(pd.DataFrame([
+            {
+                "Span": name,
+                "Calls": stats["count"],
+                "Total ms": round(stats["total"] * 1000, 1),
+                "Mean ms": round(stats["total"] / stats["count"] * 1000, 2),
+                "Max ms": round(stats["max"] * 1000, 1),
+            }
+            for name, stats in sorted(snapshot["spans"].items(), key=lambda item: -item[1]["total"])
+        ]), hide_index=True)
+        if snapshot["caches"]:
+            st.dataframe(pd.DataFrame([
+                {"Cache": name, "Hits": stats["hits"], "Misses": stats["misses"]}
+                for name, stats in snapshot["caches"].items()
+            ]), hide_index=True)
+        for model, usage in snapshot["tokens"].items():
+            st.write(
+                f"{model}: {usage['requests']} requests, {usage['prompt_tokens']} prompt + "
+                f"{usage['completion_tokens']} completion tokens"
+            )
+
+        similarities = load_similarity_cache()
+        if similarities is not None:
+            stats = similarities.stats()
+            st.markdown(
+                f"**Similarity cache**: {stats['hit_ratio']:.1%} hits "
+                f"({stats['hits']} of {stats['hits'] + stats['misses']} lookups), "
+                f"{stats['entries']} / {stats['max_entries']} pairs, ~{stats['bytes'] / 2 ** 20:.1f} MiB"
+            )
+
+        state = load_catalog_state()
+        if state is not None:
+            st.markdown(f"**Catalog version {state.current.version}** ({len(state.current)} jobs)")
+            if state.last_error:
+                st.warning(f"Last catalog reload failed: {state.last_error}")
+            st.dataframe(pd.DataFrame([
+                {
+                    "Version": stats["version"],
+                    "Kind": stats["kind"],
+                    "Records": stats.get("records"),
+                    "Rows": stats["rows"],
+                    "ms": round(stats["seconds"] * 1000, 1),
+                    "Arrays MiB": round(stats["bytes"] / 2 ** 20, 1),
+                    "RSS MiB": round(stats["rss"] / 2 ** 20, 1),
+                }
+                for stats in reversed(state.history)
+            ]), hide_index=True)
+
+        st.download_button("Export spans (JSONL)", tracer.to_jsonl(), "spans.jsonl", "application/json")
+        st.download_button("Export metrics (Prometheus)", tracer.to_prometheus(), "metrics.prom", "text/plain")
+
+        if st.button("Profile next rerun"):
+            st.session_state["profile_next_run"] = True
+            st.rerun()
+        if "profile_report" in st.session_state:
+            st.download_button("Download profile", st.session_state["profile_report"], "profile.txt", "text/plain")
+            st.code(st.session_state["profile_report"][:20000])
+
+def run():
+    """Run the app once, tracing the rerun and profiling it when requested"""
+    tracer.start_run()
+    with span("rerun"):
+        if st.session_state.pop("profile_next_run", False):
+            _, st.session_state["profile_report"] = profile_call(main)
+        else:
+            main()
+    show_performance_panel()
+
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    run()
\ No newline at end of file
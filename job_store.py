@@ -0,0 +1,217 @@
+import copy
+import sys
+
+import numpy as np
+import pandas as pd
+
+from matching import split_skills
+
+# JobRecord field -> catalog column, for the per-job metadata shown with a match
+METADATA_COLUMNS = {
+    "title": "Job Title",
+    "company": "Company Name",
+    "location": "Location",
+    "experience": "Experience Required",
+    "role_level": "Role Level",
+    "salary": "Salary Estimate",
+    "industry": "Industry",
+    "size": "Size",
+}
+
+NO_DESCRIPTION = "No description available"
+
+
+def _intern(value):
+    return sys.intern(value) if isinstance(value, str) else value
+
+
+def requirement_tokens(technical_skills, tools):
+    """The job's requirements from both columns, normalized like ``normalize_skills``
+
+    Missing cells contribute nothing, so no literal ``"nan"`` requirement.
+    """
+    return split_skills(technical_skills) + split_skills(tools)
+
+
+class JobRecord:
+    """A displayed match: one catalog row with its score and skill breakdown
+
+    Metadata values are the store's interned strings and ``requirement_ids``
+    is a view into the store's int32 requirement array, so a record owns
+    little beyond its matched/missing lists.
+    """
+
+    __slots__ = ("row", *METADATA_COLUMNS, "score", "matched", "missing", "breakdown", "requirement_ids")
+
+    def __init__(self, row, score, matched, missing, requirement_ids, breakdown=None, **metadata):
+        self.row = row
+        self.score = score
+        self.matched = matched
+        self.missing = missing
+        self.breakdown = breakdown
+        self.requirement_ids = requirement_ids
+        for field, value in metadata.items():
+            setattr(self, field, value)
+
+
+class JobStore:
+    """Compact, read-only job catalog shared by every session
+
+    Metadata columns are factorized into a NumPy structured array of int32
+    codes over interned category strings, and the combined requirements
+    (``Technical Skills`` then ``Tools``) are int32 ids into an interned
+    vocabulary, stored in CSR form. Descriptions stay in a single object array
+    and are only read, by row, when a result asks for them.
+    """
+
+    def __init__(self, jobs_df):
+        self.n_jobs = len(jobs_df)
+        self.categories = {field: [] for field in METADATA_COLUMNS}
+        self._category_ids = {field: {} for field in METADATA_COLUMNS}
+        self.requirements = []
+        self._requirement_ids = {}
+        self.codes, self.indptr, self.indices = self._encode(jobs_df)
+        # Rows still listed; a catalog delta clears the rows it deletes or replaces
+        self.live = np.ones(self.n_jobs, dtype=bool)
+        if "Job Description" in jobs_df:
+            self._descriptions = jobs_df["Job Description"].to_numpy(dtype=object)
+        else:
+            self._descriptions = None
+
+    def _encode(self, jobs_df):
+        """Codes and requirement CSR of ``jobs_df``, extending the interned vocabularies"""
+        codes = np.empty(len(jobs_df), dtype=[(field, np.int32) for field in METADATA_COLUMNS])
+        for field, column in METADATA_COLUMNS.items():
+            local_codes, uniques = pd.factorize(jobs_df[column])
+            category_ids = self._category_ids[field]
+            mapping = np.empty(len(uniques) + 1, dtype=np.int32)
+            mapping[-1] = -1  # factorize marks missing values with -1
+            for i, value in enumerate(uniques):
+                if value not in category_ids:
+                    category_ids[value] = len(self.categories[field])
+                    self.categories[field].append(_intern(value))
+                mapping[i] = category_ids[value]
+            codes[field] = mapping[local_codes]
+
+        indptr = [0]
+        indices = []
+        for technical_skills, tools in zip(jobs_df["Technical Skills"], jobs_df["Tools"]):
+            for token in requirement_tokens(technical_skills, tools):
+                if token not in self._requirement_ids:
+                    self._requirement_ids[token] = len(self.requirements)
+                    self.requirements.append(sys.intern(token))
+                indices.append(self._requirement_ids[token])
+            indptr.append(len(indices))
+        return codes, np.asarray(indptr, dtype=np.int64), np.asarray(indices, dtype=np.int32)
+
+    def merged(self, delta_df, live):
+        """New store with ``delta_df``'s jobs appended and ``live`` as the mask of listed rows
+
+        Only the delta postings are encoded and every array is extended by
+        concatenation; the vocabularies are copied and extended, so this
+        store is left untouched. Rows cleared in ``live`` (deleted or
+        replaced postings) stay in the arrays as tombstones.
+        """
+        store = copy.copy(self)
+        store.categories = {field: list(values) for field, values in self.categories.items()}
+        store._category_ids = {field: dict(ids) for field, ids in self._category_ids.items()}
+        store.requirements = list(self.requirements)
+        store._requirement_ids = dict(self._requirement_ids)
+        codes, indptr, indices = store._encode(delta_df)
+
+        store.indptr = np.concatenate([self.indptr, indptr[1:] + self.indptr[-1]])
+        store.indices = np.concatenate([self.indices, indices])
+        # As raw records: NumPy concatenates structured arrays field by field, several times slower
+        store.codes = np.concatenate([self.codes.view(np.void), codes.view(np.void)]).view(self.codes.dtype)
+        store.n_jobs = self.n_jobs + len(delta_df)
+        store.live = live
+        if self._descriptions is not None and "Job Description" in delta_df:
+            descriptions = delta_df["Job Description"].to_numpy(dtype=object)
+            store._descriptions = np.concatenate([self._descriptions, descriptions])
+        else:
+            store._descriptions = None
+        return store
+
+    def subset(self, rows):
+        """New store over ``rows`` of this one, in that order; compacts away removed rows"""
+        rows = np.asarray(rows, dtype=np.int64)
+        store = copy.copy(self)
+        lengths = np.diff(self.indptr)[rows]
+        store.indptr = np.concatenate([[0], np.cumsum(lengths)])
+        positions = np.repeat(self.indptr[rows] - store.indptr[:-1], lengths) + np.arange(store.indptr[-1])
+        store.indices = self.indices[positions]
+        store.codes = self.codes[rows]
+        store.n_jobs = len(rows)
+        store.live = np.ones(len(rows), dtype=bool)
+        if self._descriptions is not None:
+            store._descriptions = self._descriptions[rows]
+        return store
+
+    def __len__(self):
+        """Number of jobs listed, tombstoned rows excluded"""
+        return int(np.count_nonzero(self.live))
+
+    def rows(self):
+        """Catalog rows of the jobs listed"""
+        return np.flatnonzero(self.live)
+
+    def metadata(self, row):
+        """Decoded metadata of one job as ``{field: value}`` (NaN where missing)"""
+        values = {}
+        for field in METADATA_COLUMNS:
+            code = self.codes[field][row]
+            values[field] = self.categories[field][code] if code >= 0 else np.nan
+        return values
+
+    def column(self, field, rows):
+        """Decoded values of one metadata field for ``rows`` (NaN where missing)"""
+        categories = self.categories[field]
+        return [categories[code] if code >= 0 else np.nan for code in self.codes[field][rows].tolist()]
+
+    def summary(self, rows, scores):
+        """One-line-per-job DataFrame of ``rows`` with their ``scores``, for the results table"""
+        rows = np.asarray(rows, dtype=np.int64)
+        return pd.DataFrame({
+            "Match": np.asarray(scores, dtype=float),
+            "Job Title": self.column("title", rows),
+            "Company": self.column("company", rows),
+            "Location": self.column("location", rows),
+            "Role Level": self.column("role_level", rows),
+            "Experience": self.column("experience", rows),
+        })
+
+    def requirement_ids(self, row):
+        return self.indices[self.indptr[row]:self.indptr[row + 1]]
+
+    def requirement_names(self, ids):
+        return [self.requirements[i] for i in ids]
+
+    def record(self, row, score, matched, missing, breakdown=None):
+        """A JobRecord for catalog ``row`` with the given match details
+
+        ``breakdown`` is the optional per-field ``{field: (score, matched, missing)}``.
+        """
+        return JobRecord(
+            int(row), score, matched, missing, self.requirement_ids(row), breakdown, **self.metadata(row)
+        )
+
+    def description(self, row):
+        """Job description text for ``row``, read only when a result is expanded"""
+        if self._descriptions is None:
+            return NO_DESCRIPTION
+        description = self._descriptions[row]
+        return description if isinstance(description, str) and description else NO_DESCRIPTION
+
+    def top_requirements(self, rows, n=10):
+        """The ``n`` most frequent requirements over ``rows`` as ``(name, count)`` pairs
+
+        Ties keep first-seen order, the same as ``Counter.most_common``.
+        """
+        if len(rows) == 0:
+            return []
+        ids = np.concatenate([self.requirement_ids(row) for row in rows])
+        if len(ids) == 0:
+            return []
+        unique, first_seen, counts = np.unique(ids, return_index=True, return_counts=True)
+        order = np.lexsort((first_seen, -counts))[:n]
+        return [(self.requirements[unique[i]], int(counts[i])) for i in order]
@@ -0,0 +1,150 @@
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+DEFAULT_CACHE_PATH = os.path.join(".cache", "llm_cache.sqlite")
+
+
+class LLMCache:
+    """Persistent, content-addressed cache for LLM completions
+
+    Entries are keyed by a hash of the input text, the prompt template and the
+    model parameters, and live in a SQLite file so they survive reruns and
+    restarts. Expired entries (older than ``ttl`` seconds) are dropped on read
+    and the least recently used entries are evicted once the cache grows past
+    ``max_entries`` or ``max_bytes``. With ``bypass`` set, every lookup misses
+    and nothing is stored.
+    """
+
+    def __init__(self, path=DEFAULT_CACHE_PATH, max_entries=5000, max_bytes=50 * 1024 * 1024,
+                 ttl=30 * 24 * 3600, bypass=False):
+        self.path = path
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.bypass = bypass
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        with self._connect() as conn:
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS completions (
+                    key TEXT PRIMARY KEY,
+                    value TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_accessed ON completions (accessed_at)")
+
+    @classmethod
+    def from_env(cls):
+        """Build a cache configured through LLM_CACHE_* environment variables"""
+        return cls(
+            path=os.getenv("LLM_CACHE_PATH", DEFAULT_CACHE_PATH),
+            max_entries=int(os.getenv("LLM_CACHE_MAX_ENTRIES", 5000)),
+            max_bytes=int(os.getenv("LLM_CACHE_MAX_BYTES", 50 * 1024 * 1024)),
+            ttl=float(os.getenv("LLM_CACHE_TTL", 30 * 24 * 3600)),
+            bypass=os.getenv("LLM_CACHE_BYPASS", "").lower() in ("1", "true", "yes"),
+        )
+
+    @staticmethod
+    def key(text, prompt_template, model, temperature, **params):
+        """Content hash identifying one completion request"""
+        payload = json.dumps(
+            {"text": text, "prompt": prompt_template, "model": model,
+             "temperature": temperature, "params": params},
+            sort_keys=True
+        )
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    @contextmanager
+    def _connect(self):
+        conn = sqlite3.connect(self.path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    def get(self, key):
+        """Return the cached completion for a key, or None on a miss"""
+        if self.bypass:
+            self.misses += 1
+            return None
+
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT value, created_at FROM completions WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and now - row[1] > self.ttl:
+                conn.execute("DELETE FROM completions WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self.misses += 1
+                return None
+            conn.execute("UPDATE completions SET accessed_at = ? WHERE key = ?", (now, key))
+            self.hits += 1
+            return row[0]
+
+    def put(self, key, value):
+        """Store a completion and evict expired or least recently used entries"""
+        if self.bypass:
+            return
+
+        now = time.time()
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO completions VALUES (?, ?, ?, ?, ?)",
+                (key, value, len(value.encode("utf-8")), now, now)
+            )
+            conn.execute("DELETE FROM completions WHERE created_at < ?", (now - self.ttl,))
+            self._evict(conn)
+
+    def _evict(self, conn):
+        count, total = conn.execute(
+            "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM completions"
+        ).fetchone()
+        if count <= self.max_entries and total <= self.max_bytes:
+            return
+        rows = conn.execute(
+            "SELECT key, size FROM completions ORDER BY accessed_at ASC"
+        ).fetchall()
+        evicted = []
+        for key, size in rows:
+            if count <= self.max_entries and total <= self.max_bytes:
+                break
+            evicted.append((key,))
+            count -= 1
+            total -= size
+        conn.executemany("DELETE FROM completions WHERE key = ?", evicted)
+
+    def clear(self):
+        """Remove every cached completion"""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM completions")
+
+    def stats(self):
+        """Hit/miss counters and current size of the cache"""
+        with self._connect() as conn:
+            count, total = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM completions"
+            ).fetchone()
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": count,
+            "bytes": total,
+            "bypass": self.bypass,
+        }
@@ -0,0 +1,123 @@
+import asyncio
+import os
+import random
+import time
+
+import aiohttp
+
+DEFAULT_BASE_URL = "https://api.openai.com/v1"
+RETRY_STATUSES = {429, 500, 502, 503, 504}
+
+
+class LLMError(Exception):
+    """Raised when a completion request fails after all retries"""
+
+
+class TokenBucket:
+    """Async token bucket: ``rate`` requests per second with bursts up to ``capacity``"""
+
+    def __init__(self, rate, capacity=None):
+        self.rate = rate
+        self.capacity = capacity or max(1, int(rate))
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+                await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+class AsyncLLMClient:
+    """Asyncio chat-completion client with a pooled HTTP session
+
+    Concurrency is capped by a semaphore (and the connector's pool size),
+    request starts are paced by a token bucket, and rate-limit/server errors
+    are retried with exponential backoff and jitter; any other failure (a
+    4xx status, an unreadable body) raises ``LLMError`` at once. The API key is passed per
+    client rather than set on the global ``openai`` module. Point ``base_url``
+    (or ``OPENAI_BASE_URL``) at ``llm_stub.py`` to run offline.
+
+    Use as an async context manager::
+
+        async with AsyncLLMClient(api_key) as client:
+            contents = await client.complete_many(prompts)
+    """
+
+    def __init__(self, api_key=None, base_url=None, max_concurrency=8, requests_per_second=10.0,
+                 max_retries=5, backoff=0.5, timeout=60):
+        self.api_key = api_key or os.getenv("OPENAI_API_KEY", "")
+        self.base_url = (base_url or os.getenv("OPENAI_BASE_URL", DEFAULT_BASE_URL)).rstrip("/")
+        self.max_concurrency = max_concurrency
+        self.max_retries = max_retries
+        self.backoff = backoff
+        self.timeout = aiohttp.ClientTimeout(total=timeout)
+        self.bucket = TokenBucket(requests_per_second)
+        self.semaphore = asyncio.Semaphore(max_concurrency)
+        self.session = None
+        self.usage = {"requests": 0, "retries": 0, "prompt_tokens": 0, "completion_tokens": 0}
+
+    async def __aenter__(self):
+        connector = aiohttp.TCPConnector(limit=self.max_concurrency)
+        self.session = aiohttp.ClientSession(
+            connector=connector,
+            timeout=self.timeout,
+            headers={"Authorization": f"Bearer {self.api_key}"}
+        )
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.session.close()
+        self.session = None
+
+    async def complete(self, prompt, model="gpt-3.5-turbo", max_tokens=500, temperature=0.0):
+        """Return the message content of one chat completion"""
+        payload = {
+            "model": model,
+            "messages": [{"role": "user", "content": prompt}],
+            "max_tokens": max_tokens,
+            "temperature": temperature,
+        }
+        async with self.semaphore:
+            for attempt in range(self.max_retries + 1):
+                await self.bucket.acquire()
+                try:
+                    async with self.session.post(f"{self.base_url}/chat/completions", json=payload) as response:
+                        if response.status in RETRY_STATUSES:
+                            error = LLMError(f"HTTP {response.status} from completion endpoint")
+                        elif response.status >= 400:
+                            # Bad key, bad request and the like: retrying cannot help
+                            detail = (await response.text())[:200]
+                            raise LLMError(f"HTTP {response.status} from completion endpoint: {detail}")
+                        else:
+                            try:
+                                body = await response.json()
+                                content = body["choices"][0]["message"]["content"]
+                            except (aiohttp.ContentTypeError, ValueError, KeyError, IndexError, TypeError) as e:
+                                raise LLMError(f"Malformed completion response: {type(e).__name__}: {e}")
+                            self._record_usage(body)
+                            return content
+                except (aiohttp.ClientConnectionError, asyncio.TimeoutError) as e:
+                    error = LLMError(str(e) or type(e).__name__)
+
+                if attempt < self.max_retries:
+                    self.usage["retries"] += 1
+                    await asyncio.sleep(self.backoff * 2 ** attempt * (0.5 + random.random()))
+            raise error
+
+    async def complete_many(self, prompts, **params):
+        """Run several completions concurrently, preserving order"""
+        return await asyncio.gather(*(self.complete(prompt, **params) for prompt in prompts))
+
+    def _record_usage(self, body):
+        self.usage["requests"] += 1
+        usage = body.get("usage") or {}
+        self.usage["prompt_tokens"] += usage.get("prompt_tokens", 0)
+        self.usage["completion_tokens"] += usage.get("completion_tokens", 0)
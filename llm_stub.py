@@ -0,0 +1,78 @@
+"""Deterministic local stand-in for the chat-completions API
+
+Usage:
+    python llm_stub.py [--port 8089] [--latency 0.2] [--fail-every 0]
+
+Then point the app at it with OPENAI_BASE_URL=http://127.0.0.1:8089/v1.
+Responses list the known skills found in the prompt's input text, in the
+same ``Skills: a, b, c`` format the extraction prompts ask for, so latency
+and throughput can be measured offline and results are reproducible.
+"""
+import argparse
+import asyncio
+import re
+
+from aiohttp import web
+
+KNOWN_SKILLS = [
+    "Python", "R", "SQL", "SAS", "Java", "Scala", "C++", "JavaScript", "Tableau", "Excel",
+    "Power BI", "Looker", "Spark", "Hadoop", "Hive", "AWS", "Azure", "GCP", "Docker",
+    "Kubernetes", "TensorFlow", "PyTorch", "scikit-learn", "Pandas", "NumPy", "Git",
+    "machine learning", "deep learning", "statistics", "data visualization", "NLP",
+]
+INPUT_MARKERS = ("Resume text:", "Job Description:")
+
+
+def fake_completion(prompt):
+    """Skills mentioned in the input part of a prompt, in a stable order"""
+    text = prompt
+    for marker in INPUT_MARKERS:
+        if marker in prompt:
+            text = prompt.split(marker, 1)[1]
+    found = [
+        skill for skill in KNOWN_SKILLS
+        if re.search(rf"(?<![\w+]){re.escape(skill)}(?![\w+])", text, re.IGNORECASE)
+    ]
+    return "Skills: " + ", ".join(found)
+
+
+def create_app(latency=0.2, fail_every=0):
+    """Build the stub app; every ``fail_every``-th request answers 429"""
+    state = {"requests": 0}
+
+    async def chat_completions(request):
+        state["requests"] += 1
+        body = await request.json()
+        await asyncio.sleep(latency)
+        if fail_every and state["requests"] % fail_every == 0:
+            return web.json_response({"error": {"message": "rate limited"}}, status=429)
+
+        prompt = body["messages"][-1]["content"]
+        content = fake_completion(prompt)
+        return web.json_response({
+            "id": f"stub-{state['requests']}",
+            "object": "chat.completion",
+            "model": body.get("model", "stub"),
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content},
+                         "finish_reason": "stop"}],
+            "usage": {"prompt_tokens": len(prompt.split()), "completion_tokens": len(content.split())},
+        })
+
+    app = web.Application()
+    app.router.add_post("/v1/chat/completions", chat_completions)
+    app["state"] = state
+    return app
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8089)
+    parser.add_argument("--latency", type=float, default=0.2, help="seconds per response")
+    parser.add_argument("--fail-every", type=int, default=0, help="answer every Nth request with 429")
+    args = parser.parse_args()
+    web.run_app(create_app(args.latency, args.fail_every), host=args.host, port=args.port)
+
+
+if __name__ == "__main__":
+    main()
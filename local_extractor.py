@@ -0,0 +1,107 @@
+from collections import deque
+
+from matching import SKILL_VARIATIONS
+
+
+def _is_word_char(char):
+    return char.isalnum() or char in "+#"
+
+
+class SkillExtractor:
+    """Offline skill extractor: an Aho-Corasick automaton over the skill vocabulary
+
+    The automaton is built once from the catalog's ``Technical Skills`` and
+    ``Tools`` vocabulary plus the ``SKILL_VARIATIONS`` synonyms, and scans a
+    lowercased text in a single pass. Matches must sit on word boundaries,
+    overlapping matches resolve to the leftmost-longest one, and single-letter
+    skills such as ``R`` or ``C`` only count when written in upper case.
+    """
+
+    def __init__(self, skills):
+        self.patterns = []
+        self.goto = [{}]
+        self.fail = [0]
+        self.output = [[]]
+
+        seen = set()
+        for skill in skills:
+            skill = skill.strip().lower()
+            if skill and skill not in seen:
+                seen.add(skill)
+                self._add(skill)
+        self._build_failure_links()
+
+    @classmethod
+    def from_catalog(cls, jobs_df):
+        """Build the extractor from a catalog with pre-split skill/tool lists"""
+        vocabulary = []
+        for column in ('skills_list', 'tools_list'):
+            for skills in jobs_df[column]:
+                vocabulary.extend(skills)
+        return cls.from_vocabulary(vocabulary)
+
+    @classmethod
+    def from_vocabulary(cls, vocabulary):
+        """Build the extractor from a skill vocabulary plus the SKILL_VARIATIONS synonyms"""
+        vocabulary = list(vocabulary)
+        for variations in SKILL_VARIATIONS.values():
+            vocabulary.extend(variations)
+        return cls(vocabulary)
+
+    def _add(self, skill):
+        state = 0
+        for char in skill:
+            if char not in self.goto[state]:
+                self.goto.append({})
+                self.fail.append(0)
+                self.output.append([])
+                self.goto[state][char] = len(self.goto) - 1
+            state = self.goto[state][char]
+        self.output[state].append(len(self.patterns))
+        self.patterns.append(skill)
+
+    def _build_failure_links(self):
+        queue = deque(self.goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self.goto[state].items():
+                queue.append(child)
+                fallback = self.fail[state]
+                while fallback and char not in self.goto[fallback]:
+                    fallback = self.fail[fallback]
+                self.fail[child] = self.goto[fallback].get(char, 0)
+                self.output[child] = self.output[child] + self.output[self.fail[child]]
+
+    def find_all(self, text):
+        """Yield ``(start, end, skill)`` for every boundary-respecting match"""
+        lowered = text.lower()
+        if len(lowered) != len(text):
+            # Lowercasing changed offsets; fall back to the lowered text for case checks
+            text = lowered
+        state = 0
+        for end, char in enumerate(lowered, 1):
+            while state and char not in self.goto[state]:
+                state = self.fail[state]
+            state = self.goto[state].get(char, 0)
+            for pattern_id in self.output[state]:
+                skill = self.patterns[pattern_id]
+                start = end - len(skill)
+                if start > 0 and _is_word_char(lowered[start - 1]) and _is_word_char(skill[0]):
+                    continue
+                if end < len(lowered) and _is_word_char(lowered[end]) and _is_word_char(skill[-1]):
+                    continue
+                if len(skill) == 1 and not text[start].isupper():
+                    continue
+                yield start, end, skill
+
+    def extract(self, text):
+        """Skills found in the text, leftmost-longest, in order of first appearance"""
+        matches = sorted(self.find_all(text), key=lambda m: (m[0], -(m[1] - m[0])))
+        skills = []
+        covered_until = 0
+        for start, end, skill in matches:
+            if start < covered_until:
+                continue
+            skills.append(skill)
+            covered_until = end
+        return list(dict.fromkeys(skills))
@@ -0,0 +1,557 @@
+import copy
+import threading
+from collections import OrderedDict
+from difflib import SequenceMatcher
+
+import numpy as np
+from scipy import sparse
+
+# Define common variations and related terms
+SKILL_VARIATIONS = {
+    'sql': ['sql', 'database', 'relational database', 'dbms'],
+    'python': ['python', 'python programming'],
+    'data visualization': ['data visualization', 'visualization', 'tableau'],
+    'data analysis': ['data analysis', 'analysis', 'analytics', 'project analytics'],
+    'machine learning': ['machine learning', 'ml', 'deep learning', 'ai'],
+}
+
+
+# Requirement fields scored by the SkillIndex -> prepared catalog column
+SKILL_FIELDS = {
+    'Technical Skills': 'skills_list',
+    'Tools': 'tools_list',
+}
+# Default weight of each field in the combined match score
+FIELD_WEIGHTS = {
+    'Technical Skills': 1.0,
+    'Tools': 0.5,
+}
+# Lowest value of the similarity threshold slider; similarities below it are never stored
+SIMILARITY_FLOOR = 0.5
+# Catalog rows combined at a time when scoring a batch of resumes
+SCORE_BLOCK_ROWS = 1024
+# (resume skill, threshold) results kept per matcher, least recently used evicted first
+MATCH_MEMO_SIZE = 50_000
+
+
+def split_skills(skills_text):
+    """Split a comma-separated skills cell into normalized lowercase skills"""
+    if not isinstance(skills_text, str) or not skills_text.strip():
+        return []
+    return [req.strip().lower() for req in skills_text.split(',') if req.strip()]
+
+
+def normalize_skills(skills):
+    """Normalize a list of extracted skills to lowercase"""
+    return [skill.strip().lower() for skill in skills if skill.strip()]
+
+
+class FuzzyMatcher:
+    """Match resume skills against a fixed skill vocabulary in one pass
+
+    ``compat`` mode reproduces the ``calculate_match`` rule exactly: a
+    vectorized character-count bound (the same bound as
+    ``SequenceMatcher.quick_ratio``) discards vocabulary entries that cannot
+    reach the threshold, and ``SequenceMatcher.ratio`` only runs on the
+    survivors. ``tfidf`` mode replaces the edit ratio with the cosine
+    similarity of character n-gram TF-IDF vectors, which is faster but only
+    approximates the slider semantics. The last ``memo_size`` results are
+    memoized per resume skill and threshold, so repeated skills are not
+    rescored while the memo stays bounded on a long-lived index; with
+    ``similarities`` set, the ratios themselves come from that process-wide
+    cache and are shared by every matcher, session and catalog version.
+    """
+
+    MODES = ('compat', 'tfidf')
+    # Shared SimilarityCache of (resume skill, job skill) ratios, installed by
+    # warmup.similarity_cache; None computes every ratio
+    similarities = None
+
+    def __init__(self, vocabulary, mode='compat', memo_size=MATCH_MEMO_SIZE):
+        if mode not in self.MODES:
+            raise ValueError(f"Unknown matching mode: {mode}")
+        self.vocabulary = list(vocabulary)
+        self.mode = mode
+        self.skill_ids = {skill: i for i, skill in enumerate(self.vocabulary)}
+        self.lengths = np.array([len(skill) for skill in self.vocabulary], dtype=np.int32)
+        self.memo_size = memo_size
+        self._memo = OrderedDict()
+        self._memo_lock = threading.Lock()
+
+        # Character count matrix (vocabulary x alphabet) for the ratio bound
+        self.alphabet = {}
+        rows, cols = [], []
+        for i, skill in enumerate(self.vocabulary):
+            for char in skill:
+                rows.append(i)
+                cols.append(self.alphabet.setdefault(char, len(self.alphabet)))
+        self.char_counts = np.zeros((len(self.vocabulary), len(self.alphabet)), dtype=np.int32)
+        np.add.at(self.char_counts, (rows, cols), 1)
+
+        # Variation lookups: skill -> ids of vocabulary skills in the same group
+        self.variation_ids = {}
+        for variations in SKILL_VARIATIONS.values():
+            group = [self.skill_ids[v] for v in variations if v in self.skill_ids]
+            for variation in variations:
+                self.variation_ids.setdefault(variation, set()).update(group)
+
+        self.vectorizer = None
+        self.tfidf = None
+        if mode == 'tfidf' and self.vocabulary:
+            from sklearn.feature_extraction.text import TfidfVectorizer
+
+            self.vectorizer = TfidfVectorizer(analyzer='char_wb', ngram_range=(2, 3))
+            self.tfidf = self.vectorizer.fit_transform(self.vocabulary)
+
+    def _ratio_candidates(self, r_skill, threshold):
+        """Vocabulary ids whose ratio upper bound reaches the threshold"""
+        counts = np.zeros(len(self.alphabet), dtype=np.int32)
+        for char in r_skill:
+            col = self.alphabet.get(char)
+            if col is not None:
+                counts[col] += 1
+        common = np.minimum(self.char_counts, counts).sum(axis=1)
+        bound = 2.0 * common / (self.lengths + len(r_skill))
+        return np.flatnonzero(bound >= threshold)
+
+    def _similarities(self, r_skill, threshold):
+        """Vocabulary ids and similarity values of at least ``threshold``"""
+        if self.mode == 'tfidf':
+            similarity = (self.tfidf @ self.vectorizer.transform([r_skill]).T).toarray().ravel()
+            ids = np.flatnonzero(similarity >= threshold)
+            return ids.tolist(), similarity[ids].tolist()
+        candidates = self._ratio_candidates(r_skill, threshold).tolist()
+        ratios = self.pair_ratios([(r_skill, self.vocabulary[skill_id]) for skill_id in candidates])
+        ids, values = [], []
+        for skill_id, ratio in zip(candidates, ratios):
+            if ratio >= threshold:
+                ids.append(skill_id)
+                values.append(ratio)
+        return ids, values
+
+    @classmethod
+    def pair_ratios(cls, pairs):
+        """``SequenceMatcher`` ratios of ``(resume_skill, job_skill)`` pairs, via ``similarities`` if set"""
+        if cls.similarities is None:
+            return [SequenceMatcher(None, r_skill, j_skill).ratio() for r_skill, j_skill in pairs]
+        return cls.similarities.ratios(pairs)
+
+    def _similar_ids(self, r_skill, threshold):
+        return self._similarities(r_skill, threshold)[0]
+
+    def match(self, r_skill, threshold=0.8):
+        """Return the frozenset of vocabulary ids matched by one normalized skill"""
+        key = (r_skill, threshold)
+        with self._memo_lock:
+            matched = self._memo.get(key)
+            if matched is not None:
+                self._memo.move_to_end(key)
+                return matched
+        matched_ids = set(self._similar_ids(r_skill, threshold))
+        if r_skill in self.skill_ids:
+            matched_ids.add(self.skill_ids[r_skill])
+        matched_ids.update(self.variation_ids.get(r_skill, ()))
+        matched = frozenset(matched_ids)
+        with self._memo_lock:
+            self._memo[key] = matched
+            while len(self._memo) > self.memo_size:
+                self._memo.popitem(last=False)
+        return matched
+
+    def match_skills(self, resume_skills, threshold=0.8):
+        """Map each normalized resume skill to its matched vocabulary ids"""
+        return [(r_skill, self.match(r_skill, threshold)) for r_skill in normalize_skills(resume_skills)]
+
+
+    def similarity_matrix(self, resume_skills, floor=0.5):
+        """Sparse (resume skills x vocabulary) similarity matrix, values >= ``floor``
+
+        Exact and variation matches are stored as 1.0 so they survive any
+        threshold. Thresholding this matrix with ``matches_from_similarity``
+        gives the same matches as ``match_skills`` for any threshold at or
+        above ``floor``, without recomputing a single similarity.
+        """
+        skills = normalize_skills(resume_skills)
+        rows, cols, values = [], [], []
+        for row, r_skill in enumerate(skills):
+            similar = dict(zip(*self._similarities(r_skill, floor)))
+            exact_ids = set(self.variation_ids.get(r_skill, ()))
+            if r_skill in self.skill_ids:
+                exact_ids.add(self.skill_ids[r_skill])
+            similar.update(dict.fromkeys(exact_ids, 1.0))
+            rows.extend([row] * len(similar))
+            cols.extend(similar)
+            values.extend(similar.values())
+        matrix = sparse.csr_matrix(
+            (np.array(values, dtype=float), (rows, cols)),
+            shape=(len(skills), len(self.vocabulary))
+        )
+        return skills, matrix
+
+
+def matches_from_similarity(skills, matrix, threshold):
+    """Threshold a similarity matrix into ``(resume_skill, matched_skill_ids)`` pairs"""
+    resume_matches = []
+    for row, r_skill in enumerate(skills):
+        start, end = matrix.indptr[row], matrix.indptr[row + 1]
+        matched = matrix.indices[start:end][matrix.data[start:end] >= threshold]
+        resume_matches.append((r_skill, frozenset(matched.tolist())))
+    return resume_matches
+
+
+def combine_field_scores(matched_counts, n_reqs, weights):
+    """Weighted mean of per-field match percentages
+
+    ``matched_counts`` and ``n_reqs`` are ``(n_fields, n_jobs)`` arrays of
+    distinct matched requirements and requirement counts. A field a job does
+    not list is left out of that job's mean, so jobs without tools are not
+    penalized; with a single field the result is exactly
+    ``matched / n_reqs * 100``. ``matched_counts`` may carry a trailing
+    resume axis, ``(n_fields, n_jobs, n_resumes)``, with one weight column
+    per resume in ``weights``; the result is then ``(n_jobs, n_resumes)``.
+    """
+    matched_counts = np.asarray(matched_counts)
+    n_reqs = np.asarray(n_reqs)
+    weights = np.asarray(weights, dtype=float)
+    batched = matched_counts.ndim == 3
+    shape = matched_counts.shape[1:]
+    total = np.zeros(shape)
+    weighted = np.zeros(shape)
+    # One field at a time keeps every temporary at (jobs[, resumes])
+    for field in range(len(n_reqs)):
+        field_n_reqs = n_reqs[field][:, None] if batched else n_reqs[field]
+        has_reqs = field_n_reqs > 0
+        field_scores = np.divide(matched_counts[field], field_n_reqs, out=np.zeros(shape), where=has_reqs)
+        field_scores *= 100
+        field_weights = np.where(has_reqs, weights[field], 0.0)
+        total += field_weights
+        weighted += field_weights * field_scores
+    return np.divide(weighted, total, out=np.zeros(shape), where=total > 0)
+
+
+class SkillIndex:
+    """Precompiled skill vocabulary and job/skill postings for a job catalog
+
+    Job requirements are stored in CSR form (``indptr``/``indices``) keeping
+    the original order and duplicates, so match details come out exactly as
+    ``calculate_match`` reports them. ``incidence`` is the binary jobs x skills
+    matrix of every field combined and ``postings`` its transpose, the
+    inverted skill -> jobs index.
+
+    Requirements may come from several fields (``Technical Skills`` and
+    ``Tools``); ``fields`` gives the field of each posting. Scoring runs on
+    ``field_incidence``, the per-field binary matrices stacked into one CSR
+    matrix, so a single sparse product yields every field's matched count and
+    a second field adds no extra pass. Scores are the ``weights``-weighted
+    mean of the per-field percentages (see ``combine_field_scores``).
+
+    ``incidence`` and ``field_incidence`` may be passed in when they are
+    already known, as ``subset`` does; ``postings`` is built on first use.
+    """
+
+    def __init__(self, vocabulary, indptr, indices, fields=None, field_names=('Technical Skills',),
+                 weights=None, incidence=None, field_incidence=None):
+        self.vocabulary = list(vocabulary)
+        self.skill_ids = {skill: i for i, skill in enumerate(self.vocabulary)}
+        self.indptr = np.asarray(indptr, dtype=np.int64)
+        self.indices = np.asarray(indices, dtype=np.int32)
+        self.n_reqs = np.diff(self.indptr)
+        self.field_names = tuple(field_names)
+        self.fields = (
+            np.zeros(len(self.indices), dtype=np.int8) if fields is None
+            else np.asarray(fields, dtype=np.int8)
+        )
+        self.weights = self.field_weights(weights or FIELD_WEIGHTS)
+
+        n_jobs = len(self.n_reqs)
+        self.n_jobs = n_jobs
+        self.incidence = self._binary_matrix(self.indptr, n_jobs) if incidence is None else incidence
+        self._postings = None
+
+        n_fields = len(self.field_names)
+        if n_fields == 1:
+            self.field_incidence = self.incidence
+            self.field_n_reqs = self.n_reqs[None, :]
+        else:
+            job_of_posting = np.repeat(np.arange(n_jobs), self.n_reqs)
+            stacked_rows = self.fields.astype(np.int64) * n_jobs + job_of_posting
+            stacked_indptr = np.concatenate(
+                [[0], np.cumsum(np.bincount(stacked_rows, minlength=n_fields * n_jobs))]
+            )
+            self.field_n_reqs = np.diff(stacked_indptr).reshape(n_fields, n_jobs)
+            if field_incidence is None:
+                # Postings are grouped by job, so a stable sort groups them by field then job
+                order = np.argsort(stacked_rows, kind='stable')
+                field_incidence = self._binary_matrix(stacked_indptr, n_fields * n_jobs, order)
+            self.field_incidence = field_incidence
+        self._matchers = {}
+
+    def _binary_matrix(self, indptr, n_rows, order=None):
+        """Binary rows x vocabulary matrix of the postings, duplicates collapsed"""
+        indices = self.indices.copy() if order is None else self.indices[order]
+        matrix = sparse.csr_matrix(
+            (np.ones(len(indices), dtype=np.int32), indices, np.asarray(indptr).copy()),
+            shape=(n_rows, len(self.vocabulary))
+        )
+        # Collapse duplicate requirements within a row to a single posting
+        matrix.sum_duplicates()
+        matrix.data[:] = 1
+        return matrix
+
+    @classmethod
+    def from_frame(cls, jobs_df, column='Technical Skills'):
+        """Build the index from a job catalog DataFrame"""
+        return cls.from_skill_lists(split_skills(text) for text in jobs_df[column])
+
+    @classmethod
+    def from_skill_lists(cls, skill_lists):
+        """Build the index from per-job lists of normalized skills"""
+        skill_ids = {}
+        indptr = [0]
+        indices = []
+        for skills in skill_lists:
+            for skill in skills:
+                indices.append(skill_ids.setdefault(skill, len(skill_ids)))
+            indptr.append(len(indices))
+        return cls(list(skill_ids), indptr, indices)
+
+    @classmethod
+    def from_field_lists(cls, field_lists, weights=None, vocabulary=()):
+        """Build a multi-field index from ``{field: per-job lists of normalized skills}``
+
+        Each job's postings keep the field order of ``field_lists``. Skills of
+        a seed ``vocabulary`` keep their ids, new skills are appended to it.
+        """
+        field_names = list(field_lists)
+        skill_ids = {skill: i for i, skill in enumerate(vocabulary)}
+        indptr = [0]
+        indices = []
+        fields = []
+        for job_lists in zip(*field_lists.values()):
+            for field, skills in enumerate(job_lists):
+                for skill in skills:
+                    indices.append(skill_ids.setdefault(skill, len(skill_ids)))
+                    fields.append(field)
+            indptr.append(len(indices))
+        return cls(list(skill_ids), indptr, indices, fields, field_names, weights)
+
+    @classmethod
+    def from_catalog(cls, jobs_df, weights=None, vocabulary=()):
+        """Build the multi-field index over a prepared catalog's SKILL_FIELDS"""
+        return cls.from_field_lists(
+            {field: jobs_df[column] for field, column in SKILL_FIELDS.items()}, weights, vocabulary
+        )
+
+    def merged(self, delta_df):
+        """New index with ``delta_df``'s jobs appended after this index's rows
+
+        For indexes built by ``from_catalog``. Only the delta postings are
+        tokenized and every array is extended by concatenation, so the cost
+        is a copy of the postings rather than a gather; skills new to the
+        vocabulary get the next ids. Rows are never removed here: a catalog
+        snapshot tombstones them and leaves them out of its filter rows (see
+        ``subset`` for compaction).
+        """
+        delta = self.from_catalog(delta_df, vocabulary=self.vocabulary)
+        n_old, n_fields, n_skills = self.n_jobs, len(self.field_names), len(delta.vocabulary)
+
+        def widened(matrix):
+            return sparse.csr_matrix((matrix.data, matrix.indices, matrix.indptr), shape=(matrix.shape[0], n_skills))
+
+        index = copy.copy(self)
+        if n_skills > len(self.vocabulary):
+            index.vocabulary, index.skill_ids, index._matchers = delta.vocabulary, delta.skill_ids, {}
+        index.indptr = np.concatenate([self.indptr, delta.indptr[1:] + self.indptr[-1]])
+        index.indices = np.concatenate([self.indices, delta.indices])
+        index.fields = np.concatenate([self.fields, delta.fields])
+        index.n_reqs = np.concatenate([self.n_reqs, delta.n_reqs])
+        index.n_jobs = n_old + delta.n_jobs
+        index.incidence = sparse.vstack([widened(self.incidence), delta.incidence], format='csr')
+        index._postings = None
+        if n_fields == 1:
+            index.field_incidence = index.incidence
+        else:
+            # Stacked rows are field-major: each field's old rows, then its delta rows
+            blocks = []
+            for field in range(n_fields):
+                blocks.append((self.field_incidence, field * n_old, (field + 1) * n_old))
+                blocks.append((delta.field_incidence, field * delta.n_jobs, (field + 1) * delta.n_jobs))
+            indptr, indices, data, offset = [np.zeros(1, dtype=np.int64)], [], [], 0
+            for matrix, first, last in blocks:
+                start, end = matrix.indptr[first], matrix.indptr[last]
+                indptr.append(matrix.indptr[first + 1:last + 1] - start + offset)
+                indices.append(matrix.indices[start:end])
+                data.append(matrix.data[start:end])
+                offset += end - start
+            index.field_incidence = sparse.csr_matrix(
+                (np.concatenate(data), np.concatenate(indices), np.concatenate(indptr)),
+                shape=(n_fields * index.n_jobs, n_skills)
+            )
+        index.field_n_reqs = np.concatenate([self.field_n_reqs, delta.field_n_reqs], axis=1)
+        return index
+
+    def subset(self, rows):
+        """New index over ``rows`` of this one, in that order; compacts away removed rows"""
+        rows = np.asarray(rows, dtype=np.int64)
+        lengths = self.n_reqs[rows]
+        indptr = np.concatenate([[0], np.cumsum(lengths)])
+        positions = np.repeat(self.indptr[rows] - indptr[:-1], lengths) + np.arange(indptr[-1])
+        index = type(self)(
+            self.vocabulary, indptr, self.indices[positions], self.fields[positions],
+            self.field_names, dict(zip(self.field_names, self.weights)),
+            self.incidence[rows], self.field_incidence[self._field_rows(rows)]
+        )
+        index._matchers = self._matchers
+        return index
+
+    def field_weights(self, weights=None):
+        """Weight array aligned with ``field_names`` from a ``{field: weight}`` mapping
+
+        Fields missing from the mapping keep the index default.
+        """
+        if weights is None:
+            return self.weights
+        defaults = getattr(self, 'weights', None)
+        return np.array([
+            float(weights.get(name, 1.0 if defaults is None else defaults[i]))
+            for i, name in enumerate(self.field_names)
+        ])
+
+    def __len__(self):
+        return len(self.n_reqs)
+
+    @property
+    def postings(self):
+        """Inverted skill -> jobs index (skills x jobs CSR)"""
+        if self._postings is None:
+            self._postings = self.incidence.T.tocsr()
+        return self._postings
+
+    def job_skills(self, row):
+        """Return the normalized requirements of a job, in catalog order"""
+        ids = self.indices[self.indptr[row]:self.indptr[row + 1]]
+        return [self.vocabulary[i] for i in ids]
+
+    def match_vocabulary(self, resume_skills, threshold=0.8, mode='compat'):
+        """Match each resume skill against the whole vocabulary once
+
+        Returns a list of ``(resume_skill, matched_skill_ids)`` pairs that is
+        reused for every job in the catalog.
+        """
+        return self.matcher(mode).match_skills(resume_skills, threshold)
+
+    def matcher(self, mode='compat'):
+        """Return the (lazily built) fuzzy matcher for a matching mode"""
+        if mode not in self._matchers:
+            self._matchers[mode] = FuzzyMatcher(self.vocabulary, mode)
+        return self._matchers[mode]
+
+    def matched_mask(self, resume_matches):
+        """Boolean vocabulary mask of skills matched by any resume skill"""
+        mask = np.zeros(len(self.vocabulary), dtype=bool)
+        for _, matched_ids in resume_matches:
+            mask[list(matched_ids)] = True
+        return mask
+
+    def score_all(self, resume_matches, weights=None):
+        """Match scores for every job as one sparse product over all fields"""
+        mask = self.matched_mask(resume_matches).astype(np.int32)
+        matched_counts = (self.field_incidence @ mask).reshape(len(self.field_names), self.n_jobs)
+        return combine_field_scores(matched_counts, self.field_n_reqs, self.field_weights(weights))
+
+    def score_many(self, batch_matches, weights=None):
+        """Scores of every job for several resumes as one sparse product
+
+        ``batch_matches`` holds one ``resume_matches`` list per resume and
+        ``weights`` one ``{field: weight}`` mapping (or None) per resume.
+        Returns an ``(n_resumes, n_jobs)`` array whose rows equal
+        ``score_all``; the postings are read once for the whole batch.
+        """
+        weights = weights or [None] * len(batch_matches)
+        if len(batch_matches) == 1:
+            return self.score_all(batch_matches[0], weights[0])[None, :]
+        masks = np.stack([self.matched_mask(resume_matches) for resume_matches in batch_matches], axis=1)
+        matched_counts = (self.field_incidence @ masks.astype(np.int32)).reshape(
+            len(self.field_names), self.n_jobs, len(batch_matches)
+        )
+        field_weights = np.stack([self.field_weights(resume_weights) for resume_weights in weights], axis=1)
+        scores = np.empty((len(batch_matches), self.n_jobs))
+        # Combine cache-sized row blocks; whole (jobs x resumes) temporaries
+        # would make every elementwise pass go to main memory
+        for start in range(0, self.n_jobs, SCORE_BLOCK_ROWS):
+            block = slice(start, start + SCORE_BLOCK_ROWS)
+            scores[:, block] = combine_field_scores(
+                matched_counts[:, block], self.field_n_reqs[:, block], field_weights
+            ).T
+        return scores
+
+    def _field_rows(self, rows):
+        """Rows of ``field_incidence`` holding ``rows``, field by field"""
+        offsets = np.arange(len(self.field_names), dtype=np.int64)[:, None] * self.n_jobs
+        return (offsets + rows[None, :]).ravel()
+
+    def score_rows(self, rows, resume_matches, weights=None):
+        """Match scores for a subset of catalog rows"""
+        rows = np.asarray(rows, dtype=np.int64)
+        mask = self.matched_mask(resume_matches).astype(np.int32)
+        matched_counts = (self.field_incidence[self._field_rows(rows)] @ mask).reshape(-1, len(rows))
+        return combine_field_scores(matched_counts, self.field_n_reqs[:, rows], self.field_weights(weights))
+
+    def score_bounds(self, rows, resume_matches, weights=None):
+        """Upper bound on the score of each row without touching its postings
+
+        A job cannot match more distinct skills in a field than the field
+        requires, nor more than the resume matched across the whole
+        vocabulary.
+        """
+        rows = np.asarray(rows, dtype=np.int64)
+        n_matched = int(self.matched_mask(resume_matches).sum())
+        n_unique = np.diff(self.field_incidence.indptr)[self._field_rows(rows)].reshape(-1, len(rows))
+        return combine_field_scores(
+            np.minimum(n_unique, n_matched), self.field_n_reqs[:, rows], self.field_weights(weights)
+        )
+
+    def _match_postings(self, ids, resume_matches):
+        """Matched and missing requirement names among the posting ``ids``"""
+        job_reqs = [self.vocabulary[i] for i in ids]
+        matched_reqs = []
+        for _, matched_ids in resume_matches:
+            for skill_id, j_skill in zip(ids, job_reqs):
+                if skill_id in matched_ids:
+                    matched_reqs.append(j_skill)
+
+        # Remove duplicates while preserving order
+        matched_reqs = list(dict.fromkeys(matched_reqs))
+        missing_reqs = [req for req in job_reqs if req not in matched_reqs]
+        return matched_reqs, missing_reqs
+
+    def match_breakdown(self, row, resume_matches):
+        """Per-field ``{field: (score, matched, missing)}`` for the fields a job lists"""
+        start, end = self.indptr[row], self.indptr[row + 1]
+        ids = self.indices[start:end]
+        fields = self.fields[start:end]
+        breakdown = {}
+        for field, name in enumerate(self.field_names):
+            field_ids = ids[fields == field].tolist()
+            if not field_ids:
+                continue
+            matched_reqs, missing_reqs = self._match_postings(field_ids, resume_matches)
+            breakdown[name] = (len(matched_reqs) / len(field_ids) * 100, matched_reqs, missing_reqs)
+        return breakdown
+
+    def match_job(self, row, resume_matches, weights=None):
+        """Return ``(score, matched, missing)`` for one job, like calculate_match
+
+        The score is the same weighted field mean as ``score_rows``; matched
+        and missing requirements cover every field in posting order.
+        """
+        start, end = self.indptr[row], self.indptr[row + 1]
+        if start == end or not resume_matches:
+            return 0, [], []
+
+        matched_reqs, missing_reqs = self._match_postings(self.indices[start:end].tolist(), resume_matches)
+        breakdown = self.match_breakdown(row, resume_matches)
+        matched_counts = [[len(breakdown[name][1]) if name in breakdown else 0] for name in self.field_names]
+        n_reqs = self.field_n_reqs[:, [row]]
+        match_score = combine_field_scores(matched_counts, n_reqs, self.field_weights(weights))[0]
+        return match_score, matched_reqs, missing_reqs
@@ -0,0 +1,106 @@
+import io
+import os
+import re
+import time
+
+MAX_PDF_BYTES = 10 * 1024 * 1024
+MAX_PAGES = 10
+
+SKILLS_HEADING = re.compile(
+    r"^[ \t]*(?:technical[ \t]+skills|skills(?:[ \t]*(?:&|and)[ \t]*\w+)?|core[ \t]+competencies)\b[ \t]*:?",
+    re.IGNORECASE | re.MULTILINE
+)
+SECTION_HEADING = re.compile(
+    r"^[ \t]*(?:[A-Z][A-Z &/]{3,40}|(?:professional[ \t]+)?(?:experience|education|projects|certifications?"
+    r"|publications|work[ \t]+history|employment|awards|interests|languages|summary|references))[ \t]*:?[ \t]*$",
+    re.MULTILINE
+)
+
+
+def read_pdf_bytes(pdf_file, max_bytes=MAX_PDF_BYTES):
+    """Read a PDF from a path, raw bytes or a file-like object, enforcing a size limit"""
+    if isinstance(pdf_file, (str, os.PathLike)):
+        size = os.path.getsize(pdf_file)
+        if size > max_bytes:
+            raise ValueError(f"PDF is {size / 1e6:.1f} MB, the limit is {max_bytes / 1e6:.1f} MB")
+        with open(pdf_file, "rb") as f:
+            return f.read()
+    if isinstance(pdf_file, bytes):
+        data = pdf_file
+    elif hasattr(pdf_file, "getvalue"):
+        data = pdf_file.getvalue()
+    else:
+        data = pdf_file.read()
+    if len(data) > max_bytes:
+        raise ValueError(f"PDF is {len(data) / 1e6:.1f} MB, the limit is {max_bytes / 1e6:.1f} MB")
+    return data
+
+
+def _next_heading(text, start):
+    match = SECTION_HEADING.search(text, start)
+    return match.start() if match else None
+
+
+def find_skills_section(text):
+    """Return the SKILLS section text and whether it runs to the end of the text"""
+    heading = SKILLS_HEADING.search(text)
+    if heading is None:
+        return None, False
+    # The section body starts on the line after the heading
+    line_end = text.find("\n", heading.end())
+    end = _next_heading(text, line_end + 1) if line_end != -1 else None
+    if end is None:
+        return text[heading.start():].strip(), True
+    return text[heading.start():end].strip(), False
+
+
+def ingest_pdf(pdf_file, max_pages=MAX_PAGES, max_bytes=MAX_PDF_BYTES, stop_at_skills=True):
+    """Extract PDF text page by page, stopping early once the SKILLS section is found
+
+    The document is opened once and its pages parsed in order. After each
+    page the text is scanned for a skills heading; once it is found (and the
+    section does not continue onto the next page) no further pages are
+    parsed. pdfplumber holds the GIL while parsing, so threads would not
+    overlap pages, and a resume page takes milliseconds, less than starting a
+    worker process; the size and page limits bound the work instead.
+
+    Returns a dict with the joined ``text`` of the parsed pages, the
+    ``skills_section`` text (or None), ``page_count``, ``pages_parsed`` and
+    per-page ``page_timings`` in seconds.
+    """
+    import pdfplumber
+
+    data = read_pdf_bytes(pdf_file, max_bytes)
+    texts = []
+    page_timings = []
+    skills_section = None
+    section_open = False
+    with pdfplumber.open(io.BytesIO(data)) as pdf:
+        page_count = len(pdf.pages)
+        for page in pdf.pages[:max_pages]:
+            start = time.perf_counter()
+            text = page.extract_text() or ""
+            # Drop the page's parsed objects; later pages do not need them
+            page.close()
+            texts.append(text)
+            page_timings.append(time.perf_counter() - start)
+
+            if not stop_at_skills:
+                continue
+            if section_open:
+                # Continuation of a section that ran to the end of the previous page
+                end = _next_heading(text, 0)
+                skills_section += "\n" + text[:end].strip()
+                section_open = False
+            elif skills_section is None:
+                skills_section, section_open = find_skills_section(text)
+            if skills_section is not None and not section_open:
+                break
+
+    return {
+        "text": "\n".join(texts),
+        "skills_section": skills_section,
+        "page_count": page_count,
+        "pages_parsed": len(texts),
+        "page_timings": page_timings,
+    }
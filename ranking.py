@@ -0,0 +1,63 @@
+import numpy as np
+
+
+def top_n(scores, n):
+    """Positions of the ``n`` highest scores, best first
+
+    Uses ``argpartition`` instead of a full sort. Ties are broken by position,
+    so the result is identical to a stable descending sort truncated to ``n``.
+    """
+    scores = np.asarray(scores)
+    if n <= 0 or len(scores) == 0:
+        return np.empty(0, dtype=np.int64)
+    if n >= len(scores):
+        return np.argsort(-scores, kind='stable')
+
+    # n-th largest score; everything above it is in, ties fill the rest by position
+    kth = np.partition(scores, len(scores) - n)[len(scores) - n]
+    above = np.flatnonzero(scores > kth)
+    ties = np.flatnonzero(scores == kth)[:n - len(above)]
+    selected = np.concatenate([above, ties])
+    return selected[np.lexsort((selected, -scores[selected]))]
+
+
+def rank_jobs(skill_index, rows, resume_matches, n_results, min_score=0, prune=False, scores=None,
+              weights=None):
+    """Score the given catalog rows and pick the best ``n_results`` of them
+
+    Returns a dict with the ranked ``rows`` and their ``scores``, the
+    ``all_scores`` array aligned with the input rows and the number of rows
+    reaching ``min_score``. With ``prune`` set, rows whose score upper bound
+    is below ``min_score`` are never scored; their entries in ``all_scores``
+    are NaN, so leave it off when the full score distribution is needed.
+    Passing precomputed catalog-wide ``scores`` skips scoring altogether.
+    ``weights`` overrides the index's per-field weights.
+    """
+    rows = np.asarray(rows, dtype=np.int64)
+    all_scores = np.full(len(rows), np.nan)
+    if scores is not None:
+        all_scores = np.asarray(scores, dtype=float)[rows]
+        candidates = np.empty(0, dtype=np.int64)
+    elif prune and min_score > 0:
+        candidates = np.flatnonzero(skill_index.score_bounds(rows, resume_matches, weights) >= min_score)
+    else:
+        candidates = np.arange(len(rows))
+    if len(candidates):
+        all_scores[candidates] = skill_index.score_rows(rows[candidates], resume_matches, weights)
+
+    qualifying = np.flatnonzero(all_scores >= min_score)
+    best = qualifying[top_n(all_scores[qualifying], n_results)]
+    return {
+        'rows': rows[best],
+        'scores': all_scores[best],
+        'all_scores': all_scores,
+        'n_qualifying': len(qualifying),
+    }
+
+
+def match_counts(scores, min_score, split=50):
+    """Counts of qualifying scores at/above and below ``split``"""
+    scores = np.asarray(scores)
+    qualifying = scores[scores >= min_score]
+    strong = int((qualifying >= split).sum())
+    return strong, len(qualifying) - strong
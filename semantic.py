@@ -0,0 +1,159 @@
+import hashlib
+import os
+
+import numpy as np
+from scipy import sparse
+from sklearn.feature_extraction.text import HashingVectorizer
+
+from matching import SKILL_VARIATIONS, normalize_skills
+
+try:
+    import faiss
+except ImportError:  # pragma: no cover - faiss is optional
+    faiss = None
+
+SEMANTIC_INDEX_PATH = os.path.join(".cache", "semantic_index.npz")
+# Optional local sentence-embedding model (a directory or an already downloaded model name)
+SEMANTIC_MODEL = os.getenv("SEMANTIC_MODEL")
+
+
+class SkillEmbedder:
+    """Offline skill embeddings
+
+    Uses a local sentence-transformers model when SEMANTIC_MODEL is set and the
+    package is installed; otherwise falls back to hashed character n-gram and
+    word vectors, which need no model files at all. Vectors are L2-normalized,
+    so inner products are cosine similarities.
+    """
+
+    def __init__(self, model_name=SEMANTIC_MODEL, n_features=2 ** 11):
+        self.model = None
+        if model_name:
+            try:
+                from sentence_transformers import SentenceTransformer
+                self.model = SentenceTransformer(model_name)
+            except ImportError:
+                self.model = None
+        self.name = model_name if self.model is not None else f"hashed-ngrams-{n_features}"
+        self.char_vectorizer = HashingVectorizer(
+            analyzer="char_wb", ngram_range=(2, 4), n_features=n_features, alternate_sign=False, norm=None
+        )
+        self.word_vectorizer = HashingVectorizer(
+            analyzer="word", n_features=n_features, alternate_sign=False, norm=None
+        )
+
+    def embed(self, texts):
+        texts = list(texts)
+        if not texts:
+            return np.zeros((0, self.dimension), dtype=np.float32)
+        if self.model is not None:
+            vectors = np.asarray(self.model.encode(texts), dtype=np.float32)
+        else:
+            # Up-weight whole words so shared words outrank shared fragments
+            chars = self.char_vectorizer.transform(texts)
+            words = self.word_vectorizer.transform(texts)
+            vectors = np.asarray((chars + 4 * words).todense(), dtype=np.float32)
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.where(norms == 0, 1, norms)
+
+    @property
+    def dimension(self):
+        if self.model is not None:
+            return self.model.get_sentence_embedding_dimension()
+        return self.char_vectorizer.n_features
+
+
+class SemanticIndex:
+    """Embedding index over the catalog's skill vocabulary
+
+    Skill vectors (one per vocabulary entry) are stored in an ``.npz`` file
+    and reused while the vocabulary and embedder are unchanged, whatever
+    postings come and go. Nearest-neighbour
+    queries go through a FAISS HNSW index when faiss is installed and a NumPy
+    brute-force inner product otherwise. ``similarity_matrix`` has the same
+    contract as ``FuzzyMatcher.similarity_matrix``, so semantic matches come
+    back in the usual score/matched/missing format through the SkillIndex.
+    """
+
+    def __init__(self, skill_index, path=SEMANTIC_INDEX_PATH, embedder=None, k=20):
+        self.skill_index = skill_index
+        self.vocabulary = skill_index.vocabulary
+        self.embedder = embedder or SkillEmbedder()
+        self.k = k
+        self.path = path
+        self.skill_vectors = self._load_or_build()
+        self.skill_ann = self._build_ann(self.skill_vectors)
+
+        self.variation_ids = {}
+        for variations in SKILL_VARIATIONS.values():
+            group = [skill_index.skill_ids[v] for v in variations if v in skill_index.skill_ids]
+            for variation in variations:
+                self.variation_ids.setdefault(variation, set()).update(group)
+
+    def _digest(self):
+        digest = hashlib.sha256(self.embedder.name.encode())
+        digest.update("\n".join(self.vocabulary).encode())
+        return digest.hexdigest()
+
+    def _load_or_build(self):
+        digest = self._digest()
+        if self.path and os.path.exists(self.path):
+            with np.load(self.path) as stored:
+                if str(stored["digest"]) == digest:
+                    return np.array(stored["skill_vectors"])
+
+        skill_vectors = self.embedder.embed(self.vocabulary)
+
+        if self.path:
+            if os.path.dirname(self.path):
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+            tmp_path = f"{self.path}.tmp.npz"
+            np.savez(tmp_path, digest=digest, skill_vectors=skill_vectors)
+            os.replace(tmp_path, self.path)
+        return skill_vectors
+
+    @staticmethod
+    def _build_ann(vectors):
+        if faiss is None or len(vectors) == 0:
+            return None
+        ann = faiss.IndexHNSWFlat(vectors.shape[1], 32, faiss.METRIC_INNER_PRODUCT)
+        ann.add(np.ascontiguousarray(vectors, dtype=np.float32))
+        return ann
+
+    @staticmethod
+    def _search(ann, vectors, queries, k):
+        """Top-k (similarities, ids) per query row, best first"""
+        k = min(k, len(vectors))
+        if k == 0:
+            return np.zeros((len(queries), 0)), np.zeros((len(queries), 0), dtype=np.int64)
+        if ann is not None:
+            return ann.search(np.ascontiguousarray(queries, dtype=np.float32), k)
+        similarity = queries @ vectors.T
+        ids = np.argpartition(-similarity, k - 1, axis=1)[:, :k]
+        top = np.take_along_axis(similarity, ids, axis=1)
+        order = np.argsort(-top, axis=1)
+        return np.take_along_axis(top, order, axis=1), np.take_along_axis(ids, order, axis=1)
+
+    def similarity_matrix(self, resume_skills, floor=0.5):
+        """Sparse (resume skills x vocabulary) cosine similarities of the k nearest skills"""
+        skills = normalize_skills(resume_skills)
+        similarities, ids = self._search(self.skill_ann, self.skill_vectors, self.embedder.embed(skills), self.k)
+        rows, cols, values = [], [], []
+        for row, r_skill in enumerate(skills):
+            similar = {
+                int(skill_id): float(value)
+                for skill_id, value in zip(ids[row], similarities[row])
+                if skill_id >= 0 and value >= floor
+            }
+            exact_ids = set(self.variation_ids.get(r_skill, ()))
+            if r_skill in self.skill_index.skill_ids:
+                exact_ids.add(self.skill_index.skill_ids[r_skill])
+            similar.update(dict.fromkeys(exact_ids, 1.0))
+            rows.extend([row] * len(similar))
+            cols.extend(similar)
+            values.extend(similar.values())
+        matrix = sparse.csr_matrix(
+            (np.array(values, dtype=float), (rows, cols)),
+            shape=(len(skills), len(self.vocabulary))
+        )
+        return skills, matrix
@@ -0,0 +1,355 @@
+"""Stateless HTTP matching service over the shared in-memory job catalog
+
+Usage:
+    python service.py [--host 127.0.0.1] [--port 8000] [--batch-window 0.005] [--max-batch 64]
+
+``POST /match`` takes a JSON body with the resume as ``skills`` (a list),
+``text`` or ``pdf`` (base64), or a multipart form with a ``resume`` PDF file
+and the other options as a JSON ``options`` field:
+
+    {"skills": ["Python", "SQL"], "top_n": 10, "threshold": 0.8,
+     "filters": {"locations": ["Remote"], "max_exp": 5}}
+
+Optional fields are ``extraction`` (llm, local, local+llm; default
+SERVICE_EXTRACTION or local), ``mode`` (compat, tfidf), ``threshold``
+(0 to 1), ``weights`` ({field: weight}), ``min_score`` (a percentage),
+``top_n`` (1 to 500) and ``filters`` (``locations``, ``levels``, ``sizes``,
+``industries``, ``max_exp``); anything else is answered with a 400. The
+response lists the top jobs with their score and matched/missing
+requirements. ``GET /health`` reports the catalog version, batching and
+similarity cache counters, ``GET /metrics`` the traced spans in Prometheus text format.
+LLM extraction shares one client, capped by SERVICE_LLM_CONCURRENCY calls in
+flight and SERVICE_LLM_RPS starts per second.
+
+Scoring requests arriving within ``--batch-window`` seconds of each other
+are scored together in one sparse product (``SkillIndex.score_many``).
+"""
+import argparse
+import asyncio
+import base64
+import binascii
+import json
+import math
+import os
+import time
+from contextlib import asynccontextmanager
+
+from starlette.applications import Starlette
+from starlette.concurrency import run_in_threadpool
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Route
+
+from extraction import EXTRACTION_MODES, extract_skills_async, read_resume_text
+from filters import FILTER_COLUMNS
+from matching import FIELD_WEIGHTS, FuzzyMatcher, normalize_skills
+from ranking import rank_jobs
+from tracing import span, traced, tracer
+
+DEFAULT_EXTRACTION = os.getenv("SERVICE_EXTRACTION", "local")
+# Seconds a scoring request waits for others to share its batch, and the batch size cap
+BATCH_WINDOW = float(os.getenv("SERVICE_BATCH_WINDOW", 0.005))
+MAX_BATCH = int(os.getenv("SERVICE_MAX_BATCH", 64))
+MAX_TOP_N = 500
+# Upstream LLM calls in flight and started per second, shared by all requests
+LLM_CONCURRENCY = int(os.getenv("SERVICE_LLM_CONCURRENCY", 16))
+LLM_RATE = float(os.getenv("SERVICE_LLM_RPS", 20))
+# JobStore metadata returned with every result
+RESULT_FIELDS = ("title", "company", "location", "role_level", "experience", "industry", "size")
+
+
+class BadRequest(Exception):
+    """Raised for a request the service cannot answer; becomes a 400 response"""
+
+
+def parse_options(payload):
+    """Validated matching options from a request payload"""
+    if not isinstance(payload, dict):
+        raise BadRequest("Request body must be a JSON object")
+    options = {
+        "extraction": payload.get("extraction", DEFAULT_EXTRACTION),
+        "mode": payload.get("mode", "compat"),
+        "threshold": payload.get("threshold", 0.8),
+        "min_score": payload.get("min_score", 0),
+        "top_n": payload.get("top_n", 10),
+        "weights": payload.get("weights") or None,
+        "filters": payload.get("filters") or {},
+    }
+    if options["extraction"] not in EXTRACTION_MODES:
+        raise BadRequest(f"extraction must be one of {', '.join(EXTRACTION_MODES)}")
+    if options["mode"] not in FuzzyMatcher.MODES:
+        raise BadRequest(f"mode must be one of {', '.join(FuzzyMatcher.MODES)}")
+    try:
+        options["threshold"] = float(options["threshold"])
+        options["min_score"] = float(options["min_score"])
+        options["top_n"] = int(options["top_n"])
+        if options["weights"] is not None:
+            options["weights"] = {
+                field: float(weight) for field, weight in options["weights"].items() if field in FIELD_WEIGHTS
+            }
+    except (TypeError, ValueError, OverflowError, AttributeError):
+        raise BadRequest("threshold, min_score, top_n and weights must be numbers")
+    # float() also takes "nan" and "inf", and NaN fails every comparison below
+    if not 0 <= options["threshold"] <= 1:
+        raise BadRequest("threshold must be between 0 and 1")
+    if not 0 <= options["min_score"] <= 100:
+        raise BadRequest("min_score must be a percentage between 0 and 100")
+    if options["top_n"] < 1:
+        raise BadRequest("top_n must be at least 1")
+    options["top_n"] = min(options["top_n"], MAX_TOP_N)
+    if options["weights"] is not None and not all(
+        math.isfinite(weight) and weight >= 0 for weight in options["weights"].values()
+    ):
+        raise BadRequest("weights must be finite and not negative")
+
+    filters = options["filters"]
+    if not isinstance(filters, dict) or set(filters) - {*FILTER_COLUMNS, "max_exp"}:
+        raise BadRequest(f"filters may only contain {', '.join([*FILTER_COLUMNS, 'max_exp'])}")
+    options["filters"] = {}
+    for name in FILTER_COLUMNS:
+        values = filters.get(name) or []
+        # A bare string would otherwise be taken apart into single characters
+        if not isinstance(values, list):
+            raise BadRequest(f"filters.{name} must be a list")
+        options["filters"][name] = tuple(str(value) for value in values)
+    if filters.get("max_exp") is not None:
+        try:
+            options["filters"]["max_exp"] = float(filters["max_exp"])
+        except (TypeError, ValueError):
+            raise BadRequest("filters.max_exp must be a number")
+        if math.isnan(options["filters"]["max_exp"]):
+            raise BadRequest("filters.max_exp must be a number")
+    return options
+
+
+class MicroBatcher:
+    """Collect concurrent scoring requests and score each batch in one pass
+
+    The first request of a batch waits up to ``window`` seconds (or until
+    ``max_batch`` requests are queued) for others to join; a batch holds at
+    most ``max_batch`` requests and the overflow becomes the next batch.
+    Requests are grouped by the catalog snapshot they matched against, since
+    skill ids are only meaningful within one version, and every group is
+    scored with ``SkillIndex.score_many`` in a worker thread so the event
+    loop keeps accepting requests.
+    """
+
+    def __init__(self, window=BATCH_WINDOW, max_batch=MAX_BATCH):
+        self.window = window
+        self.max_batch = max_batch
+        self.stats = {"requests": 0, "batches": 0, "largest_batch": 0}
+        self._pending = []
+        self._full = None
+        self._flusher = None
+
+    async def score(self, snapshot, resume_matches, weights=None):
+        """Scores of every job in ``snapshot`` for one resume"""
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((snapshot, resume_matches, weights, future))
+        if self._flusher is None:
+            self._schedule()
+        if len(self._pending) >= self.max_batch:
+            self._full.set()
+        return await future
+
+    def _schedule(self):
+        self._full = asyncio.Event()
+        self._flusher = asyncio.create_task(self._flush_after_window())
+
+    async def _flush_after_window(self):
+        try:
+            await asyncio.wait_for(self._full.wait(), self.window)
+        except asyncio.TimeoutError:
+            pass
+        batch, self._pending = self._pending[:self.max_batch], self._pending[self.max_batch:]
+        self._flusher = None
+        if self._pending:
+            # Requests past the cap have already waited a window; they form the next batch now
+            self._schedule()
+            self._full.set()
+
+        groups = {}
+        for item in batch:
+            groups.setdefault(id(item[0]), []).append(item)
+        for items in groups.values():
+            try:
+                scores = await run_in_threadpool(self._score_group, items)
+            except Exception as e:
+                for *_, future in items:
+                    future.set_exception(e)
+                continue
+            for (*_, future), job_scores in zip(items, scores):
+                future.set_result(job_scores)
+        self.stats["requests"] += len(batch)
+        self.stats["batches"] += len(groups)
+        self.stats["largest_batch"] = max(self.stats["largest_batch"], len(batch))
+
+    @staticmethod
+    def _score_group(items):
+        snapshot = items[0][0]
+        with span("score_batch", size=len(items)):
+            return snapshot.skill_index.score_many(
+                [resume_matches for _, resume_matches, _, _ in items],
+                [weights for _, _, weights, _ in items]
+            )
+
+
+def _json_value(value):
+    """Catalog value as JSON (missing values become null)"""
+    return value if isinstance(value, str) else None
+
+
+def match_results(snapshot, ranking, resume_matches, weights):
+    """JSON-ready records of the ranked jobs"""
+    results = []
+    for row, score in zip(ranking["rows"].tolist(), ranking["scores"].tolist()):
+        _, matched, missing = snapshot.skill_index.match_job(row, resume_matches, weights)
+        metadata = snapshot.job_store.metadata(row)
+        results.append({
+            "job_id": snapshot.job_id(row),
+            **{field: _json_value(metadata[field]) for field in RESULT_FIELDS},
+            "score": round(score, 2),
+            "matched": matched,
+            "missing": missing,
+        })
+    return results
+
+
+async def read_request(request):
+    """Resume input (skills list, text or PDF bytes) and options of a /match request"""
+    if request.headers.get("content-type", "").startswith("multipart/form-data"):
+        form = await request.form()
+        try:
+            payload = json.loads(form.get("options") or "{}")
+        except ValueError:
+            raise BadRequest("options must be a JSON object")
+        upload = form.get("resume")
+        if upload is None or isinstance(upload, str):
+            raise BadRequest("multipart requests need a 'resume' file")
+        return {"pdf": await upload.read()}, parse_options(payload)
+
+    try:
+        payload = await request.json()
+    except ValueError:
+        raise BadRequest("Request body must be JSON")
+    options = parse_options(payload)
+    if payload.get("skills") is not None:
+        if not isinstance(payload["skills"], list):
+            raise BadRequest("skills must be a list of strings")
+        return {"skills": [str(skill) for skill in payload["skills"]]}, options
+    if payload.get("text") is not None:
+        return {"text": str(payload["text"])}, options
+    if payload.get("pdf") is not None:
+        try:
+            return {"pdf": base64.b64decode(payload["pdf"], validate=True)}, options
+        except (binascii.Error, TypeError):
+            raise BadRequest("pdf must be base64-encoded")
+    raise BadRequest("Send the resume as 'skills', 'text' or 'pdf'")
+
+
+def create_app(catalog_state=None, batch_window=BATCH_WINDOW, max_batch=MAX_BATCH):
+    """Build the ASGI app over ``catalog_state`` (default: the shared warmup catalog)"""
+    state = {"catalog": catalog_state, "batcher": MicroBatcher(batch_window, max_batch), "client": None}
+
+    @asynccontextmanager
+    async def lifespan(app):
+        from llm_client import AsyncLLMClient
+
+        if state["catalog"] is None:
+            import warmup
+
+            state["catalog"] = await run_in_threadpool(warmup.catalog_state)
+            await run_in_threadpool(warmup.similarity_cache)
+        async with AsyncLLMClient(os.getenv("OPENAI_API_KEY"), max_concurrency=LLM_CONCURRENCY,
+                                  requests_per_second=LLM_RATE) as client:
+            state["client"] = client
+            yield
+
+    @traced("service_match")
+    async def match(request):
+        start = time.perf_counter()
+        try:
+            resume, options = await read_request(request)
+        except BadRequest as e:
+            return JSONResponse({"error": str(e)}, status_code=400)
+
+        # One snapshot per request, even if a reload lands meanwhile
+        snapshot = state["catalog"].current
+        try:
+            skills = resume.get("skills")
+            if skills is None:
+                text = resume.get("text")
+                if text is None:
+                    text = await run_in_threadpool(read_resume_text, resume["pdf"])
+                with span("service_extract", mode=options["extraction"]):
+                    skills = await extract_skills_async(
+                        text, state["client"], options["extraction"], snapshot.skill_extractor
+                    )
+        except Exception as e:
+            return JSONResponse({"error": f"Could not read the resume: {e}"}, status_code=422)
+        if not normalize_skills(skills):
+            return JSONResponse({"error": "No skills found in the resume"}, status_code=422)
+
+        resume_matches = await run_in_threadpool(
+            snapshot.skill_index.match_vocabulary, skills, options["threshold"], options["mode"]
+        )
+        job_scores = await state["batcher"].score(snapshot, resume_matches, options["weights"])
+        with span("service_rank"):
+            rows = snapshot.job_filter.rows(**options["filters"])
+            ranking = rank_jobs(
+                snapshot.skill_index, rows, resume_matches, options["top_n"], options["min_score"],
+                scores=job_scores
+            )
+            results = match_results(snapshot, ranking, resume_matches, options["weights"])
+        seconds = time.perf_counter() - start
+        return JSONResponse({
+            "catalog_version": snapshot.version,
+            "skills": skills,
+            "n_qualifying": ranking["n_qualifying"],
+            "results": results,
+            "seconds": round(seconds, 4),
+        })
+
+    async def health(request):
+        catalog = state["catalog"]
+        return JSONResponse({
+            "status": "ok" if catalog is not None else "starting",
+            "catalog_version": catalog.current.version if catalog is not None else None,
+            "jobs": len(catalog.current) if catalog is not None else 0,
+            "last_reload_error": catalog.last_error if catalog is not None else None,
+            "batching": state["batcher"].stats,
+            "similarity_cache": (
+                FuzzyMatcher.similarities.stats() if FuzzyMatcher.similarities is not None else None
+            ),
+        })
+
+    async def metrics(request):
+        return PlainTextResponse(tracer.to_prometheus())
+
+    return Starlette(
+        routes=[
+            Route("/match", match, methods=["POST"]),
+            Route("/health", health),
+            Route("/metrics", metrics),
+        ],
+        lifespan=lifespan,
+    )
+
+
+def main():
+    import uvicorn
+    from dotenv import load_dotenv
+
+    load_dotenv()
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--batch-window", type=float, default=BATCH_WINDOW,
+                        help="seconds a request waits for others to share its scoring pass (0: no batching wait)")
+    parser.add_argument("--max-batch", type=int, default=MAX_BATCH)
+    args = parser.parse_args()
+    uvicorn.run(create_app(batch_window=args.batch_window, max_batch=args.max_batch),
+                host=args.host, port=args.port, log_level="warning")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,119 @@
+import os
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from matching import combine_field_scores
+from ranking import top_n
+
+# Scoring backend switch: "serial" scores in-process, "sharded" uses ShardedScorer
+MATCH_BACKEND = os.getenv("MATCH_BACKEND", "serial")
+MATCH_WORKERS = int(os.getenv("MATCH_WORKERS", os.cpu_count() or 1))
+
+# Per-process view of the memory-mapped shard arrays, set by _init_worker
+_shards = {}
+
+
+def _init_worker(shard_dir):
+    for name in ("indptr", "indices", "n_reqs"):
+        _shards[name] = np.load(os.path.join(shard_dir, f"{name}.npy"), mmap_mode="r")
+
+
+def _matched_counts(start, end, matched_mask):
+    """Distinct matched skills of postings rows [start, end)"""
+    indptr = np.asarray(_shards["indptr"][start:end + 1])
+    indices = _shards["indices"][indptr[0]:indptr[-1]]
+    hits = np.concatenate([[0], np.cumsum(matched_mask[indices], dtype=np.int64)])
+    return hits[indptr[1:] - indptr[0]] - hits[indptr[:-1] - indptr[0]]
+
+
+def _shard_scores(start, end, matched_mask, weights):
+    """Scores of catalog rows [start, end) from the memory-mapped per-field postings"""
+    n_reqs = _shards["n_reqs"]
+    n_fields, n_jobs = n_reqs.shape
+    matched_counts = np.stack([
+        _matched_counts(field * n_jobs + start, field * n_jobs + end, matched_mask)
+        for field in range(n_fields)
+    ])
+    return combine_field_scores(matched_counts, np.asarray(n_reqs[:, start:end]), weights)
+
+
+def _score_task(args):
+    start, end, matched_mask, weights = args
+    return _shard_scores(start, end, matched_mask, weights)
+
+
+def _rank_task(args):
+    start, end, matched_mask, weights, allowed, n_results, min_score = args
+    scores = _shard_scores(start, end, matched_mask, weights)
+    rows = np.arange(start, end)
+    if allowed is not None:
+        rows, scores = rows[allowed], scores[allowed]
+    qualifying = np.flatnonzero(scores >= min_score)
+    best = qualifying[top_n(scores[qualifying], n_results)]
+    return rows[best], scores[best], len(qualifying)
+
+
+class ShardedScorer:
+    """Multi-process scoring over a job catalog split into row shards
+
+    The binary per-field job/skill postings of a SkillIndex are written once
+    to ``.npy`` files and memory-mapped by every worker of a persistent process pool, so
+    the catalog lives in the shared page cache rather than being copied into
+    each process. Each shard is scored independently and the per-shard
+    results are merged; scores and rankings are identical to the serial path.
+    """
+
+    def __init__(self, skill_index, workers=MATCH_WORKERS, shards=None, shard_dir=None):
+        self.skill_index = skill_index
+        self.workers = workers
+        self.n_jobs = len(skill_index)
+        self._owns_dir = shard_dir is None
+        self.shard_dir = shard_dir or tempfile.mkdtemp(prefix="job_shards_")
+
+        incidence = skill_index.field_incidence
+        np.save(os.path.join(self.shard_dir, "indptr.npy"), incidence.indptr.astype(np.int64))
+        np.save(os.path.join(self.shard_dir, "indices.npy"), incidence.indices.astype(np.int32))
+        np.save(os.path.join(self.shard_dir, "n_reqs.npy"), skill_index.field_n_reqs.astype(np.int64))
+
+        n_shards = shards or workers
+        bounds = np.linspace(0, self.n_jobs, n_shards + 1).astype(int)
+        self.shards = [(start, end) for start, end in zip(bounds[:-1], bounds[1:]) if end > start]
+        self.pool = ProcessPoolExecutor(workers, initializer=_init_worker, initargs=(self.shard_dir,))
+
+    def score_all(self, resume_matches, weights=None):
+        """Scores for every job, same as SkillIndex.score_all"""
+        mask = self.skill_index.matched_mask(resume_matches)
+        weights = self.skill_index.field_weights(weights)
+        parts = self.pool.map(_score_task, [(start, end, mask, weights) for start, end in self.shards])
+        return np.concatenate(list(parts)) if self.shards else np.zeros(0)
+
+    def rank(self, resume_matches, n_results, min_score=0, allowed=None, weights=None):
+        """Top ``n_results`` rows over the (optionally masked) catalog, merged from shard top-Ns
+
+        Returns ``(rows, scores, n_qualifying)``. Shards cover contiguous row
+        ranges in order, so merging their candidates keeps the serial
+        tie-break by catalog row.
+        """
+        mask = self.skill_index.matched_mask(resume_matches)
+        weights = self.skill_index.field_weights(weights)
+        tasks = [
+            (start, end, mask, weights, None if allowed is None else np.asarray(allowed[start:end]),
+             n_results, min_score)
+            for start, end in self.shards
+        ]
+        results = list(self.pool.map(_rank_task, tasks))
+        if not results:
+            return np.empty(0, dtype=np.int64), np.empty(0), 0
+        rows = np.concatenate([r[0] for r in results])
+        scores = np.concatenate([r[1] for r in results])
+        best = top_n(scores, n_results)
+        return rows[best], scores[best], sum(r[2] for r in results)
+
+    def close(self):
+        """Stop the worker pool and remove the shard files"""
+        self.pool.shutdown()
+        if self._owns_dir:
+            shutil.rmtree(self.shard_dir, ignore_errors=True)
@@ -0,0 +1,161 @@
+import atexit
+import os
+import sys
+import threading
+from collections import OrderedDict
+from difflib import SequenceMatcher
+
+import numpy as np
+
+DEFAULT_SIMILARITY_PATH = os.path.join(".cache", "similarity_cache.npz")
+
+# Rough cost of one OrderedDict entry (hash slot, key/value refs, link node)
+_ENTRY_OVERHEAD = 100
+_FLOAT_BYTES = sys.getsizeof(0.5)
+
+
+def _entry_bytes(pair):
+    return sys.getsizeof(pair) + _FLOAT_BYTES + _ENTRY_OVERHEAD
+
+
+class SimilarityCache:
+    """Bounded, thread-safe LRU of ``SequenceMatcher`` ratios keyed by a skill pair
+
+    Keys are ``(resume_skill, job_skill)`` pairs of normalized skills, in
+    the order ``calculate_match`` passes them to ``SequenceMatcher`` (the
+    ratio is not symmetric). Ratios do not depend on the catalog, so one
+    cache serves every session, matcher and catalog version of the process.
+    With a ``path`` the entries are loaded on start and written back on
+    ``save`` and at exit, most recently used last. ``bytes`` estimates the
+    entries without the skill strings, which the vocabularies hold anyway.
+    """
+
+    def __init__(self, max_entries=200_000, path=None):
+        self.max_entries = max_entries
+        self.path = path
+        self.hits = 0
+        self.misses = 0
+        self.bytes = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._dirty = False
+        if path:
+            self.load()
+            atexit.register(self.save)
+
+    @classmethod
+    def from_env(cls):
+        """Build a cache configured through SIMILARITY_CACHE_* environment variables
+
+        ``SIMILARITY_CACHE_PATH`` set to an empty string keeps the cache in memory only.
+        """
+        return cls(
+            max_entries=int(os.getenv("SIMILARITY_CACHE_MAX_ENTRIES", 200_000)),
+            path=os.getenv("SIMILARITY_CACHE_PATH", DEFAULT_SIMILARITY_PATH) or None,
+        )
+
+    def __len__(self):
+        return len(self._entries)
+
+    def ratio(self, r_skill, j_skill):
+        """``SequenceMatcher(None, r_skill, j_skill).ratio()``, computed once per pair"""
+        return self.ratios([(r_skill, j_skill)])[0]
+
+    def ratios(self, pairs):
+        """Ratios of a list of ``(resume_skill, job_skill)`` pairs, computing only the misses"""
+        values = [None] * len(pairs)
+        missing = []
+        with self._lock:
+            entries = self._entries
+            for i, pair in enumerate(pairs):
+                value = entries.get(pair)
+                if value is None:
+                    missing.append(i)
+                else:
+                    entries.move_to_end(pair)
+                    values[i] = value
+            self.hits += len(pairs) - len(missing)
+            self.misses += len(missing)
+        if not missing:
+            return values
+
+        for i in missing:
+            values[i] = SequenceMatcher(None, *pairs[i]).ratio()
+        with self._lock:
+            for i in missing:
+                self._store(pairs[i], values[i])
+            self._evict()
+            self._dirty = True
+        return values
+
+    def _store(self, pair, value):
+        if pair not in self._entries:
+            self.bytes += _entry_bytes(pair)
+        self._entries[pair] = value
+
+    def _evict(self):
+        while len(self._entries) > self.max_entries:
+            pair, _ = self._entries.popitem(last=False)
+            self.bytes -= _entry_bytes(pair)
+
+    def load(self):
+        """Add the entries saved at ``path``, if any; returns how many were read"""
+        if not self.path or not os.path.exists(self.path):
+            return 0
+        try:
+            with np.load(self.path) as saved:
+                skills = saved["skills"].tolist()
+                pair_ids, ratios = saved["pairs"], saved["ratios"]
+        except (OSError, ValueError, KeyError):
+            # A damaged file only costs the warm start
+            return 0
+        with self._lock:
+            for (r_id, j_id), value in zip(pair_ids.tolist(), ratios.tolist()):
+                self._store((skills[r_id], skills[j_id]), value)
+            self._evict()
+        return len(ratios)
+
+    def save(self):
+        """Write the entries to ``path`` (atomically) if anything changed since the last save
+
+        Skills are stored once in a string table and pairs as indexes into it.
+        """
+        if not self.path or not self._dirty:
+            return
+        with self._lock:
+            items = list(self._entries.items())
+            self._dirty = False
+        skill_ids = {}
+        pair_ids = np.array(
+            [(skill_ids.setdefault(r_skill, len(skill_ids)), skill_ids.setdefault(j_skill, len(skill_ids)))
+             for (r_skill, j_skill), _ in items],
+            dtype=np.int32
+        ).reshape(-1, 2)
+        if os.path.dirname(self.path):
+            os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        tmp_path = f"{self.path}.tmp.npz"
+        np.savez(
+            tmp_path,
+            skills=np.array(list(skill_ids), dtype=str),
+            pairs=pair_ids,
+            ratios=np.array([value for _, value in items], dtype=float),
+        )
+        os.replace(tmp_path, self.path)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.bytes = 0
+            self._dirty = True
+
+    def stats(self):
+        """Hit/miss counters, size and estimated memory of the cache"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_ratio": self.hits / lookups if lookups else 0.0,
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "bytes": self.bytes,
+        }
@@ -0,0 +1,86 @@
+"""Rerunning the batch matcher after failed extractions
+
+Run with ``python -m pytest tests``. A resume that failed must be retried by
+the next run without leaving a second record for it in the output.
+"""
+import argparse
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import batch_match  # noqa: E402
+from catalog import CATALOG_PATH, SOURCE_PATH  # noqa: E402
+
+REPO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def write_pdf(path, text):
+    """A one-page PDF showing ``text``, written by hand to avoid a PDF writer dependency"""
+    stream = f"BT /F1 12 Tf 72 720 Td ({text}) Tj ET".encode()
+    objects = [
+        b"<< /Type /Catalog /Pages 2 0 R >>",
+        b"<< /Type /Pages /Kids [3 0 R] /Count 1 >>",
+        b"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+        b"/Resources << /Font << /F1 4 0 R >> >> /Contents 5 0 R >>",
+        b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>",
+        b"<< /Length %d >>\nstream\n%s\nendstream" % (len(stream), stream),
+    ]
+    out = bytearray(b"%PDF-1.4\n")
+    offsets = []
+    for number, body in enumerate(objects, 1):
+        offsets.append(len(out))
+        out += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+    xref = len(out)
+    out += b"xref\n0 %d\n0000000000 65535 f \n" % (len(objects) + 1)
+    out += b"".join(b"%010d 00000 n \n" % offset for offset in offsets)
+    out += b"trailer\n<< /Size %d /Root 1 0 R >>\nstartxref\n%d\n%%%%EOF\n" % (len(objects) + 1, xref)
+    with open(path, "wb") as f:
+        f.write(out)
+
+
+def test_rerun_keeps_one_record_per_resume(tmp_path, monkeypatch):
+    resumes = tmp_path / "resumes"
+    resumes.mkdir()
+    for name in ("alice", "bob", "carol"):
+        write_pdf(resumes / f"{name}.pdf", f"SKILLS Python SQL {name}")
+
+    failing = {"bob"}
+
+    def extract_resume(text, api_key):
+        if any(name in text for name in failing):
+            return [], "LLMError: HTTP 503 from completion endpoint"
+        return ["Python", "SQL"], None
+
+    monkeypatch.setattr(batch_match, "extract_resume", extract_resume)
+    output = tmp_path / "results.jsonl"
+    args = argparse.Namespace(
+        input=str(resumes), output=str(output), checkpoint=None, errors=None,
+        source=os.path.join(REPO, SOURCE_PATH), catalog=os.path.join(REPO, CATALOG_PATH),
+        workers=1, llm_concurrency=1, chunk_size=2,
+        threshold=0.8, mode="compat", top_n=5, min_score=0,
+    )
+
+    def read(path):
+        with open(path) as f:
+            return [json.loads(line) for line in f]
+
+    def names(records):
+        return sorted(os.path.basename(record["resume"]) for record in records)
+
+    batch_match.run(args)
+    assert names(read(output)) == ["alice.pdf", "carol.pdf"]
+    assert names(read(f"{output}.errors.jsonl")) == ["bob.pdf"]
+
+    # Still failing: its error record is replaced, not duplicated
+    batch_match.run(args)
+    assert names(read(output)) == ["alice.pdf", "carol.pdf"]
+    assert names(read(f"{output}.errors.jsonl")) == ["bob.pdf"]
+
+    failing.clear()
+    batch_match.run(args)
+    records = read(output)
+    assert names(records) == ["alice.pdf", "bob.pdf", "carol.pdf"]
+    assert all(record["error"] is None for record in records)
+    assert read(f"{output}.errors.jsonl") == []
@@ -0,0 +1,69 @@
+"""AsyncLLMClient error handling against a local aiohttp server
+
+Run with ``python -m pytest tests``. Every failure must surface as
+``LLMError``; only rate-limit and server errors are retried.
+"""
+import asyncio
+import os
+import sys
+
+import pytest
+from aiohttp import web
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from llm_client import AsyncLLMClient, LLMError  # noqa: E402
+
+COMPLETION = {"choices": [{"message": {"content": "SKILLS: Python"}}], "usage": {"prompt_tokens": 3}}
+
+
+def run_against(responses, requests_seen):
+    """Complete one prompt against a server answering with ``responses`` in turn"""
+
+    async def handler(request):
+        requests_seen.append(request.path)
+        status, body = responses[min(len(requests_seen), len(responses)) - 1]
+        if isinstance(body, dict):
+            return web.json_response(body, status=status)
+        return web.Response(text=body, status=status)
+
+    async def main():
+        app = web.Application()
+        app.router.add_post("/v1/chat/completions", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = site._server.sockets[0].getsockname()[1]
+        try:
+            async with AsyncLLMClient("key", base_url=f"http://127.0.0.1:{port}/v1", backoff=0) as client:
+                return await client.complete("prompt")
+        finally:
+            await runner.cleanup()
+
+    return asyncio.run(main())
+
+
+def test_success():
+    assert run_against([(200, COMPLETION)], []) == "SKILLS: Python"
+
+
+def test_client_error_raises_without_retry():
+    seen = []
+    with pytest.raises(LLMError, match="HTTP 401.*invalid api key"):
+        run_against([(401, {"error": {"message": "invalid api key"}})], seen)
+    assert len(seen) == 1
+
+
+@pytest.mark.parametrize("body", ["not json", {"choices": []}])
+def test_malformed_body_raises(body):
+    seen = []
+    with pytest.raises(LLMError, match="Malformed completion response"):
+        run_against([(200, body)], seen)
+    assert len(seen) == 1
+
+
+def test_rate_limit_is_retried():
+    seen = []
+    assert run_against([(429, {}), (503, {}), (200, COMPLETION)], seen) == "SKILLS: Python"
+    assert len(seen) == 3
@@ -0,0 +1,31 @@
+"""FuzzyMatcher memo bounds
+
+Run with ``python -m pytest tests``.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from matching import FuzzyMatcher  # noqa: E402
+
+VOCABULARY = ["python", "sql", "tableau", "excel", "machine learning"]
+
+
+def test_memo_keeps_only_the_most_recent_results():
+    matcher = FuzzyMatcher(VOCABULARY, memo_size=3)
+    for threshold in (0.6, 0.7, 0.8, 0.9):
+        matcher.match("pythn", threshold)
+    assert list(matcher._memo) == [("pythn", 0.7), ("pythn", 0.8), ("pythn", 0.9)]
+
+    # A hit moves the entry to the end, so the least recently used goes next
+    matcher.match("pythn", 0.7)
+    matcher.match("sq", 0.5)
+    assert list(matcher._memo) == [("pythn", 0.9), ("pythn", 0.7), ("sq", 0.5)]
+
+
+def test_evicted_results_are_recomputed_unchanged():
+    matcher = FuzzyMatcher(VOCABULARY, memo_size=1)
+    first = matcher.match("pythn", 0.8)
+    matcher.match("excell", 0.8)
+    assert matcher.match("pythn", 0.8) == first == frozenset({0})
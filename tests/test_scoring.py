@@ -0,0 +1,98 @@
+"""Regression test pinning the weighted Technical Skills + Tools scores of sample jobs
+
+Run with ``python -m pytest tests``. The index scores (``score_all``,
+``score_many`` and ``match_job``) must equal the weighted mean of the
+per-field ``calculate_match`` percentages, a field a job leaves empty
+being skipped.
+"""
+import os
+import sys
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from catalog import prepare_catalog  # noqa: E402
+from jam import calculate_match  # noqa: E402
+from matching import FIELD_WEIGHTS, SkillIndex  # noqa: E402
+
+# (Technical Skills, Tools) per sample job
+JOBS = [
+    ("Python, SQL, Tableau", "Excel, Git"),
+    ("Relational Database, Machine Learning, Statistics", "Power BI"),
+    ("Scikit-learn, Pandas, Spark", None),
+    (None, "Tableau, Excel, Jira"),
+    ("Java, Scala, Hadoop, Kafka", "Docker"),
+    ("python, Python, R, Data Visualization", "Excel"),
+]
+# Exact, variation ("Database", "ML", "Tableau") and fuzzy ("PowerBI", "Statistic") matches
+RESUME = ["Python", "Database", "Tableau", "Excel", "PowerBI", "Scikit learn", "ML", "Statistic"]
+THRESHOLD = 0.8
+TOOLS_HEAVY = {"Technical Skills": 1.0, "Tools": 2.0}
+
+PINNED = {
+    "default": [250 / 3, 100.0, 100 / 3, 200 / 3, 0.0, 200 / 3],
+    "tools_heavy": [200 / 3, 100.0, 100 / 3, 200 / 3, 0.0, 250 / 3],
+}
+
+
+@pytest.fixture(scope="module")
+def index():
+    jobs_df = pd.DataFrame({
+        "Job Title": [f"Job {i}" for i in range(len(JOBS))],
+        "Company Name": "Acme",
+        "Technical Skills": [skills for skills, _ in JOBS],
+        "Tools": [tools for _, tools in JOBS],
+        "Experience Required": "2 years",
+        "Role Level": "Mid",
+        "Location": "Remote",
+        "Size": "Small",
+        "Industry": "Tech",
+    })
+    return SkillIndex.from_catalog(prepare_catalog(jobs_df))
+
+
+def reference_scores(weights):
+    """Weighted mean of calculate_match per field, skipping fields a job does not list"""
+    scores = []
+    for fields in JOBS:
+        weighted = total = 0.0
+        for name, requirements in zip(("Technical Skills", "Tools"), fields):
+            if requirements:
+                score = calculate_match({"Technical Skills": requirements}, RESUME, THRESHOLD)[0]
+                weighted += weights[name] * score
+                total += weights[name]
+        scores.append(weighted / total if total else 0.0)
+    return scores
+
+
+@pytest.mark.parametrize("name, weights", [("default", FIELD_WEIGHTS), ("tools_heavy", TOOLS_HEAVY)])
+def test_scores_are_pinned(index, name, weights):
+    resume_matches = index.match_vocabulary(RESUME, THRESHOLD)
+    expected = PINNED[name]
+    assert reference_scores(weights) == pytest.approx(expected)
+    assert index.score_all(resume_matches, weights).tolist() == pytest.approx(expected)
+    assert [index.match_job(row, resume_matches, weights)[0] for row in range(len(JOBS))] == pytest.approx(expected)
+
+
+def test_score_many_matches_score_all(index):
+    batch = [index.match_vocabulary(RESUME, THRESHOLD), index.match_vocabulary(["Java", "Docker"], THRESHOLD)]
+    scores = index.score_many(batch, [None, TOOLS_HEAVY])
+    assert scores[0].tolist() == pytest.approx(PINNED["default"])
+    assert scores[0].tolist() == index.score_all(batch[0]).tolist()
+    assert scores[1].tolist() == index.score_all(batch[1], TOOLS_HEAVY).tolist()
+
+
+def test_breakdown_and_requirements(index):
+    resume_matches = index.match_vocabulary(RESUME, THRESHOLD)
+    score, matched, missing = index.match_job(0, resume_matches)
+    assert matched == ["python", "sql", "tableau", "excel"]
+    assert missing == ["git"]
+    breakdown = index.match_breakdown(0, resume_matches)
+    assert breakdown["Technical Skills"][0] == pytest.approx(100.0)
+    assert breakdown["Tools"][0] == pytest.approx(50.0)
+    # Jobs without tools are scored on their technical skills alone
+    assert list(index.match_breakdown(2, resume_matches)) == ["Technical Skills"]
+    # Duplicate requirements count in the denominator, as in calculate_match
+    assert index.match_breakdown(5, resume_matches)["Technical Skills"][0] == pytest.approx(50.0)
@@ -0,0 +1,54 @@
+"""Request validation of the /match service
+
+Run with ``python -m pytest tests``. Out-of-range options must be rejected
+with a 400 rather than ranked with odd results.
+"""
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from service import MAX_TOP_N, BadRequest, parse_options  # noqa: E402
+
+
+@pytest.mark.parametrize("field, value", [
+    ("threshold", "nan"),
+    ("threshold", "inf"),
+    ("threshold", -0.1),
+    ("threshold", 1.5),
+    ("min_score", "nan"),
+    ("min_score", "-inf"),
+    ("min_score", -1),
+    ("min_score", 101),
+    ("top_n", 0),
+    ("top_n", -5),
+    ("top_n", "inf"),
+    ("top_n", "ten"),
+    ("weights", {"Tools": "nan"}),
+    ("weights", {"Tools": -1}),
+    ("filters", {"locations": "Remote"}),
+    ("filters", {"max_exp": "nan"}),
+])
+def test_invalid_options_are_rejected(field, value):
+    with pytest.raises(BadRequest):
+        parse_options({field: value})
+
+
+def test_valid_options_are_kept():
+    options = parse_options({
+        "threshold": "0.75", "min_score": 50, "top_n": 10 * MAX_TOP_N,
+        "weights": {"Tools": 2, "Unknown": 1}, "filters": {"locations": ["Remote"], "max_exp": 3},
+    })
+    assert options["threshold"] == 0.75
+    assert options["min_score"] == 50.0
+    assert options["top_n"] == MAX_TOP_N
+    assert options["weights"] == {"Tools": 2.0}
+    assert options["filters"]["locations"] == ("Remote",)
+    assert options["filters"]["max_exp"] == 3.0
+
+
+def test_defaults_pass():
+    options = parse_options({})
+    assert (options["threshold"], options["min_score"], options["top_n"]) == (0.8, 0.0, 10)
@@ -0,0 +1,254 @@
+import cProfile
+import functools
+import inspect
+import io
+import json
+import os
+import pstats
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+try:
+    from pyinstrument import Profiler
+except ImportError:  # pragma: no cover - pyinstrument is optional
+    Profiler = None
+
+# Set TRACING=0 to turn span recording into a no-op
+TRACING_ENABLED = os.getenv("TRACING", "1").lower() not in ("0", "false", "no")
+
+
+class Tracer:
+    """Lightweight in-process tracing of named spans, cache lookups and token usage
+
+    Spans aggregate into per-name call counts and wall-time totals; the most
+    recent ``max_events`` individual spans are also kept, tagged with the run
+    they belonged to, so a single Streamlit rerun can be inspected. Cache
+    lookups and misses are counted per cache name (hits are the difference),
+    and LLM token usage is summed per model. All state is shared by the
+    process and guarded by a lock; the current run id is per thread, since
+    every Streamlit session reruns its script in its own thread.
+    """
+
+    def __init__(self, enabled=TRACING_ENABLED, max_events=1000):
+        self.enabled = enabled
+        self.spans = {}
+        self.caches = {}
+        self.tokens = {}
+        self.events = deque(maxlen=max_events)
+        self._runs = 0
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    def start_run(self):
+        """Begin a new run (one script rerun) in the calling thread and return its id"""
+        with self._lock:
+            self._runs += 1
+            self._local.run = self._runs
+        return self._local.run
+
+    @property
+    def current_run(self):
+        return getattr(self._local, "run", None)
+
+    @contextmanager
+    def span(self, name, **attributes):
+        """Time the enclosed block as one call of span ``name``"""
+        if not self.enabled:
+            yield
+            return
+        error = False
+        start = time.perf_counter()
+        try:
+            yield
+        except BaseException:
+            error = True
+            raise
+        finally:
+            self._record(name, time.perf_counter() - start, error, attributes)
+
+    def record(self, name, seconds, **attributes):
+        """Record an already timed call of span ``name`` that took ``seconds``"""
+        if self.enabled:
+            self._record(name, seconds, False, attributes)
+
+    def _record(self, name, seconds, error, attributes):
+        with self._lock:
+            stats = self.spans.setdefault(name, {"count": 0, "errors": 0, "total": 0.0, "max": 0.0})
+            stats["count"] += 1
+            stats["errors"] += error
+            stats["total"] += seconds
+            stats["max"] = max(stats["max"], seconds)
+            self.events.append({
+                "run": self.current_run,
+                "name": name,
+                "seconds": seconds,
+                "error": error,
+                "timestamp": time.time(),
+                **attributes,
+            })
+
+    def traced(self, name=None):
+        """Decorator recording every call of a function (sync or async) as a span"""
+        def decorator(func):
+            span_name = name or func.__name__
+            if inspect.iscoroutinefunction(func):
+                @functools.wraps(func)
+                async def async_wrapper(*args, **kwargs):
+                    with self.span(span_name):
+                        return await func(*args, **kwargs)
+                return async_wrapper
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                with self.span(span_name):
+                    return func(*args, **kwargs)
+            return wrapper
+        return decorator
+
+    def cache_lookup(self, cache, hit=None):
+        """Count a lookup in ``cache``; ``hit=False`` also counts it as a miss"""
+        if not self.enabled:
+            return
+        with self._lock:
+            stats = self.caches.setdefault(cache, {"lookups": 0, "misses": 0})
+            stats["lookups"] += 1
+            stats["misses"] += hit is False
+
+    def cache_miss(self, cache):
+        """Count a miss for a lookup already counted with ``cache_lookup(cache)``"""
+        if not self.enabled:
+            return
+        with self._lock:
+            self.caches.setdefault(cache, {"lookups": 0, "misses": 0})["misses"] += 1
+
+    def traced_cache(self, name, cache_decorator):
+        """Wrap a memoizing decorator (e.g. ``st.cache_data``) with span and hit/miss tracing
+
+        Every call is a lookup and a span named ``name``; the body only runs,
+        and is only counted as a miss, when the cache does not have the result.
+        """
+        def decorator(func):
+            @functools.wraps(func)
+            def compute(*args, **kwargs):
+                self.cache_miss(name)
+                return func(*args, **kwargs)
+
+            cached = cache_decorator(compute)
+
+            @functools.wraps(func)
+            def wrapper(*args, **kwargs):
+                self.cache_lookup(name)
+                with self.span(name):
+                    return cached(*args, **kwargs)
+            wrapper.clear = getattr(cached, "clear", None)
+            return wrapper
+        return decorator
+
+    def add_tokens(self, model, prompt_tokens=0, completion_tokens=0, requests=1):
+        """Add the token usage of ``requests`` LLM requests to ``model``"""
+        if not self.enabled:
+            return
+        with self._lock:
+            usage = self.tokens.setdefault(model, {"prompt_tokens": 0, "completion_tokens": 0, "requests": 0})
+            usage["prompt_tokens"] += int(prompt_tokens or 0)
+            usage["completion_tokens"] += int(completion_tokens or 0)
+            usage["requests"] += requests
+
+    def run_events(self, run=None):
+        """Spans recorded during ``run`` (the calling thread's current run by default)"""
+        run = self.current_run if run is None else run
+        with self._lock:
+            return [event for event in self.events if event["run"] == run]
+
+    def snapshot(self):
+        """Copy of the aggregated spans, cache counters and token usage"""
+        with self._lock:
+            caches = {
+                name: {**stats, "hits": stats["lookups"] - stats["misses"]}
+                for name, stats in self.caches.items()
+            }
+            return {
+                "spans": {name: dict(stats) for name, stats in self.spans.items()},
+                "caches": caches,
+                "tokens": {model: dict(usage) for model, usage in self.tokens.items()},
+            }
+
+    def reset(self):
+        with self._lock:
+            self.spans.clear()
+            self.caches.clear()
+            self.tokens.clear()
+            self.events.clear()
+
+    def to_jsonl(self):
+        """Recent individual spans as JSON lines"""
+        with self._lock:
+            return "".join(json.dumps(event) + "\n" for event in self.events)
+
+    def to_prometheus(self, prefix="jam"):
+        """Aggregated metrics in the Prometheus text exposition format"""
+        snapshot = self.snapshot()
+        lines = []
+
+        def metric(name, kind, help_text, samples):
+            lines.append(f"# HELP {prefix}_{name} {help_text}")
+            lines.append(f"# TYPE {prefix}_{name} {kind}")
+            for labels, value in samples:
+                label_text = ",".join(f'{key}="{_escape(label)}"' for key, label in labels.items())
+                lines.append(f"{prefix}_{name}{{{label_text}}} {value}")
+
+        spans = snapshot["spans"].items()
+        metric("span_seconds_total", "counter", "Total wall time spent in the span.",
+               [({"span": name}, stats["total"]) for name, stats in spans])
+        metric("span_calls_total", "counter", "Number of times the span ran.",
+               [({"span": name}, stats["count"]) for name, stats in spans])
+        metric("span_errors_total", "counter", "Number of span runs that raised.",
+               [({"span": name}, stats["errors"]) for name, stats in spans])
+        metric("span_max_seconds", "gauge", "Longest single run of the span.",
+               [({"span": name}, stats["max"]) for name, stats in spans])
+        caches = snapshot["caches"].items()
+        metric("cache_hits_total", "counter", "Cache lookups served from the cache.",
+               [({"cache": name}, stats["hits"]) for name, stats in caches])
+        metric("cache_misses_total", "counter", "Cache lookups that had to compute.",
+               [({"cache": name}, stats["misses"]) for name, stats in caches])
+        tokens = snapshot["tokens"].items()
+        metric("llm_tokens_total", "counter", "LLM tokens used.",
+               [({"model": model, "kind": kind}, usage[f"{kind}_tokens"])
+                for model, usage in tokens for kind in ("prompt", "completion")])
+        metric("llm_requests_total", "counter", "LLM requests made.",
+               [({"model": model}, usage["requests"]) for model, usage in tokens])
+        return "\n".join(lines) + "\n"
+
+
+def _escape(value):
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def profile_call(func, *args, **kwargs):
+    """Run ``func`` under a profiler; returns (result, text report)
+
+    Uses pyinstrument when it is installed and cProfile otherwise.
+    """
+    if Profiler is not None:
+        profiler = Profiler()
+        profiler.start()
+        try:
+            result = func(*args, **kwargs)
+        finally:
+            profiler.stop()
+        return result, profiler.output_text(unicode=True)
+
+    profiler = cProfile.Profile()
+    result = profiler.runcall(func, *args, **kwargs)
+    output = io.StringIO()
+    pstats.Stats(profiler, stream=output).sort_stats("cumulative").print_stats(40)
+    return result, output.getvalue()
+
+
+# Process-wide tracer used by the app
+tracer = Tracer()
+span = tracer.span
+traced = tracer.traced
+traced_cache = tracer.traced_cache
@@ -0,0 +1,131 @@
+"""Preload the job catalog and indexes, then start the Streamlit app
+
+Usage:
+    python warmup.py [--skip-semantic] [streamlit run options...]
+
+The app's loaders (load_job_data, load_skill_index, ...) fetch their
+resources through the memoized functions below, so when the server is
+started through this script the catalog snapshot (skill index, job records,
+filter encodings, market analytics, offline extractor), the shared skill
+similarity cache, candidate pool and (optionally) the semantic index are
+already built before the first session connects. ``streamlit run jam.py``
+still works and simply builds them on the first request. Either way the
+catalog watcher then applies delta files and workbook changes in the
+background (see hot_reload.py).
+"""
+import argparse
+import os
+import sys
+import threading
+import time
+from functools import lru_cache
+
+from analytics import load_analytics
+from candidates import DEFAULT_POOL_PATH, CandidatePool
+from catalog import CATALOG_PATH, SOURCE_PATH, catalog_version, load_catalog
+from hot_reload import DELTA_PATH, WATCH_INTERVAL, CatalogState
+from matching import SIMILARITY_FLOOR, FuzzyMatcher
+from similarity_cache import SimilarityCache
+
+APP_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "jam.py")
+# Most frequent catalog skills whose similarities are computed before the first session
+WARM_SKILLS = int(os.getenv("SIMILARITY_CACHE_WARM_SKILLS", 200))
+
+# lru_cache may run a function twice when two sessions race on a cold
+# resource; the lock makes every resource build exactly once
+_lock = threading.RLock()
+
+
+def _once(func):
+    cached = lru_cache(maxsize=None)(func)
+
+    def wrapper():
+        with _lock:
+            return cached()
+    wrapper.__name__ = func.__name__
+    wrapper.__doc__ = func.__doc__
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+def load_base_catalog():
+    """The prepared workbook catalog and its market aggregates, reused from disk while unchanged"""
+    jobs_df = load_catalog(SOURCE_PATH, CATALOG_PATH)
+    return jobs_df, load_analytics(jobs_df, catalog_version(CATALOG_PATH))
+
+
+@_once
+def catalog_state():
+    """Live catalog: the base catalog with the delta file applied, watched for changes"""
+    state = CatalogState(load_base_catalog, DELTA_PATH, watch_paths=(SOURCE_PATH,))
+    state.watch(WATCH_INTERVAL)
+    return state
+
+
+@_once
+def candidate_pool():
+    """Stored resumes for recruiter mode (CANDIDATE_POOL_PATH, default .cache/candidates.sqlite)"""
+    return CandidatePool(os.getenv("CANDIDATE_POOL_PATH", DEFAULT_POOL_PATH))
+
+
+@_once
+def similarity_cache():
+    """Skill pair similarities shared by every matcher, warm-started from the top catalog skills"""
+    cache = SimilarityCache.from_env()
+    FuzzyMatcher.similarities = cache
+    if WARM_SKILLS:
+        snapshot = catalog_state().current
+        top_skills = [skill for skill, _ in snapshot.analytics.top_skills(WARM_SKILLS)]
+        # Resume skills overlap with the catalog's most required ones, so the
+        # pairs every user needs are already scored down to the slider minimum
+        snapshot.skill_index.matcher().similarity_matrix(top_skills, SIMILARITY_FLOOR)
+        cache.save()
+    return cache
+
+
+def preload(semantic=True):
+    """Build every resource the app needs; returns {resource: seconds}"""
+    start = time.perf_counter()
+    snapshot = catalog_state().current
+    timings = {"catalog_state": time.perf_counter() - start}
+    for stats in catalog_state().history:
+        timings.update(stats.get("timings", {}))
+        if stats["kind"] == "delta":
+            timings["catalog_deltas"] = timings.get("catalog_deltas", 0) + stats["seconds"]
+    steps = {
+        "similarity_cache": similarity_cache,
+        "scorer": snapshot.scorer,
+        "candidate_pool": candidate_pool,
+    }
+    if semantic:
+        steps["semantic_index"] = snapshot.semantic_index
+    for name, step in steps.items():
+        start = time.perf_counter()
+        step()
+        timings[name] = time.perf_counter() - start
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--skip-semantic", action="store_true", help="do not preload the semantic index")
+    args, streamlit_args = parser.parse_known_args()
+
+    if not os.path.exists(SOURCE_PATH) and not os.path.exists(CATALOG_PATH):
+        print(f"No job catalog found at {SOURCE_PATH}; starting without warm-up")
+    else:
+        for name, seconds in preload(semantic=not args.skip_semantic).items():
+            print(f"warm-up {name:<16} {seconds * 1000:8.1f} ms")
+
+    # Run the server in this process so it shares the preloaded resources
+    from streamlit.web import cli
+
+    sys.argv = ["streamlit", "run", APP_PATH, *streamlit_args]
+    sys.exit(cli.main())
+
+
+if __name__ == "__main__":
+    # jam.py does ``import warmup``; without the alias that would load a second,
+    # empty copy of this module and rebuild every resource for the first session
+    sys.modules["warmup"] = sys.modules["__main__"]
+    main()